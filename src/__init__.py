@@ -7,6 +7,16 @@ Enterprise-grade agentic workflow orchestration with Intel OpenVINO optimization
 __version__ = "1.0.0"
 __author__ = "Nexus Ray Team"
 
+# Patch Enum member/value access before any enum-heavy module loads.
+# TopicType/MessageType/ActivityType sit on hot routing and activity
+# paths, and EnumMeta attribute access is an order of magnitude slower
+# than plain attributes. Optional — plain Enum is used when unavailable.
+try:
+    import fastenum
+    fastenum.enable()
+except ImportError:
+    pass
+
 from src.core.dag import WorkflowDAG
 from src.core.orchestrator import WorkflowOrchestrator
 from src.core.task import TaskDefinition, TaskStatus, TaskResult
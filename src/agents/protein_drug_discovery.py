@@ -13,6 +13,14 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from src.core.metrics_store import metrics_store
 
+# Run the sync wrapper on uvloop when available: same code, libuv-backed
+# loop. Under the API server uvicorn already picks uvloop itself.
+try:
+    import uvloop
+    _async_run = uvloop.run
+except ImportError:
+    _async_run = asyncio.run
+
 # Chemical Informatics Libraries
 try:
     from rdkit import Chem
@@ -561,4 +569,4 @@ async def run_protein_drug_discovery_async(protein_sequence: str, drug_smiles: s
 
 # Legacy Sync Wrapper
 def run_protein_drug_discovery(protein_sequence: str, drug_smiles: str) -> Dict[str, Any]:
-    return asyncio.run(run_protein_drug_discovery_async(protein_sequence, drug_smiles))
+    return _async_run(run_protein_drug_discovery_async(protein_sequence, drug_smiles))
@@ -416,6 +416,14 @@ class RecipeOptimizer:
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+# Run the sync wrapper on uvloop when available: same code, libuv-backed
+# loop. Under the API server uvicorn already picks uvloop itself.
+try:
+    import uvloop
+    _async_run = uvloop.run
+except ImportError:
+    _async_run = asyncio.run
+
 # Create a thread pool for CPU-bound tasks
 executor = ThreadPoolExecutor(max_workers=4)
 
@@ -570,4 +578,4 @@ async def run_semiconductor_yield_optimization_async(wafer_id: str, workflow_id:
 
 # Legacy Sync Wrapper
 def run_semiconductor_yield_optimization(wafer_id: str) -> Dict[str, Any]:
-    return asyncio.run(run_semiconductor_yield_optimization_async(wafer_id))
+    return _async_run(run_semiconductor_yield_optimization_async(wafer_id))
@@ -18,6 +18,8 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting Nexus Ray API...")
     yield
     # Shutdown
+    from src.observability.notion_sync import close_notion_sync
+    await close_notion_sync()
     print("👋 Shutting down Nexus Ray API...")
 
 
@@ -62,15 +64,27 @@ async def root():
     }
 
 
+from typing import Optional
 from fastapi import WebSocket, WebSocketDisconnect
+import orjson
 from src.api.websockets import manager
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, workflow_id: Optional[str] = None):
     await manager.connect(websocket)
+    if workflow_id:
+        manager.subscribe(websocket, workflow_id)
     try:
         while True:
-            await websocket.receive_text()
+            text = await websocket.receive_text()
+            # Clients can narrow their subscription after connecting:
+            # {"type": "subscribe", "workflow_id": "..."}
+            try:
+                frame = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(frame, dict) and frame.get("type") == "subscribe":
+                manager.subscribe(websocket, frame.get("workflow_id"))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
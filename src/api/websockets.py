@@ -1,26 +1,44 @@
 from fastapi import WebSocket
-from typing import List
+from typing import Dict, Optional
+import orjson
 from loguru import logger
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Connection -> subscribed workflow_id (None = receive everything)
+        self.active_connections: Dict[WebSocket, Optional[str]] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = None
         logger.info(f"WebSocket client connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            del self.active_connections[websocket]
             logger.info(f"WebSocket client disconnected. Total: {len(self.active_connections)}")
 
+    def subscribe(self, websocket: WebSocket, workflow_id: Optional[str]):
+        """Limit a connection to events for one workflow (None resets)"""
+        if websocket in self.active_connections:
+            self.active_connections[websocket] = workflow_id
+            logger.info(f"WebSocket client subscribed to workflow: {workflow_id}")
+
     async def broadcast(self, message: dict):
         """Broadcast JSON message to all connected clients"""
-        for connection in self.active_connections:
+        # Serialize once with orjson and fan the same text frame out to
+        # every client, instead of send_json re-encoding per connection
+        payload = orjson.dumps(message).decode()
+        workflow_id = message.get("workflow_id")
+        # Snapshot: sends await mid-loop, and a connect/disconnect while
+        # suspended would otherwise mutate the dict under the iterator
+        for connection, subscribed in list(self.active_connections.items()):
+            # Push-down filter: subscribed clients never receive (or
+            # decode) events for other workflows
+            if subscribed is not None and subscribed != workflow_id:
+                continue
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.error(f"Failed to send to client: {e}")
                 # We might want to disconnect here, but keep it simple for now
@@ -46,6 +46,10 @@ class VectorMemorySettings(BaseModel):
     index_type: str = Field(default="IndexFlatL2")
     persist_directory: str = Field(default="./data/vector_memory")
     collection_name: str = Field(default="nexus_ray_memory")
+    # Skip reranking when top-1 cosine score is this high and leads top-2
+    # by at least the gap — the cross-encoder won't change the ordering
+    rerank_skip_top1: float = Field(default=0.95)
+    rerank_skip_gap: float = Field(default=0.10)
 
 
 class ObservabilitySettings(BaseModel):
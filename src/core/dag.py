@@ -5,6 +5,8 @@ Handles workflow construction, validation, and topological execution ordering.
 """
 
 from typing import List, Dict, Set, Optional
+import sys
+
 import networkx as nx
 from loguru import logger
 
@@ -37,6 +39,15 @@ class WorkflowDAG:
         self.workflow_id = workflow_id
         self.graph = nx.DiGraph()
         self._tasks: Dict[str, TaskDefinition] = {}
+        # Topological index per task, maintained incrementally
+        # (Pearce-Kelly) so add_dependency detects cycles without a
+        # full-graph DFS per edge
+        self._ord: Dict[str, int] = {}
+        # Compact successor/in-degree tables maintained per edge:
+        # ordering never has to touch TaskDefinition objects or walk
+        # the NetworkX structure
+        self._succ: Dict[str, List[str]] = {}
+        self._indegree: Dict[str, int] = {}
         logger.info(f"Initialized DAG for workflow {workflow_id}")
     
     def add_task(self, task: TaskDefinition) -> None:
@@ -51,11 +62,18 @@ class WorkflowDAG:
         """
         if task.task_id in self._tasks:
             raise ValueError(f"Task {task.task_id} already exists in DAG")
-        
-        self._tasks[task.task_id] = task
-        self.graph.add_node(task.task_id, task=task)
-        
-        logger.debug(f"Added task {task.task_id} ({task.name}) to DAG")
+
+        # Interned IDs make subsequent dict lookups identity-fast and
+        # share one string object across all adjacency structures
+        task_id = sys.intern(task.task_id)
+        self._tasks[task_id] = task
+        self.graph.add_node(task_id, task=task)
+        # New nodes go last in the maintained topological order
+        self._ord[task_id] = len(self._ord)
+        self._succ[task_id] = []
+        self._indegree[task_id] = 0
+
+        logger.debug(f"Added task {task_id} ({task.name}) to DAG")
     
     def add_dependency(self, from_task_id: str, to_task_id: str) -> None:
         """
@@ -73,19 +91,62 @@ class WorkflowDAG:
             raise TaskNotFoundError(f"Task {from_task_id} not found")
         if to_task_id not in self._tasks:
             raise TaskNotFoundError(f"Task {to_task_id} not found")
-        
-        # Add edge
-        self.graph.add_edge(from_task_id, to_task_id)
-        
-        # Check for cycles
-        if not nx.is_directed_acyclic_graph(self.graph):
-            # Remove the problematic edge
-            self.graph.remove_edge(from_task_id, to_task_id)
+        # Self-loops never violate the maintained order (lower == upper),
+        # so they must be rejected before the window check
+        if from_task_id == to_task_id:
             raise CyclicDependencyError(
                 f"Adding dependency {from_task_id} -> {to_task_id} creates a cycle"
             )
-        
+
+        # Add edge, then restore the maintained topological order
+        # incrementally (Pearce-Kelly): only the window between the two
+        # endpoints' indices is scanned, instead of a full-graph DFS
+        self.graph.add_edge(from_task_id, to_task_id)
+
+        lower = self._ord[to_task_id]
+        upper = self._ord[from_task_id]
+
+        if lower < upper:
+            # Order violated: find the affected nodes in [lower, upper]
+            forward = self._bounded_dfs(
+                to_task_id, self.graph.successors,
+                lambda idx: idx <= upper
+            )
+            if from_task_id in forward:
+                self.graph.remove_edge(from_task_id, to_task_id)
+                raise CyclicDependencyError(
+                    f"Adding dependency {from_task_id} -> {to_task_id} creates a cycle"
+                )
+            backward = self._bounded_dfs(
+                from_task_id, self.graph.predecessors,
+                lambda idx: idx >= lower
+            )
+            # Reassign the affected indices: predecessors-of-u first,
+            # successors-of-v after, each keeping their relative order
+            backward.sort(key=self._ord.__getitem__)
+            forward.sort(key=self._ord.__getitem__)
+            affected = backward + forward
+            for task_id, index in zip(
+                affected, sorted(self._ord[t] for t in affected)
+            ):
+                self._ord[task_id] = index
+
+        self._succ[from_task_id].append(to_task_id)
+        self._indegree[to_task_id] += 1
+
         logger.debug(f"Added dependency: {from_task_id} -> {to_task_id}")
+
+    def _bounded_dfs(self, start: str, neighbors, in_window) -> List[str]:
+        """DFS from start, expanding only nodes whose index satisfies in_window"""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in neighbors(node):
+                if neighbor not in visited and in_window(self._ord[neighbor]):
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return list(visited)
     
     def validate(self) -> bool:
         """
@@ -129,18 +190,34 @@ class WorkflowDAG:
             - task2 and task3 can run in parallel after task1
             - task4 runs after task2 and task3 complete
         """
-        try:
-            # Get all generations (levels) in the DAG
-            generations = list(nx.topological_generations(self.graph))
-            
-            logger.debug(f"Execution order: {len(generations)} batches")
-            for i, batch in enumerate(generations):
-                logger.debug(f"  Batch {i}: {batch}")
-            
-            return generations
-            
-        except nx.NetworkXError as e:
-            raise WorkflowDAGError(f"Failed to compute execution order: {e}")
+        # Kahn's algorithm over the compact successor/in-degree tables;
+        # no TaskDefinition or NetworkX traversal in the loop
+        in_degree = dict(self._indegree)
+        current = [task_id for task_id, d in in_degree.items() if d == 0]
+        generations: List[List[str]] = []
+        ordered = 0
+
+        while current:
+            generations.append(current)
+            ordered += len(current)
+            next_batch: List[str] = []
+            for task_id in current:
+                for successor_id in self._succ[task_id]:
+                    in_degree[successor_id] -= 1
+                    if in_degree[successor_id] == 0:
+                        next_batch.append(successor_id)
+            current = next_batch
+
+        if ordered != len(self._tasks):
+            raise WorkflowDAGError(
+                "Failed to compute execution order: graph contains a cycle"
+            )
+
+        logger.debug(f"Execution order: {len(generations)} batches")
+        for i, batch in enumerate(generations):
+            logger.debug(f"  Batch {i}: {batch}")
+
+        return generations
     
     def get_ready_tasks(self, completed_tasks: Set[str]) -> List[str]:
         """
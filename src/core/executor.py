@@ -2,6 +2,8 @@
 Base executor interfaces for task execution.
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -49,8 +51,6 @@ class BaseExecutor(ABC):
         
         This is the main entry point that wrappers around execute().
         """
-        import asyncio
-        
         logger.info(f"Starting task {task.task_id} ({task.name})")
         
         result = TaskResult(
@@ -170,11 +170,19 @@ class LLMExecutor(BaseExecutor):
             
             logger.debug(f"LLM prompt length: {llm.count_tokens(prompt)} tokens")
             
-            # Generate response
-            response = llm.generate(
-                prompt,
-                max_tokens=task.metadata.get("max_tokens") if task.metadata else None,
-                temperature=task.metadata.get("temperature") if task.metadata else None
+            # Generate response off the event loop: inference is a sync
+            # native call (OpenVINO releases the GIL internally), so
+            # run_in_executor lets other asyncio tasks keep scheduling
+            # while this one blocks in a worker thread
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    llm.generate,
+                    prompt,
+                    max_tokens=task.metadata.get("max_tokens") if task.metadata else None,
+                    temperature=task.metadata.get("temperature") if task.metadata else None
+                )
             )
             
             # Parse output
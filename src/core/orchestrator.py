@@ -63,10 +63,18 @@ class WorkflowOrchestrator:
     - Track workflow state
     """
     
-    def __init__(self):
+    def __init__(self, max_parallel: Optional[int] = None):
         self.workflows: Dict[str, WorkflowState] = {}
         self.dags: Dict[str, WorkflowDAG] = {}
-        
+        # Optional bound on concurrently running tasks per execution;
+        # None means a wide layer fans out fully
+        self.max_parallel = max_parallel
+
+        # In-flight asyncio.Tasks per workflow, so cancellation iterates
+        # just this workflow's tasks instead of scanning
+        # asyncio.all_tasks() across the whole loop
+        self._inflight_tasks: Dict[str, Set[asyncio.Task]] = {}
+
         # Initialize executors
         self.executors: Dict[TaskType, BaseExecutor] = {
             TaskType.LLM: LLMExecutor(),
@@ -114,7 +122,7 @@ class WorkflowOrchestrator:
         
         try:
             # Execute tasks in topological order with parallelism
-            await self._execute_dag(dag, state, inputs or {})
+            await self._execute_dag(dag, workflow_def, state, inputs or {})
             
             # Mark workflow as complete
             state.status = "completed" if not state.failed_tasks else "failed"
@@ -137,38 +145,93 @@ class WorkflowOrchestrator:
     async def _execute_dag(
         self,
         dag: WorkflowDAG,
+        workflow_def: WorkflowDefinition,
         state: WorkflowState,
         workflow_inputs: Dict
     ) -> None:
         """
-        Execute DAG tasks with parallel batch execution.
-        
-        Processes tasks in topological order, running independent tasks in parallel.
+        Execute DAG tasks with event-driven scheduling.
+
+        Launches a task the moment its last dependency finishes instead
+        of waiting for whole topological batches, so a slow task only
+        delays its own successors. The loop wakes on task completion
+        (asyncio.wait FIRST_COMPLETED) — no polling or tick sleeps.
         """
-        execution_order = dag.get_execution_order()
-        
-        logger.info(f"Executing {len(execution_order)} batches")
-        
-        for batch_idx, batch in enumerate(execution_order):
-            logger.debug(f"Batch {batch_idx}: {batch}")
-            
-            # Execute all tasks in batch concurrently
-            tasks_to_run = []
-            for task_id in batch:
-                task = dag.get_task(task_id)
-                tasks_to_run.append(self._execute_task(task, state, workflow_inputs))
-            
-            # Wait for all tasks in batch to complete
-            results = await asyncio.gather(*tasks_to_run, return_exceptions=True)
-            
-            # Check for failures
-            for task_id, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    logger.error(f"Task {task_id} raised exception: {result}")
+        # Use the adjacency precomputed at compile() time when present;
+        # fall back to the DAG for definitions built by hand
+        if workflow_def.in_degree:
+            in_degree = dict(workflow_def.in_degree)
+            successors = workflow_def.successors
+        else:
+            in_degree = {
+                task.task_id: len(dag.get_task_dependencies(task.task_id))
+                for task in dag.get_all_tasks()
+            }
+            successors = {
+                task.task_id: dag.get_task_dependents(task.task_id)
+                for task in dag.get_all_tasks()
+            }
+        in_flight: Dict[asyncio.Task, str] = {}
+        inflight_bucket = self._inflight_tasks.setdefault(state.workflow_id, set())
+        semaphore = (
+            asyncio.Semaphore(self.max_parallel) if self.max_parallel else None
+        )
+
+        async def run_bounded(task: TaskDefinition) -> TaskResult:
+            async with semaphore:
+                return await self._execute_task(task, state, workflow_inputs)
+
+        def dispatch(tasks: List[TaskDefinition]) -> None:
+            # Critical-path tasks first so deep chains aren't stalled
+            # behind shallow side branches
+            for task in sorted(tasks, key=lambda t: -t.critical_path_length):
+                logger.debug(f"Dispatching task {task.task_id}")
+                future = asyncio.create_task(
+                    run_bounded(task) if semaphore
+                    else self._execute_task(task, state, workflow_inputs)
+                )
+                in_flight[future] = task.task_id
+                inflight_bucket.add(future)
+
+        logger.info(f"Executing {len(in_degree)} tasks (event-driven)")
+
+        dispatch([
+            dag.get_task(task_id)
+            for task_id, degree in in_degree.items() if degree == 0
+        ])
+
+        while in_flight:
+            done, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            newly_ready = []
+            for future in done:
+                task_id = in_flight.pop(future)
+                inflight_bucket.discard(future)
+
+                if future.cancelled():
+                    logger.warning(f"Task {task_id} cancelled")
+                    state.failed_tasks.add(task_id)
+                elif future.exception() is not None:
+                    logger.error(
+                        f"Task {task_id} raised exception: {future.exception()}"
+                    )
                     state.failed_tasks.add(task_id)
                     # Optionally: fail fast or continue
                     # For now, we'll continue to see all failures
-    
+
+                # A finished task unblocks successors whose last
+                # dependency it was
+                for successor_id in successors[task_id]:
+                    in_degree[successor_id] -= 1
+                    if in_degree[successor_id] == 0:
+                        newly_ready.append(dag.get_task(successor_id))
+
+            dispatch(newly_ready)
+
+        self._inflight_tasks.pop(state.workflow_id, None)
+
     async def _execute_task(
         self,
         task: TaskDefinition,
@@ -343,9 +406,13 @@ class WorkflowOrchestrator:
             logger.info(f"Workflow {workflow_id} resumed")
     
     async def cancel_workflow(self, workflow_id: str) -> None:
-        """Cancel a running workflow"""
+        """Cancel a running workflow and its in-flight tasks"""
         if workflow_id in self.workflows:
             self.workflows[workflow_id].status = "cancelled"
+            # Cancel only this workflow's tasks; no asyncio.all_tasks()
+            # scan of every task on the loop
+            for future in self._inflight_tasks.get(workflow_id, set()):
+                future.cancel()
             logger.info(f"Workflow {workflow_id} cancelled")
     
     def get_workflow_state(self, workflow_id: str) -> Optional[WorkflowState]:
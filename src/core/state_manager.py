@@ -4,11 +4,13 @@ State persistence for workflows using SQLite/PostgreSQL.
 Stores workflow execution state for recovery and auditing.
 """
 
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, JSON, Text, Enum as SQLEnum
+from sqlalchemy import create_engine, event, Column, String, Integer, DateTime, JSON, Text, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from loguru import logger
 
 from src.core.task import TaskStatus, WorkflowDefinition
@@ -81,26 +83,78 @@ class StateManager:
         settings = get_settings()
         self.database_url = database_url or settings.database.url
         
-        # Create engine
-        self.engine = create_engine(
-            self.database_url,
-            echo=settings.database.echo,
-            pool_size=settings.database.pool_size,
-            max_overflow=settings.database.max_overflow
+        # Create engine. In-memory SQLite (plain :memory: or a
+        # file:...?mode=memory&cache=shared URI) lives only as long as a
+        # connection stays open, so pin a single shared connection with
+        # StaticPool instead of the sizing arguments the pooled backends take.
+        is_memory_db = (
+            ":memory:" in self.database_url
+            or "mode=memory" in self.database_url
         )
-        
+        engine_kwargs: Dict[str, Any] = {"echo": settings.database.echo}
+        if is_memory_db:
+            engine_kwargs["poolclass"] = StaticPool
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+        else:
+            engine_kwargs["pool_size"] = settings.database.pool_size
+            engine_kwargs["max_overflow"] = settings.database.max_overflow
+        self.engine = create_engine(self.database_url, **engine_kwargs)
+
+        # File-backed SQLite defaults to journal_mode=DELETE with a full
+        # fsync per commit. WAL + synchronous=NORMAL keeps durability for
+        # this workload while letting readers and writers overlap, and
+        # busy_timeout avoids spurious "database is locked" failures.
+        if self.database_url.startswith("sqlite") and not is_memory_db:
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_conn, _record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA busy_timeout=5000")
+                cursor.close()
+
         # Create tables
         Base.metadata.create_all(self.engine)
         
         # Session factory
         self.SessionLocal = sessionmaker(bind=self.engine)
-        
+
+        # Active batch session; save_* methods join it instead of
+        # opening and committing their own
+        self._batch_session: Optional[Session] = None
+
         logger.info(f"StateManager initialized with database: {self.database_url}")
-    
+
     def get_session(self) -> Session:
         """Get a new database session"""
         return self.SessionLocal()
-    
+
+    @contextmanager
+    def batch_writes(self):
+        """
+        Group several save_* calls into one session and commit.
+
+        Each save normally opens, commits and closes its own session;
+        wrapping a burst of writes (e.g. persisting every task of a
+        workflow) in this context amortizes that to a single commit.
+        Nested use joins the outer batch.
+        """
+        if self._batch_session is not None:
+            yield self
+            return
+
+        session = self.get_session()
+        self._batch_session = session
+        try:
+            yield self
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._batch_session = None
+            session.close()
+
     def save_workflow_state(
         self,
         workflow_id: str,
@@ -131,8 +185,9 @@ class StateManager:
             error_message: Error message if failed
             metadata: Additional metadata
         """
-        session = self.get_session()
-        
+        batched = self._batch_session is not None
+        session = self._batch_session if batched else self.get_session()
+
         try:
             # Check if workflow exists
             workflow_state = session.query(WorkflowStateDB).filter_by(
@@ -165,16 +220,21 @@ class StateManager:
                     workflow_metadata=metadata or {}
                 )
                 session.add(workflow_state)
-            
-            session.commit()
+
+            if batched:
+                session.flush()
+            else:
+                session.commit()
             logger.debug(f"Saved workflow state: {workflow_id}")
-            
+
         except Exception as e:
-            session.rollback()
+            if not batched:
+                session.rollback()
             logger.error(f"Failed to save workflow state: {e}", exc_info=True)
             raise
         finally:
-            session.close()
+            if not batched:
+                session.close()
     
     def load_workflow_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -228,8 +288,9 @@ class StateManager:
         metrics: Optional[Dict] = None
     ) -> None:
         """Save individual task execution to database"""
-        session = self.get_session()
-        
+        batched = self._batch_session is not None
+        session = self._batch_session if batched else self.get_session()
+
         try:
             task_exec = TaskExecutionDB(
                 workflow_id=workflow_id,
@@ -246,15 +307,20 @@ class StateManager:
             )
             
             session.add(task_exec)
-            session.commit()
+            if batched:
+                session.flush()
+            else:
+                session.commit()
             logger.debug(f"Saved task execution: {task_id}")
-            
+
         except Exception as e:
-            session.rollback()
+            if not batched:
+                session.rollback()
             logger.error(f"Failed to save task execution: {e}", exc_info=True)
             raise
         finally:
-            session.close()
+            if not batched:
+                session.close()
     
     def get_task_executions(
         self,
@@ -44,6 +44,13 @@ class TaskDefinition(BaseModel):
         default_factory=list,
         description="List of task_ids that must complete before this task"
     )
+
+    # Scheduling priority (set by WorkflowBuilder.compile)
+    critical_path_length: int = Field(
+        default=0,
+        description="Longest path (in tasks) from this task to a sink; "
+                    "higher values are dispatched first"
+    )
     
     # Input/Output
     inputs: Dict[str, Any] = Field(
@@ -122,6 +129,21 @@ class WorkflowDefinition(BaseModel):
     # Workflow-level configuration
     timeout_seconds: Optional[int] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    # Scheduling cache (set by WorkflowBuilder.compile); lets the
+    # orchestrator skip rebuilding adjacency per execution
+    topo_order: List[str] = Field(
+        default_factory=list,
+        description="Task IDs in topological order"
+    )
+    successors: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="task_id -> IDs of tasks that depend on it"
+    )
+    in_degree: Dict[str, int] = Field(
+        default_factory=dict,
+        description="task_id -> number of direct dependencies"
+    )
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -5,8 +5,10 @@ Filters harmful, inappropriate, or sensitive content from LLM outputs.
 """
 
 from typing import List, Dict, Any, Set
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+import hashlib
 import re
 
 
@@ -32,45 +34,59 @@ class FilterResult:
     details: Dict[str, Any]
 
 
+# Keyword patterns per category, compiled once at import: filters are
+# often constructed per request (and per test), so instances just
+# reference these shared Pattern objects
+_PATTERNS: Dict[FilterCategory, List[str]] = {
+    FilterCategory.HATE_SPEECH: [
+        r'\b(hate|racist|sexist)\b',
+        # Add more patterns
+    ],
+    FilterCategory.VIOLENCE: [
+        r'\b(kill|murder|assault|attack|harm)\b',
+    ],
+    FilterCategory.PROFANITY: [
+        r'\b(damn|hell|crap)\b',  # Mild examples
+    ],
+    FilterCategory.PERSONAL_INFO: [
+        r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+        r'\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b',  # Email
+    ],
+    FilterCategory.FINANCIAL_DATA: [
+        r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',  # Credit card
+    ],
+}
+
+_COMPILED_PATTERNS: Dict[FilterCategory, List[re.Pattern]] = {
+    category: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for category, patterns in _PATTERNS.items()
+}
+
+# Sanitization masks, also compiled once
+_EMAIL_RE = re.compile(r'[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}', re.IGNORECASE)
+_SSN_RE = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+_CC_RE = re.compile(r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b')
+
+
 class ContentFilter:
     """
     Filters harmful or sensitive content.
-    
+
     Features:
     - Pattern-based detection
     - Category-specific filtering
     - Text sanitization
     """
-    
+
+    _CACHE_MAX = 1024
+
     def __init__(self):
-        # Define keyword patterns for each category
-        self.patterns: Dict[FilterCategory, List[str]] = {
-            FilterCategory.HATE_SPEECH: [
-                r'\b(hate|racist|sexist)\b',
-                # Add more patterns
-            ],
-            FilterCategory.VIOLENCE: [
-                r'\b(kill|murder|assault|attack|harm)\b',
-            ],
-            FilterCategory.PROFANITY: [
-                r'\b(damn|hell|crap)\b',  # Mild examples
-            ],
-            FilterCategory.PERSONAL_INFO: [
-                r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
-                r'\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b',  # Email
-            ],
-            FilterCategory.FINANCIAL_DATA: [
-                r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',  # Credit card
-            ],
-        }
-        
-        # Compile patterns
-        self.compiled_patterns: Dict[FilterCategory, List[re.Pattern]] = {}
-        for category, patterns in self.patterns.items():
-            self.compiled_patterns[category] = [
-                re.compile(p, re.IGNORECASE) for p in patterns
-            ]
-    
+        self.patterns = _PATTERNS
+        self.compiled_patterns = _COMPILED_PATTERNS
+        # Results memoized by (text digest, flags): guardrail pipelines
+        # commonly pass the same text through several stages
+        self._cache: "OrderedDict[tuple, FilterResult]" = OrderedDict()
+
     def filter(
         self,
         text: str,
@@ -88,9 +104,19 @@ class ContentFilter:
         Returns:
             FilterResult
         """
+        key = (
+            hashlib.blake2b(text.encode(), digest_size=16).digest(),
+            strict_mode,
+            frozenset(allowed_categories) if allowed_categories else None
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         blocked = []
         details = {}
-        
+
         for category, patterns in self.compiled_patterns.items():
             # Skip if category is allowed
             if allowed_categories and category in allowed_categories:
@@ -115,13 +141,19 @@ class ContentFilter:
         # Determine if passed
         passed = len(blocked) == 0 or (not strict_mode and self._is_minor(blocked))
         
-        return FilterResult(
+        result = FilterResult(
             passed=passed,
             blocked_categories=blocked,
             confidence=1.0 if blocked else 0.0,
             sanitized_text=sanitized,
             details=details
         )
+
+        self._cache[key] = result
+        if len(self._cache) > self._CACHE_MAX:
+            self._cache.popitem(last=False)
+
+        return result
     
     def _sanitize(self, text: str, blocked_categories: List[FilterCategory]) -> str:
         """Sanitize text by masking sensitive content"""
@@ -129,27 +161,11 @@ class ContentFilter:
         
         for category in blocked_categories:
             if category == FilterCategory.PERSONAL_INFO:
-                # Mask emails
-                sanitized = re.sub(
-                    r'[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}',
-                    '[EMAIL]',
-                    sanitized,
-                    flags=re.IGNORECASE
-                )
-                # Mask SSN
-                sanitized = re.sub(
-                    r'\b\d{3}-\d{2}-\d{4}\b',
-                    '[SSN]',
-                    sanitized
-                )
-            
+                sanitized = _EMAIL_RE.sub('[EMAIL]', sanitized)
+                sanitized = _SSN_RE.sub('[SSN]', sanitized)
+
             elif category == FilterCategory.FINANCIAL_DATA:
-                # Mask credit cards
-                sanitized = re.sub(
-                    r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
-                    '[CARD]',
-                    sanitized
-                )
+                sanitized = _CC_RE.sub('[CARD]', sanitized)
         
         return sanitized
     
@@ -2,10 +2,14 @@
 LLM components for Nexus Ray framework.
 """
 
-from src.llm.openvino_llm import OpenVINOLLM, get_llm
+from typing import TYPE_CHECKING
+
 from src.llm.prompts import PromptBuilder, PromptTemplate, create_task_prompt, create_json_prompt
 from src.llm.parser import ResponseParser, parse_llm_output
 
+if TYPE_CHECKING:
+    from src.llm.openvino_llm import OpenVINOLLM, get_llm
+
 __all__ = [
     "OpenVINOLLM",
     "get_llm",
@@ -16,3 +20,14 @@ __all__ = [
     "ResponseParser",
     "parse_llm_output",
 ]
+
+# Importing openvino_llm drags in optimum/transformers; defer it (PEP
+# 562) so consumers of prompts/parsing don't pay that import cost
+_LAZY_ATTRS = {"OpenVINOLLM", "get_llm"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        from src.llm import openvino_llm
+        return getattr(openvino_llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,18 @@ from loguru import logger
 
 from src.core.exceptions import InferenceError
 
+# Shared decoder: raw_decode parses a JSON value off a prefix and
+# tolerates trailing text, so no second strip-and-retry pass is needed
+_DECODER = json.JSONDecoder()
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+# Numbered (1. / 1)) and bulleted (- * •) items in one pattern: a
+# single multiline findall replaces per-marker scans, with trailing
+# whitespace trimmed by the pattern itself
+_LIST_RE = re.compile(r'^\s*(?:\d+[.)]|[-*•])\s+(.+?)\s*$', re.MULTILINE)
+# Tokenizer artifacts and 3+ newline runs handled in one scan: the
+# callback drops artifacts and collapses newline runs to a blank line
+_CLEAN_RE = re.compile(r'<\|[A-Za-z_]+\|>|</s>|\n{3,}')
+
 
 class ResponseParser:
     """
@@ -35,31 +47,37 @@ class ResponseParser:
         Returns:
             Parsed JSON dict or None
         """
-        # Try direct JSON parse first
-        try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
-            pass
-        
-        # Try to find JSON in code blocks
-        json_blocks = re.findall(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-        if json_blocks:
+        stripped = text.strip()
+
+        # Direct JSON: cheap prefix check before paying for a parse;
+        # raw_decode accepts trailing text after the value
+        if stripped[:1] in "{[":
+            try:
+                value, _ = _DECODER.raw_decode(stripped)
+                return value
+            except json.JSONDecodeError:
+                pass
+
+        # JSON in a ```json code block (precompiled pattern)
+        match = _JSON_BLOCK_RE.search(text)
+        if match:
             try:
-                return json.loads(json_blocks[0])
+                return json.loads(match.group(1))
             except json.JSONDecodeError as e:
                 if strict:
                     raise InferenceError(f"Invalid JSON in code block: {e}")
                 logger.warning(f"Failed to parse JSON from code block: {e}")
-        
-        # Try to find JSON-like structures
-        # Look for {...} patterns
-        json_patterns = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
-        for pattern in json_patterns:
+
+        # Embedded JSON: raw_decode from each '{' until one parses,
+        # instead of regex-hunting brace-balanced candidates
+        start = text.find('{')
+        while start != -1:
             try:
-                return json.loads(pattern)
+                value, _ = _DECODER.raw_decode(text, start)
+                return value
             except json.JSONDecodeError:
-                continue
-        
+                start = text.find('{', start + 1)
+
         if strict:
             raise InferenceError(f"No valid JSON found in response: {text[:200]}")
         
@@ -135,16 +153,11 @@ class ResponseParser:
         Returns:
             List of items
         """
-        # Try numbered list (1. item, 2. item)
-        numbered = re.findall(r'^\d+\.\s*(.+)$', text, re.MULTILINE)
-        if numbered:
-            return [item.strip() for item in numbered]
-        
-        # Try bulleted list (- item, * item)
-        bulleted = re.findall(r'^[\-\*]\s*(.+)$', text, re.MULTILINE)
-        if bulleted:
-            return [item.strip() for item in bulleted]
-        
+        # Numbered and bulleted markers in one precompiled scan
+        items = _LIST_RE.findall(text)
+        if items:
+            return items
+
         # Fallback: split by newlines
         return [line.strip() for line in text.split('\n') if line.strip()]
     
@@ -159,16 +172,11 @@ class ResponseParser:
         Returns:
             Cleaned text
         """
-        # Remove common artifacts
-        text = re.sub(r'<\|im_end\|>', '', text)
-        text = re.sub(r'</s>', '', text)
-        text = re.sub(r'<\|endoftext\|>', '', text)
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\n\n\n+', '\n\n', text)
-        text = text.strip()
-        
-        return text
+        # One pass: strip artifacts, collapse excessive blank lines
+        return _CLEAN_RE.sub(
+            lambda m: '\n\n' if m.group(0).startswith('\n') else '',
+            text
+        ).strip()
 
 
 def parse_llm_output(
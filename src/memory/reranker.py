@@ -4,6 +4,7 @@ BGE Re-ranker with OpenVINO optimization.
 Provides high-precision cross-encoder re-ranking for search results.
 """
 
+import os
 from typing import List, Dict, Any, Optional, Union, Tuple
 import numpy as np
 from pathlib import Path
@@ -21,6 +22,20 @@ except ImportError:
 from src.core.config import get_settings
 from src.core.exceptions import EmbeddingError
 
+# Shape buckets for OpenVINO kernel caching. Padding batch/sequence up to a
+# small fixed set of shapes means the runtime compiles kernels for at most
+# len(batches) x len(seqs) shapes instead of one per distinct input shape.
+_BATCH_BUCKETS = (1, 4, 16)
+_SEQ_BUCKETS = (64, 128, 256, 512)
+
+
+def _round_to_bucket(value: int, buckets: Tuple[int, ...]) -> int:
+    """Round value up to the nearest bucket (identity above the largest)"""
+    for bucket in buckets:
+        if value <= bucket:
+            return bucket
+    return value
+
 
 class BGEReranker:
     """
@@ -79,13 +94,27 @@ class BGEReranker:
         try:
             logger.info(f"Loading BGE Re-ranker from {self.model_path}")
             
-            # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
-            
-            # Load OpenVINO model
+            # Load tokenizer (force the fast Rust tokenizer; the Python
+            # SentencePiece fallback is ~5-10x slower)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_path, use_fast=True)
+            if not self.tokenizer.is_fast:
+                logger.warning("Fast tokenizer unavailable — falling back to slow tokenizer")
+            self.tokenizer.model_max_length = 512
+
+            # Load OpenVINO model. Explicit thread count + core affinity
+            # avoid over-subscription under concurrent rerank requests;
+            # denormals optimization sidesteps FP stalls in attention
+            # outputs, and the runtime cache keeps kernels for the
+            # bucketed shapes resident across calls.
             self.model = OVModelForSequenceClassification.from_pretrained(
                 self.model_path,
-                device=self.device
+                device=self.device,
+                ov_config={
+                    "INFERENCE_NUM_THREADS": str(min(8, os.cpu_count() or 1)),
+                    "AFFINITY": "CORE",
+                    "CPU_DENORMALS_OPTIMIZATION": "YES",
+                    "CPU_RUNTIME_CACHE_CAPACITY": "10",
+                }
             )
             
             logger.info(f"✅ BGE Re-ranker loaded successfully on {self.device}")
@@ -95,6 +124,33 @@ class BGEReranker:
             logger.error(f"Failed to load BGE Re-ranker: {e}")
             self.model = None
     
+    def _pad_to_bucket(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pad batch and sequence dims up to the nearest bucket shape.
+
+        Padded rows carry a zero attention mask and their logits are sliced
+        off after inference; the cost of a few extra padded tokens is far
+        below a dynamic-shape recompilation.
+        """
+        batch, seq_len = inputs["input_ids"].shape
+        pad_batch = _round_to_bucket(batch, _BATCH_BUCKETS)
+        pad_seq = _round_to_bucket(seq_len, _SEQ_BUCKETS)
+
+        if pad_batch == batch and pad_seq == seq_len:
+            return inputs
+
+        pad_id = self.tokenizer.pad_token_id or 0
+        input_ids = torch.full(
+            (pad_batch, pad_seq), pad_id, dtype=inputs["input_ids"].dtype
+        )
+        input_ids[:batch, :seq_len] = inputs["input_ids"]
+        attention_mask = torch.zeros(
+            (pad_batch, pad_seq), dtype=inputs["attention_mask"].dtype
+        )
+        attention_mask[:batch, :seq_len] = inputs["attention_mask"]
+
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
     def rerank(
         self,
         query: str,
@@ -124,22 +180,38 @@ class BGEReranker:
             return []
             
         try:
-            # Prepare pairs
-            pairs = [[query, doc] for doc in documents]
-            
-            # Tokenize
-            inputs = self.tokenizer(
-                pairs,
+            # Tokenize the query once and prepend it to every document
+            # encoding. Avoids re-running the tokenizer over the query text
+            # for each of the N (query, doc) pairs.
+            q = self.tokenizer(query, add_special_tokens=True, return_tensors="pt")
+            q_len = q.input_ids.shape[1]
+
+            d = self.tokenizer(
+                documents,
                 padding=True,
                 truncation=True,
-                max_length=512,
+                max_length=max(2, 512 - q_len + 1),
                 return_tensors="pt"
             )
-            
+
+            # [CLS]query[SEP] + doc[1:] (drop each doc's leading CLS)
+            batch_size = d.input_ids.shape[0]
+            inputs = {
+                "input_ids": torch.cat(
+                    [q.input_ids.expand(batch_size, -1), d.input_ids[:, 1:]], dim=1
+                ),
+                "attention_mask": torch.cat(
+                    [q.attention_mask.expand(batch_size, -1), d.attention_mask[:, 1:]], dim=1
+                ),
+            }
+
+            # Pad up to bucketed shapes so OpenVINO reuses compiled kernels
+            inputs = self._pad_to_bucket(inputs)
+
             # Inference
             with torch.no_grad():
                 outputs = self.model(**inputs)
-                logits = outputs.logits
+                logits = outputs.logits[:batch_size]
                 if logits.shape[1] == 1:
                     scores = logits.view(-1).float()
                 else:
@@ -177,14 +249,16 @@ class BGEReranker:
 
 # Singleton instance
 _reranker: Optional[BGEReranker] = None
+_reranker_resolved: bool = False
 
-def get_reranker() -> BGEReranker:
-    """Get global BGE re-ranker instance"""
-    global _reranker
-    if _reranker is None:
+def get_reranker() -> Optional[BGEReranker]:
+    """Get global BGE re-ranker instance (None if initialization failed)"""
+    global _reranker, _reranker_resolved
+    if not _reranker_resolved:
         try:
             _reranker = BGEReranker()
         except Exception as e:
             logger.warning(f"Could not initialize global re-ranker: {e}")
             _reranker = None
+        _reranker_resolved = True
     return _reranker
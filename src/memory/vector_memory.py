@@ -4,6 +4,7 @@ Vector memory system for semantic search and retrieval.
 Provides unified interface for vector storage with multiple backends.
 """
 
+import functools
 from typing import List, Dict, Any, Optional, Union
 import numpy as np
 from enum import Enum
@@ -21,6 +22,21 @@ from src.memory.faiss_backend import FAISSBackend
 from src.memory.chromadb_backend import ChromaDBBackend
 
 
+# Query-embedding cache: conversational/agent workloads search the same query
+# across namespaces or retry with different k/filters, so memoizing the
+# query -> embedding mapping skips redundant encoder forward passes.
+# Keyed on id(embedder) so switching embedders invalidates entries; the
+# registry resolves the id back to a live instance inside the cached helper.
+_QUERY_EMBED_CACHE_SIZE = 512
+_cached_embedders: Dict[int, BGEEmbedder] = {}
+
+
+@functools.lru_cache(maxsize=_QUERY_EMBED_CACHE_SIZE)
+def _embed_query_cached(embedder_id: int, query: str) -> np.ndarray:
+    """Embed a query (normalized), memoized per (embedder, query) pair."""
+    return _cached_embedders[embedder_id].embed_single(query, normalize=True)
+
+
 class VectorBackendType(str, Enum):
     """Supported vector store backends"""
     FAISS = "faiss"
@@ -47,21 +63,34 @@ class VectorMemory:
         self,
         backend: Union[str, VectorBackendType] = VectorBackendType.FAISS,
         embedder: Optional[BGEEmbedder] = None,
+        reranker: Optional[Any] = None,
         **backend_kwargs
     ):
         """
         Initialize vector memory.
-        
+
         Args:
             backend: Backend type (faiss or chromadb)
             embedder: Custom embedder (uses default if None)
+            reranker: Custom reranker (uses global singleton if None)
             **backend_kwargs: Additional backend-specific arguments
         """
         self.settings = get_settings()
-        
+
         # Initialize embedder
         self.embedder = embedder or get_embedder()
         self.dimension = self.embedder.get_dimension()
+        _cached_embedders[id(self.embedder)] = self.embedder
+
+        # Resolve reranker once; avoids the get_reranker() probe per query
+        self._reranker = reranker if reranker is not None else get_reranker()
+
+        # Cached vector count; invalidated on add/delete/clear
+        self._total_vectors: Optional[int] = None
+
+        # Confidence thresholds for bypassing the reranker on easy queries
+        self._rerank_skip_top1 = self.settings.vector_memory.rerank_skip_top1
+        self._rerank_skip_gap = self.settings.vector_memory.rerank_skip_gap
         
         # Initialize backend
         backend_type = VectorBackendType(backend) if isinstance(backend, str) else backend
@@ -112,8 +141,9 @@ class VectorMemory:
         # Generate embeddings
         logger.debug(f"Generating embeddings for {len(texts)} texts...")
         embeddings = self.embedder.embed(texts, normalize=True)
-        
+
         # Add to backend
+        self._total_vectors = None
         return self.backend.add(embeddings, metadata=metadata, ids=ids)
     
     def add_embeddings(
@@ -133,6 +163,7 @@ class VectorMemory:
         Returns:
             List of assigned IDs
         """
+        self._total_vectors = None
         return self.backend.add(embeddings, metadata=metadata, ids=ids)
     
     def search(
@@ -154,37 +185,52 @@ class VectorMemory:
         Returns:
             List of results with scores and metadata
         """
-        # Generate query embedding
-        query_embedding = self.embedder.embed_single(query, normalize=True)
-        
-        # 1. Retrieve Candidates (Fetch 3x k to give re-ranker enough candidates)
-        initial_k = k * 3
-        
+        # Generate query embedding (LRU-cached for repeated queries)
+        query_embedding = _embed_query_cached(id(self.embedder), query)
+
+        # 1. Retrieve Candidates (Fetch 3x k to give re-ranker enough candidates,
+        # capped at the corpus size so FAISS doesn't pad with duplicates)
+        if self._total_vectors is None:
+            self._total_vectors = self.backend.get_stats()['total_vectors']
+        initial_k = min(k * 3, max(self._total_vectors, 1))
+
         # Search backend
         if isinstance(self.backend, ChromaDBBackend) and where:
             results = self.backend.search(query_embedding, k=initial_k, where=where, return_metadata=return_metadata)
         else:
             results = self.backend.search(query_embedding, k=initial_k, return_metadata=return_metadata)
-            
-        # 2. Re-rank if reranker is available
-        reranker = get_reranker()
+
+        # Short-circuit: nothing for the reranker to reduce
+        if len(results) <= k or len(results) < 2:
+            return results[:k]
+
+        # Confidence bypass: a strong, well-separated top-1 match won't be
+        # reordered meaningfully by the cross-encoder
+        top1 = results[0].get('score', 0.0)
+        if (top1 >= self._rerank_skip_top1
+                and top1 - results[1].get('score', 0.0) >= self._rerank_skip_gap):
+            return results[:k]
+
+        # 2. Re-rank if reranker is available (resolved once in __init__)
+        reranker = self._reranker
         if reranker:
             # Extract texts
             docs = [r['text'] for r in results if 'text' in r]
-            if docs:
-                # Top k reranking
+            # Skip reranking when there's nothing to reduce (<= k candidates)
+            if len(docs) > k:
                 reranked = reranker.rerank(query, docs)
-                
-                # Re-order results based on reranker scores
-                new_results = []
-                for item in reranked:
-                    original_idx = item['index']
-                    if original_idx < len(results):
-                        original_res = results[original_idx]
-                        original_res['score'] = item['score']  # Update score
-                        new_results.append(original_res)
-                
-                results = new_results
+
+                # Select top-k numerically (argpartition is O(n) vs a full
+                # sort) and only materialize dicts for the survivors
+                n = len(reranked)
+                idxs = np.fromiter((r['index'] for r in reranked), dtype=np.int32, count=n)
+                scrs = np.fromiter((r['score'] for r in reranked), dtype=np.float32, count=n)
+                top = np.argpartition(-scrs, k - 1)[:k]
+                top = top[np.argsort(-scrs[top])]
+                results = [
+                    dict(results[idxs[i]], score=float(scrs[i]))
+                    for i in top
+                ]
         
         # Return top k
         return results[:k]
@@ -210,10 +256,12 @@ class VectorMemory:
     
     def delete(self, ids: List[Union[int, str]]) -> int:
         """Delete documents by IDs"""
+        self._total_vectors = None
         return self.backend.delete(ids)
-    
+
     def clear(self):
         """Clear all documents from memory"""
+        self._total_vectors = None
         self.backend.clear()
     
     def save(self, path: Optional[str] = None):
@@ -3,14 +3,45 @@ Kafka client wrapper for producer and consumer operations.
 """
 
 import asyncio
-import json
+import functools
+import time
+import orjson
 from typing import Dict, Any, Optional, Callable, List
-from datetime import datetime
+from datetime import datetime, timezone
 from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
 from aiokafka.errors import KafkaError
 from loguru import logger
 
 
+def _serialize(value: Any) -> bytes:
+    """Serialize a message payload to bytes (orjson returns bytes directly)"""
+    if isinstance(value, bytes):
+        # Pre-serialized payload (see KafkaProducer.send_raw) — pass through
+        return value
+    return orjson.dumps(value, option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY)
+
+
+@functools.lru_cache(maxsize=256)
+def _serialize_small_cached(items: tuple) -> bytes:
+    """Serialize a small flat message, memoized for repeated payloads"""
+    return orjson.dumps(dict(items))
+
+
+def preserialize(message: Dict[str, Any]) -> bytes:
+    """
+    Pre-serialize a fixed-schema message for reuse across sends.
+
+    Repeated small messages (ACKs, heartbeats) hit an LRU cache keyed on
+    the message items; larger or unhashable payloads serialize directly.
+    Pass the returned bytes to KafkaProducer.send_raw.
+    """
+    try:
+        return _serialize_small_cached(tuple(sorted(message.items())))
+    except TypeError:
+        # Nested/unhashable values can't be cache keys
+        return _serialize(message)
+
+
 class KafkaConfig:
     """Kafka configuration"""
     
@@ -18,11 +49,14 @@ class KafkaConfig:
         self,
         bootstrap_servers: str = "localhost:9092",
         client_id: str = "nexus-ray",
-        group_id: str = "nexus-ray-group"
+        group_id: str = "nexus-ray-group",
+        compression_type: str = "lz4"
     ):
         self.bootstrap_servers = bootstrap_servers
         self.client_id = client_id
         self.group_id = group_id
+        # lz4 compresses JSON 3-5x faster than gzip at a similar ratio
+        self.compression_type = compression_type
 
 
 class KafkaProducer:
@@ -35,7 +69,20 @@ class KafkaProducer:
     def __init__(self, config: Optional[KafkaConfig] = None):
         self.config = config or KafkaConfig()
         self.producer: Optional[AIOKafkaProducer] = None
+        # Millisecond-granularity timestamp cache; formatting an ISO-8601
+        # string per message dominates at high message rates
+        self._ts_bucket: int = -1
+        self._ts_str: str = ""
         logger.info(f"KafkaProducer initialized: {self.config.bootstrap_servers}")
+
+    def _timestamp(self) -> str:
+        """ISO-8601 UTC timestamp, re-formatted at most once per millisecond"""
+        ns = time.time_ns()
+        bucket = ns // 1_000_000
+        if bucket != self._ts_bucket:
+            self._ts_bucket = bucket
+            self._ts_str = datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+        return self._ts_str
     
     async def start(self) -> None:
         """Start the Kafka producer"""
@@ -43,8 +90,10 @@ class KafkaProducer:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.config.bootstrap_servers,
                 client_id=self.config.client_id,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-                compression_type="gzip"
+                value_serializer=_serialize,
+                compression_type=self.config.compression_type,
+                linger_ms=10,
+                max_batch_size=65536
             )
             await self.producer.start()
             logger.info("KafkaProducer started successfully")
@@ -77,8 +126,7 @@ class KafkaProducer:
         
         try:
             # Add timestamp if not present
-            if 'timestamp' not in message:
-                message['timestamp'] = datetime.utcnow().isoformat()
+            message.setdefault('timestamp', self._timestamp())
             
             key_bytes = key.encode('utf-8') if key else None
             
@@ -90,14 +138,57 @@ class KafkaProducer:
             logger.error(f"Failed to send message to {topic}: {e}")
             raise
     
+    async def send_raw(
+        self,
+        topic: str,
+        payload: bytes,
+        key: Optional[str] = None
+    ) -> None:
+        """
+        Send a pre-serialized payload, skipping per-send JSON encoding.
+
+        Args:
+            topic: Kafka topic name
+            payload: Message bytes (e.g. from preserialize())
+            key: Optional message key for partitioning
+        """
+        if not self.producer:
+            raise RuntimeError("Producer not started. Call start() first.")
+
+        try:
+            key_bytes = key.encode('utf-8') if key else None
+            await self.producer.send(topic, value=payload, key=key_bytes)
+        except KafkaError as e:
+            logger.error(f"Failed to send raw message to {topic}: {e}")
+            raise
+
     async def send_batch(
         self,
         topic: str,
         messages: List[Dict[str, Any]]
     ) -> None:
-        """Send multiple messages in batch"""
+        """
+        Send multiple messages in batch.
+
+        Schedules all sends concurrently so aiokafka can coalesce them into
+        producer batches, then flushes once instead of awaiting per message.
+        """
+        if not self.producer:
+            raise RuntimeError("Producer not started. Call start() first.")
+
+        timestamp = self._timestamp()
         for message in messages:
-            await self.send(topic, message)
+            message.setdefault('timestamp', timestamp)
+
+        try:
+            await asyncio.gather(
+                *(self.producer.send(topic, value=message) for message in messages)
+            )
+            await self.producer.flush()
+            logger.debug(f"Sent batch of {len(messages)} messages to {topic}")
+        except KafkaError as e:
+            logger.error(f"Failed to send batch to {topic}: {e}")
+            raise
 
 
 class KafkaConsumer:
@@ -128,7 +219,7 @@ class KafkaConsumer:
                 *self.topics,
                 bootstrap_servers=self.config.bootstrap_servers,
                 group_id=self.config.group_id,
-                value_deserializer=lambda m: json.loads(m.decode('utf-8')),
+                value_deserializer=orjson.loads,
                 auto_offset_reset='latest',
                 enable_auto_commit=True
             )
@@ -196,18 +287,14 @@ class KafkaConsumer:
         """
         if not self.consumer:
             raise RuntimeError("Consumer not started")
-        
-        messages = []
-        try:
-            async with asyncio.timeout(timeout):
-                async for msg in self.consumer:
-                    messages.append(msg.value)
-                    if len(messages) >= max_messages:
-                        break
-        except asyncio.TimeoutError:
-            pass
-        
-        return messages
+
+        # getmany drains the pre-fetched buffer across partitions in one
+        # await instead of one coroutine step per message
+        records = await self.consumer.getmany(
+            timeout_ms=int(timeout * 1000),
+            max_records=max_messages
+        )
+        return [msg.value for msgs in records.values() for msg in msgs][:max_messages]
 
 
 class KafkaClient:
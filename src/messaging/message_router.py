@@ -50,6 +50,45 @@ class MessageType(str, Enum):
     METRIC_RECORDED = "metric_recorded"
 
 
+# Dispatch table built once at import: message type value -> topic name.
+# Agent messages are special-cased in route_message (inbox vs broadcast).
+# A str-mixin Enum hashes as its value, so both raw wire strings and
+# MessageType members hit the same entries.
+_TOPIC_BY_TYPE: Dict[str, str] = {
+    MessageType.WORKFLOW_STARTED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.WORKFLOW_COMPLETED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.WORKFLOW_FAILED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.TASK_STARTED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.TASK_COMPLETED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.TASK_FAILED.value: TopicType.WORKFLOW_EVENTS.value,
+    MessageType.LLM_CALL_STARTED.value: TopicType.LLM_ACTIVITY.value,
+    MessageType.LLM_CALL_COMPLETED.value: TopicType.LLM_ACTIVITY.value,
+    MessageType.LLM_REASONING_TRACE.value: TopicType.LLM_ACTIVITY.value,
+    MessageType.HITL_APPROVAL_REQUIRED.value: TopicType.HITL_REQUESTS.value,
+    MessageType.HITL_APPROVED.value: TopicType.HITL_REQUESTS.value,
+    MessageType.HITL_REJECTED.value: TopicType.HITL_REQUESTS.value,
+    MessageType.METRIC_RECORDED.value: TopicType.METRICS_STREAM.value,
+}
+
+# Agent message types compared as raw strings: frozenset membership is a
+# single hash lookup and skips Enum.__eq__ / EnumMeta attribute access.
+_AGENT_TYPES: frozenset = frozenset({
+    MessageType.AGENT_MESSAGE.value,
+    MessageType.AGENT_REQUEST.value,
+})
+
+# Frozen type strings for the create_* factories — one enum member/value
+# access at import instead of per created message
+_HITL_TYPE = MessageType.HITL_APPROVAL_REQUIRED.value
+_METRIC_TYPE = MessageType.METRIC_RECORDED.value
+_BROADCAST_TOPIC = TopicType.AGENT_BROADCAST.value
+
+
+def _type_value(event_type) -> str:
+    """Resolve a MessageType member or raw string to its wire value"""
+    return event_type.value if isinstance(event_type, MessageType) else event_type
+
+
 class MessageRouter:
     """
     Routes messages to appropriate Kafka topics.
@@ -58,6 +97,10 @@ class MessageRouter:
     """
     
     def __init__(self):
+        # Per-agent inbox topic cache; agents are a small stable set, so
+        # memoizing skips an enum access + f-string build per message
+        self._agent_inbox_prefix = TopicType.AGENT_INBOX.value + "."
+        self._inbox_cache: Dict[str, str] = {}
         logger.info("MessageRouter initialized")
     
     def get_workflow_events_topic(self) -> str:
@@ -74,7 +117,10 @@ class MessageRouter:
         Returns:
             Topic name: agent.inbox.<agent_id>
         """
-        return f"{TopicType.AGENT_INBOX.value}.{agent_id}"
+        topic = self._inbox_cache.get(agent_id)
+        if topic is None:
+            topic = self._inbox_cache[agent_id] = self._agent_inbox_prefix + agent_id
+        return topic
     
     def get_agent_broadcast_topic(self) -> str:
         """Get topic for broadcasting to all agents"""
@@ -103,50 +149,22 @@ class MessageRouter:
             Topic name
         """
         message_type = message.get('type')
-        
-        # Workflow events
-        if message_type in [
-            MessageType.WORKFLOW_STARTED,
-            MessageType.WORKFLOW_COMPLETED,
-            MessageType.WORKFLOW_FAILED,
-            MessageType.TASK_STARTED,
-            MessageType.TASK_COMPLETED,
-            MessageType.TASK_FAILED
-        ]:
-            return self.get_workflow_events_topic()
-        
-        # Agent messages - route to specific inbox
-        if message_type in [MessageType.AGENT_MESSAGE, MessageType.AGENT_REQUEST]:
+
+        # Fixed-topic types resolve with a single dict lookup
+        topic = _TOPIC_BY_TYPE.get(message_type)
+        if topic is not None:
+            return topic
+
+        # Agent messages - route to specific inbox, broadcast if no target
+        if message_type in _AGENT_TYPES:
             target_agent = message.get('target_agent')
             if target_agent:
                 return self.get_agent_inbox_topic(target_agent)
-            else:
-                # Broadcast if no target
-                return self.get_agent_broadcast_topic()
-        
-        # LLM events
-        if message_type in [
-            MessageType.LLM_CALL_STARTED,
-            MessageType.LLM_CALL_COMPLETED,
-            MessageType.LLM_REASONING_TRACE
-        ]:
-            return self.get_llm_activity_topic()
-        
-        # HITL events
-        if message_type in [
-            MessageType.HITL_APPROVAL_REQUIRED,
-            MessageType.HITL_APPROVED,
-            MessageType.HITL_REJECTED
-        ]:
-            return self.get_hitl_topic()
-        
-        # Metrics
-        if message_type == MessageType.METRIC_RECORDED:
-            return self.get_metrics_topic()
-        
+            return _BROADCAST_TOPIC
+
         # Default to broadcast
         logger.warning(f"Unknown message type {message_type}, routing to broadcast")
-        return self.get_agent_broadcast_topic()
+        return _BROADCAST_TOPIC
     
     def create_workflow_event(
         self,
@@ -166,7 +184,7 @@ class MessageRouter:
             Formatted message
         """
         return {
-            'type': event_type.value,
+            'type': _type_value(event_type),
             'workflow_id': workflow_id,
             **kwargs
         }
@@ -193,7 +211,7 @@ class MessageRouter:
             Formatted message
         """
         message = {
-            'type': message_type.value,
+            'type': _type_value(message_type),
             'from_agent': from_agent,
             'content': content,
             **kwargs
@@ -224,7 +242,7 @@ class MessageRouter:
             Formatted message
         """
         return {
-            'type': event_type.value,
+            'type': _type_value(event_type),
             'agent_id': agent_id,
             'workflow_id': workflow_id,
             **kwargs
@@ -252,7 +270,7 @@ class MessageRouter:
             Formatted message
         """
         return {
-            'type': MessageType.HITL_APPROVAL_REQUIRED.value,
+            'type': _HITL_TYPE,
             'workflow_id': workflow_id,
             'task_id': task_id,
             'decision_data': decision_data,
@@ -280,7 +298,7 @@ class MessageRouter:
             Formatted message
         """
         return {
-            'type': MessageType.METRIC_RECORDED.value,
+            'type': _METRIC_TYPE,
             'metric_name': metric_name,
             'metric_value': metric_value,
             'labels': labels or {},
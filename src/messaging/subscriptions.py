@@ -4,13 +4,16 @@ Decorator-based subscription system for Kafka topics.
 Allows agents to subscribe to topics using decorators.
 """
 
-import functools
-from typing import Callable, List, Optional, Dict, Any
+import asyncio
+import sys
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from loguru import logger
 
 
-# Global registry of subscriptions
-_SUBSCRIPTIONS: Dict[str, List[Callable]] = {}
+# Global registry of subscriptions. Topic keys are interned (cheap equality
+# and hashing downstream in the router) and callback collections are tuples,
+# which pack tighter than lists and iterate faster.
+_SUBSCRIPTIONS: Dict[str, Tuple[Callable, ...]] = {}
 
 
 def subscribe(topic: str, consumer_id: Optional[str] = None):
@@ -28,27 +31,23 @@ def subscribe(topic: str, consumer_id: Optional[str] = None):
     """
     def decorator(func: Callable):
         # Register the subscription
-        if topic not in _SUBSCRIPTIONS:
-            _SUBSCRIPTIONS[topic] = []
-        
-        _SUBSCRIPTIONS[topic].append(func)
-        
+        key = sys.intern(topic)
+        _SUBSCRIPTIONS[key] = _SUBSCRIPTIONS.get(key, ()) + (func,)
+
         logger.debug(f"Registered subscription: {func.__name__} -> {topic}")
-        
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        
-        # Attach metadata
-        wrapper._kafka_topic = topic
-        wrapper._consumer_id = consumer_id
-        
-        return wrapper
-    
+
+        # Attach metadata and return the function itself — a forwarding
+        # wrapper would only add a coroutine frame per delivered message
+        func._kafka_topic = topic
+        func._consumer_id = consumer_id
+        func._is_async = asyncio.iscoroutinefunction(func)
+
+        return func
+
     return decorator
 
 
-def get_subscriptions() -> Dict[str, List[Callable]]:
+def get_subscriptions() -> Dict[str, Tuple[Callable, ...]]:
     """Get all registered subscriptions"""
     return _SUBSCRIPTIONS.copy()
 
@@ -71,30 +70,62 @@ class SubscriptionManager:
         self.active_consumers = []
         logger.info("SubscriptionManager initialized")
     
+    @staticmethod
+    def _make_dispatcher(callbacks: tuple) -> Callable:
+        """
+        Build the per-topic dispatch callback.
+
+        The callback tuple is frozen at bind time (no late-binding closure
+        over the loop variable), and a lone subscriber is returned directly
+        so single-handler topics skip the dispatcher frame entirely.
+        Callbacks are split sync/async at build time: sync handlers run
+        without coroutine scheduling, async ones are gathered in one go.
+        """
+        if len(callbacks) == 1:
+            return callbacks[0]
+
+        sync_cbs = tuple(
+            cb for cb in callbacks
+            if not getattr(cb, '_is_async', asyncio.iscoroutinefunction(cb))
+        )
+        async_cbs = tuple(cb for cb in callbacks if cb not in sync_cbs)
+
+        async def dispatch(topic: str, message: Dict[str, Any]):
+            for callback in sync_cbs:
+                try:
+                    callback(topic, message)
+                except Exception as e:
+                    logger.error(
+                        f"Error in subscription callback {callback.__name__}: {e}",
+                        exc_info=True
+                    )
+            if async_cbs:
+                results = await asyncio.gather(
+                    *(cb(topic, message) for cb in async_cbs),
+                    return_exceptions=True
+                )
+                for callback, result in zip(async_cbs, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error in subscription callback {callback.__name__}: {result}",
+                            exc_info=result
+                        )
+
+        return dispatch
+
     async def start_all_subscriptions(self) -> None:
         """
         Start consumers for all registered subscriptions.
         """
         subscriptions = get_subscriptions()
-        
+
         logger.info(f"Starting {len(subscriptions)} subscriptions")
-        
+
         for topic, callbacks in subscriptions.items():
-            # Create combined callback for all functions on this topic
-            async def topic_callback(t: str, message: Dict[str, Any]):
-                for callback in callbacks:
-                    try:
-                        await callback(t, message)
-                    except Exception as e:
-                        logger.error(
-                            f"Error in subscription callback {callback.__name__}: {e}",
-                            exc_info=True
-                        )
-            
-            # Subscribe to topic
+            # Subscribe to topic with a pre-bound dispatcher
             consumer = self.kafka_client.subscribe(
                 topics=[topic],
-                callback=topic_callback,
+                callback=self._make_dispatcher(tuple(callbacks)),
                 consumer_id=f"subscription_{topic}"
             )
             
@@ -0,0 +1,78 @@
+"""
+Grouped aggregation kernels for the observability columnar mirrors.
+
+When numba is installed the per-model aggregation compiles to a single
+tight loop over the call columns; otherwise a NumPy bincount fallback
+keeps the same signature without interpreter-level per-call overhead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _workflow_agg_numpy(rows, total_tokens, input_tokens, output_tokens,
+                        durations, model_ids, errors, n_models):
+    sel_models = model_ids[rows]
+    return (
+        int(total_tokens[rows].sum()),
+        int(input_tokens[rows].sum()),
+        int(output_tokens[rows].sum()),
+        float(durations[rows].sum()),
+        int(errors[rows].sum()),
+        np.bincount(sel_models, minlength=n_models).astype(np.int64),
+    )
+
+
+def _group_by_model_numpy(model_ids, tokens, durations, errors, n_models):
+    calls = np.bincount(model_ids, minlength=n_models).astype(np.int64)
+    tok = np.bincount(model_ids, weights=tokens, minlength=n_models)
+    dur = np.bincount(model_ids, weights=durations, minlength=n_models)
+    err = np.bincount(model_ids, weights=errors, minlength=n_models)
+    return calls, tok, dur, err
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def group_by_model(model_ids, tokens, durations, errors, n_models):
+        """Fused per-model (calls, tokens, duration_sum, errors) in one pass"""
+        calls = np.zeros(n_models, dtype=np.int64)
+        tok = np.zeros(n_models, dtype=np.float64)
+        dur = np.zeros(n_models, dtype=np.float64)
+        err = np.zeros(n_models, dtype=np.float64)
+        for i in range(model_ids.shape[0]):
+            m = model_ids[i]
+            calls[m] += 1
+            tok[m] += tokens[i]
+            dur[m] += durations[i]
+            err[m] += errors[i]
+        return calls, tok, dur, err
+
+    @njit(cache=True)
+    def workflow_agg(rows, total_tokens, input_tokens, output_tokens,
+                     durations, model_ids, errors, n_models):
+        """Fused per-workflow scalars + model histogram in one pass"""
+        tok = 0
+        inp = 0
+        out = 0
+        dur = 0.0
+        err = 0
+        hist = np.zeros(n_models, dtype=np.int64)
+        for k in range(rows.shape[0]):
+            r = rows[k]
+            tok += total_tokens[r]
+            inp += input_tokens[r]
+            out += output_tokens[r]
+            dur += durations[r]
+            err += errors[r]
+            hist[model_ids[r]] += 1
+        return tok, inp, out, dur, err, hist
+
+else:
+    group_by_model = _group_by_model_numpy
+    workflow_agg = _workflow_agg_numpy
@@ -5,14 +5,34 @@ Provides a stream of events for monitoring and debugging.
 """
 
 from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from collections import deque
+from collections import defaultdict, deque
+import itertools
+import queue
 import threading
+import time
 from loguru import logger
 
 
+# Millisecond-granularity timestamp cache. add_activity runs on every
+# workflow/task/LLM event; allocating and formatting a datetime per record
+# dominates under bursty event streams, so the ISO string is reformatted
+# at most once per millisecond.
+_ts_cache = {"bucket": -1, "iso": ""}
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as ISO-8601, cached per millisecond"""
+    ns = time.time_ns()
+    bucket = ns // 1_000_000
+    if bucket != _ts_cache["bucket"]:
+        _ts_cache["bucket"] = bucket
+        _ts_cache["iso"] = datetime.utcfromtimestamp(ns / 1e9).isoformat()
+    return _ts_cache["iso"]
+
+
 class ActivityType(str, Enum):
     """Types of activities"""
     # Workflow events
@@ -43,12 +63,14 @@ class ActivityType(str, Enum):
     SYSTEM_ERROR = "system_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Activity:
     """Single activity record"""
     activity_id: str
-    activity_type: ActivityType
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Stored as the raw string value; enum members are normalized at
+    # add_activity time so to_dict/filters never touch EnumMeta
+    activity_type: str
+    timestamp: str = field(default_factory=_utcnow_iso)
     
     # Context
     workflow_id: Optional[str] = None
@@ -65,11 +87,26 @@ class Activity:
     tags: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        result = asdict(self)
-        result['activity_type'] = self.activity_type.value
-        result['timestamp'] = self.timestamp.isoformat()
-        return result
+        """
+        Convert to dictionary.
+
+        Built by hand rather than dataclasses.asdict, which deep-copies
+        every field including the nested data payload. The returned dict
+        shares references to data/tags — treat it as read-only.
+        """
+        return {
+            'activity_id': self.activity_id,
+            'activity_type': self.activity_type,
+            'timestamp': self.timestamp,
+            'workflow_id': self.workflow_id,
+            'task_id': self.task_id,
+            'agent_id': self.agent_id,
+            'title': self.title,
+            'description': self.description,
+            'data': self.data,
+            'severity': self.severity,
+            'tags': self.tags,
+        }
     
     def to_json_serializable(self) -> Dict[str, Any]:
         """Convert to JSON-serializable format"""
@@ -87,17 +124,35 @@ class ActivityFeed:
     def __init__(self, max_activities: int = 1000):
         self.max_activities = max_activities
         self.activities: deque = deque(maxlen=max_activities)
-        self.subscribers: List[Callable[[Activity], None]] = []
+        # Copy-on-write subscriber tuple: mutations swap in a new tuple
+        # under the lock, so fan-out can read the reference lock-free
+        self.subscribers: tuple = ()
         self._lock = threading.Lock()
-        self._activity_counter = 0
-        
+
+        # Subscriber fan-out runs on a background drain thread so producers
+        # never stall on slow callbacks; started lazily on first subscribe
+        self._notify_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._notify_thread: Optional[threading.Thread] = None
+        # itertools.count.__next__ is C-level and atomic under the GIL,
+        # so ID generation needs no lock
+        self._counter = itertools.count(1).__next__
+
+        # Secondary indexes (activity references, not copies) so filtered
+        # queries read O(limit) instead of scanning the whole buffer
+        index_factory = lambda: deque(maxlen=max_activities)
+        self._by_workflow: Dict[str, deque] = defaultdict(index_factory)
+        self._by_type: Dict[str, deque] = defaultdict(index_factory)
+        self._by_severity: Dict[str, deque] = defaultdict(index_factory)
+
+        # get_recent results memoized per limit until the next append,
+        # so idle pollers don't re-slice the buffer every tick
+        self._recent_cache: Dict[int, List[Activity]] = {}
+
         logger.info(f"ActivityFeed initialized (max={max_activities})")
-    
+
     def _generate_activity_id(self) -> str:
         """Generate unique activity ID"""
-        with self._lock:
-            self._activity_counter += 1
-            return f"activity-{self._activity_counter}"
+        return f"activity-{self._counter()}"
     
     def add_activity(
         self,
@@ -111,9 +166,11 @@ class ActivityFeed:
         tags: Optional[List[str]] = None
     ) -> Activity:
         """Add a new activity to the feed"""
+        # Counter is lock-free (C-level count), so the only lock taken on
+        # this path is the single append+index critical section below
         activity = Activity(
-            activity_id=self._generate_activity_id(),
-            activity_type=activity_type,
+            activity_id=f"activity-{self._counter()}",
+            activity_type=activity_type.value if isinstance(activity_type, ActivityType) else activity_type,
             title=title,
             description=description,
             workflow_id=workflow_id,
@@ -125,7 +182,12 @@ class ActivityFeed:
         
         with self._lock:
             self.activities.append(activity)
-        
+            self._recent_cache = {}
+            if activity.workflow_id is not None:
+                self._by_workflow[activity.workflow_id].append(activity)
+            self._by_type[activity.activity_type].append(activity)
+            self._by_severity[activity.severity].append(activity)
+
         # Notify subscribers
         self._notify_subscribers(activity)
         
@@ -133,74 +195,106 @@ class ActivityFeed:
         return activity
     
     def _notify_subscribers(self, activity: Activity):
-        """Notify all subscribers of new activity"""
-        for subscriber in self.subscribers:
-            try:
-                subscriber(activity)
-            except Exception as e:
-                logger.error(f"Subscriber notification failed: {e}")
-    
+        """Queue activity for the background fan-out thread (O(1), lock-free)"""
+        if self.subscribers:
+            self._notify_queue.put(activity)
+
+    def _notify_loop(self):
+        """Drain the notify queue and fan out to subscribers"""
+        while True:
+            activity = self._notify_queue.get()
+            for subscriber in self.subscribers:
+                try:
+                    subscriber(activity)
+                except Exception as e:
+                    logger.error(f"Subscriber notification failed: {e}")
+
     def subscribe(self, callback: Callable[[Activity], None]):
         """Subscribe to activity feed"""
         with self._lock:
-            self.subscribers.append(callback)
+            self.subscribers = self.subscribers + (callback,)
+            if self._notify_thread is None:
+                self._notify_thread = threading.Thread(
+                    target=self._notify_loop,
+                    name="activity-feed-notify",
+                    daemon=True
+                )
+                self._notify_thread.start()
         logger.debug(f"Subscriber added (total: {len(self.subscribers)})")
-    
+
     def unsubscribe(self, callback: Callable[[Activity], None]):
         """Unsubscribe from activity feed"""
         with self._lock:
-            if callback in self.subscribers:
-                self.subscribers.remove(callback)
+            self.subscribers = tuple(s for s in self.subscribers if s is not callback)
         logger.debug(f"Subscriber removed (total: {len(self.subscribers)})")
     
     def get_recent(self, limit: int = 50) -> List[Activity]:
-        """Get recent activities"""
+        """Get recent activities (most recent first)"""
+        # reversed(deque) is an O(1) iterator and islice bounds the copy,
+        # so this allocates one list of min(limit, len) instead of three.
+        # Results are memoized per limit until the next append.
         with self._lock:
-            activities = list(self.activities)
-        
-        # Return most recent first
-        return list(reversed(activities[-limit:]))
-    
+            cached = self._recent_cache.get(limit)
+            if cached is None:
+                cached = self._recent_cache[limit] = list(
+                    itertools.islice(reversed(self.activities), limit)
+                )
+            return list(cached)
+
     def get_for_workflow(self, workflow_id: str, limit: int = 100) -> List[Activity]:
         """Get activities for a specific workflow"""
         with self._lock:
-            activities = [
-                a for a in self.activities
-                if a.workflow_id == workflow_id
-            ]
-        
-        return list(reversed(activities[-limit:]))
-    
+            index = self._by_workflow.get(workflow_id, ())
+            return list(itertools.islice(reversed(index), limit))
+
     def get_by_type(self, activity_type: ActivityType, limit: int = 50) -> List[Activity]:
         """Get activities by type"""
+        key = activity_type.value if isinstance(activity_type, ActivityType) else activity_type
         with self._lock:
-            activities = [
-                a for a in self.activities
-                if a.activity_type == activity_type
-            ]
-        
-        return list(reversed(activities[-limit:]))
-    
+            index = self._by_type.get(key, ())
+            return list(itertools.islice(reversed(index), limit))
+
     def get_errors(self, limit: int = 50) -> List[Activity]:
         """Get error activities"""
         with self._lock:
-            activities = [
-                a for a in self.activities
-                if a.severity == "error"
-            ]
-        
-        return list(reversed(activities[-limit:]))
-    
+            index = self._by_severity.get("error", ())
+            return list(itertools.islice(reversed(index), limit))
+
     def clear(self):
         """Clear all activities"""
         with self._lock:
             self.activities.clear()
+            self._by_workflow.clear()
+            self._by_type.clear()
+            self._by_severity.clear()
+            self._recent_cache = {}
         logger.info("Activity feed cleared")
     
     def export(self, limit: Optional[int] = None) -> List[Dict]:
         """Export activities as JSON-serializable dicts"""
-        activities = self.get_recent(limit or len(self.activities))
-        return [a.to_dict() for a in activities]
+        with self._lock:
+            activities = list(self.activities)
+        if limit:
+            activities = activities[-limit:]
+
+        # Inline dict literal in a single comprehension: no per-activity
+        # method dispatch or asdict copies on bulk export
+        return [
+            {
+                'activity_id': a.activity_id,
+                'activity_type': a.activity_type,
+                'timestamp': a.timestamp,
+                'workflow_id': a.workflow_id,
+                'task_id': a.task_id,
+                'agent_id': a.agent_id,
+                'title': a.title,
+                'description': a.description,
+                'data': a.data,
+                'severity': a.severity,
+                'tags': a.tags,
+            }
+            for a in reversed(activities)
+        ]
 
 
 class WorkflowActivityTracker:
@@ -5,12 +5,17 @@ Captures reasoning traces, token usage, and performance metrics for LLM calls.
 """
 
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
+import time
+import numpy as np
+import orjson
 from loguru import logger
 
+from src.observability._agg_kernels import workflow_agg
+
 
 class LLMProvider(str, Enum):
     """LLM provider types"""
@@ -20,7 +25,18 @@ class LLMProvider(str, Enum):
     LOCAL = "local"
 
 
-@dataclass
+# Default $/1K-token rates, built once at import. Trackers copy this so
+# per-instance overrides stay possible; rates are snapshotted into the
+# per-model cost column the first time a model is seen.
+DEFAULT_COST_PER_1K_TOKENS = {
+    "mistral-7b-ov": 0.0,  # Free/local
+    "gpt-3.5-turbo": 0.002,
+    "gpt-4": 0.03,
+    "claude-3-sonnet": 0.015
+}
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage tracking"""
     input_tokens: int = 0
@@ -32,7 +48,7 @@ class TokenUsage:
             self.total_tokens = self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCall:
     """Single LLM call record"""
     call_id: str
@@ -66,19 +82,50 @@ class LLMCall:
     def calculate_duration(self):
         """Calculate duration if both timestamps available"""
         if self.completed_at and self.started_at:
-            self.duration_ms = int((self.completed_at - self.started_at).total_seconds() * 1000)
+            # Integer-only: timedelta components are ints, so this skips
+            # the total_seconds() float multiply and truncation
+            delta = self.completed_at - self.started_at
+            self.duration_ms = (
+                (delta.days * 86_400 + delta.seconds) * 1000
+                + delta.microseconds // 1000
+            )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = asdict(self)
-        data['provider'] = self.provider.value
-        data['started_at'] = self.started_at.isoformat()
-        if self.completed_at:
-            data['completed_at'] = self.completed_at.isoformat()
-        return data
+        """
+        Convert to dictionary.
+
+        Built as an explicit literal rather than asdict(), which would
+        recursively deep-copy the prompt/response strings and metadata on
+        every export. The returned dict shares metadata with the record —
+        treat it as read-only.
+        """
+        tokens = self.tokens
+        return {
+            "call_id": self.call_id,
+            "workflow_id": self.workflow_id,
+            "task_id": self.task_id,
+            "model": self.model,
+            "provider": self.provider.value,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_ms": self.duration_ms,
+            "prompt": self.prompt,
+            "response": self.response,
+            "system_prompt": self.system_prompt,
+            "tokens": {
+                "input_tokens": tokens.input_tokens,
+                "output_tokens": tokens.output_tokens,
+                "total_tokens": tokens.total_tokens,
+            },
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "top_p": self.top_p,
+            "metadata": self.metadata,
+            "error": self.error,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningTrace:
     """LLM reasoning trace for explainability"""
     trace_id: str
@@ -86,9 +133,11 @@ class ReasoningTrace:
     workflow_id: str
     task_id: str
     
-    # Reasoning steps
+    # Reasoning steps. intermediate_steps holds raw
+    # (step_no, description, data, time_ns) tuples; they are shaped into
+    # dicts only at export so hot-loop appends stay allocation-light.
     thought_process: List[str] = field(default_factory=list)
-    intermediate_steps: List[Dict[str, Any]] = field(default_factory=list)
+    intermediate_steps: List[tuple] = field(default_factory=list)
     final_reasoning: str = ""
     
     # Metadata
@@ -99,12 +148,9 @@ class ReasoningTrace:
         """Add reasoning step"""
         self.thought_process.append(description)
         if data:
-            self.intermediate_steps.append({
-                "step": len(self.thought_process),
-                "description": description,
-                "data": data,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            self.intermediate_steps.append(
+                (len(self.thought_process), description, data, time.time_ns())
+            )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -114,13 +160,50 @@ class ReasoningTrace:
             "workflow_id": self.workflow_id,
             "task_id": self.task_id,
             "thought_process": self.thought_process,
-            "intermediate_steps": self.intermediate_steps,
+            "intermediate_steps": [
+                {
+                    "step": step,
+                    "description": description,
+                    "data": data,
+                    "timestamp": datetime.utcfromtimestamp(ts_ns / 1e9).isoformat()
+                }
+                for step, description, data, ts_ns in self.intermediate_steps
+            ],
             "final_reasoning": self.final_reasoning,
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata
         }
 
 
+class StringInterner:
+    """
+    Dictionary-encodes repeated strings (models, workflow ids) as dense
+    int ids. Rows store 4-byte ids instead of full strings, and lookups
+    against the columns become integer compares.
+    """
+
+    __slots__ = ("_ids", "strings")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, s: str) -> int:
+        """Return the id for s, registering it if unseen"""
+        idx = self._ids.get(s)
+        if idx is None:
+            idx = self._ids[s] = len(self.strings)
+            self.strings.append(s)
+        return idx
+
+    def get(self, s: str) -> Optional[int]:
+        """Return the id for s, or None if never interned"""
+        return self._ids.get(s)
+
+
 class LLMInsightsTracker:
     """
     Tracks LLM calls and reasoning for analytics and debugging.
@@ -132,45 +215,171 @@ class LLMInsightsTracker:
     - Error patterns
     """
     
-    def __init__(self):
+    _INITIAL_CAPACITY = 256
+
+    # Default retained window: oldest records beyond this are evicted
+    # (and handed to overflow_writer when one is configured) so a
+    # long-running service holds bounded memory
+    _DEFAULT_MAX_CALLS = 100_000
+
+    def __init__(self, max_calls: int = _DEFAULT_MAX_CALLS,
+                 overflow_writer: Optional[Any] = None):
         self.llm_calls: Dict[str, LLMCall] = {}
         self.reasoning_traces: Dict[str, ReasoningTrace] = {}
-        
+        self._capacity = max_calls
+        self._overflow_writer = overflow_writer
+
         # Aggregated stats
         self.total_calls = 0
         self.total_tokens = 0
-        self.total_cost_usd = 0.0
-        
+
         # Cost per 1K tokens (can be configured)
-        self.cost_per_1k_tokens = {
-            "mistral-7b-ov": 0.0,  # Free/local
-            "gpt-3.5-turbo": 0.002,
-            "gpt-4": 0.03,
-            "claude-3-sonnet": 0.015
-        }
-        
+        self.cost_per_1k_tokens = dict(DEFAULT_COST_PER_1K_TOKENS)
+
+        # Columnar (SoA) mirror of the numeric call fields. The analytics
+        # methods only aggregate tokens/duration/model/error, so keeping
+        # those as parallel NumPy columns lets them run as vectorized
+        # array ops instead of scanning every LLMCall object.
+        self._init_columns()
+
+        # Write counter; get_global_analytics memoizes against it so
+        # pollers only pay the aggregation when a call has been tracked
+        self._version = 0
+        self._analytics_version = -1
+        self._analytics: Optional[Dict[str, Any]] = None
+
         logger.info("LLMInsightsTracker initialized")
-    
+
+    def _init_columns(self):
+        """Allocate the columnar buffers (geometric growth on append)"""
+        capacity = min(self._INITIAL_CAPACITY, self._capacity)
+        self._n = 0
+        self._seq = 0
+        self._col_input_tokens = np.zeros(capacity, dtype=np.int64)
+        self._col_output_tokens = np.zeros(capacity, dtype=np.int64)
+        self._col_total_tokens = np.zeros(capacity, dtype=np.int64)
+        self._col_duration_ms = np.zeros(capacity, dtype=np.int64)
+        self._col_error = np.zeros(capacity, dtype=np.bool_)
+        self._col_model_id = np.zeros(capacity, dtype=np.int32)
+        self._col_workflow_id = np.zeros(capacity, dtype=np.int32)
+
+        # String interning: model/workflow names to small integer ids
+        self._models = StringInterner()
+        self._workflows = StringInterner()
+        self._call_index: Dict[str, int] = {}
+        self._row_call_ids: List[str] = []
+
+        # $/1K-token rate per interned model id; unknown models get 0.0,
+        # so costing is a branch-free gather+multiply over the columns
+        self._cost_table = np.zeros(0, dtype=np.float64)
+
+        # Running per-model accumulators over the retained window,
+        # indexed by interned model id and adjusted on eviction: global
+        # analytics read these in O(#models) instead of scanning columns
+        self._model_calls: List[int] = []
+        self._model_tokens: List[int] = []
+        self._model_duration_ms: List[int] = []
+        self._model_errors: List[int] = []
+        self._window_cost = 0.0
+
+        # Memoized workflow analytics: dashboards poll the same workflow
+        # repeatedly while nothing changed. Keyed on the per-workflow
+        # insert count plus the global sequence once the window wraps
+        # (any eviction can change another workflow's stats).
+        self._wf_call_count: Dict[int, int] = {}
+        self._analytics_cache: Dict[str, tuple] = {}
+
+    def _grow_columns(self):
+        """Double column capacity (never past the retained-window size)"""
+        new_capacity = min(len(self._col_total_tokens) * 2, self._capacity)
+        for attr in ('_col_input_tokens', '_col_output_tokens', '_col_total_tokens',
+                     '_col_duration_ms', '_col_error', '_col_model_id', '_col_workflow_id'):
+            old = getattr(self, attr)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, attr, new)
+
+    @property
+    def total_cost_usd(self) -> float:
+        """Estimated cost over the retained window (running aggregate)"""
+        return self._window_cost
+
     def track_call(self, llm_call: LLMCall):
-        """Track an LLM call"""
+        """Track an LLM call (evicting the oldest once the window is full)"""
         self.llm_calls[llm_call.call_id] = llm_call
-        
-        # Update aggregated stats
+        self._version += 1
+
+        # Update aggregated stats (cost is derived lazily from the columns)
         self.total_calls += 1
         self.total_tokens += llm_call.tokens.total_tokens
-        
-        # Estimate cost
         model_name = llm_call.model
-        if model_name in self.cost_per_1k_tokens:
-            cost_per_1k = self.cost_per_1k_tokens[model_name]
-            call_cost = (llm_call.tokens.total_tokens / 1000.0) * cost_per_1k
-            self.total_cost_usd += call_cost
-        
+
+        # Ring-buffer slot: rows wrap once the window is full, and the
+        # record previously in the slot is exactly the oldest one
+        if self._seq < self._capacity:
+            if self._n >= len(self._col_total_tokens):
+                self._grow_columns()
+            i = self._seq
+        else:
+            i = self._seq % self._capacity
+            evicted_id = self._row_call_ids[i]
+            evicted = self.llm_calls.pop(evicted_id, None)
+            self._call_index.pop(evicted_id, None)
+            # Back the evicted row's contribution out of the running
+            # per-model aggregates before its slot is overwritten
+            old_model = int(self._col_model_id[i])
+            old_tokens = int(self._col_total_tokens[i])
+            self._model_calls[old_model] -= 1
+            self._model_tokens[old_model] -= old_tokens
+            self._model_duration_ms[old_model] -= int(self._col_duration_ms[i])
+            self._model_errors[old_model] -= int(self._col_error[i])
+            self._window_cost -= self._cost_table[old_model] * old_tokens / 1000.0
+            if evicted is not None and self._overflow_writer is not None:
+                try:
+                    self._overflow_writer(evicted)
+                except Exception as e:
+                    logger.error(f"Overflow writer failed for {evicted_id}: {e}")
+        tokens = llm_call.tokens
+        self._col_input_tokens[i] = tokens.input_tokens
+        self._col_output_tokens[i] = tokens.output_tokens
+        self._col_total_tokens[i] = tokens.total_tokens
+        self._col_duration_ms[i] = llm_call.duration_ms or 0
+        self._col_error[i] = llm_call.error is not None
+        model_id = self._models.intern(model_name)
+        if model_id == len(self._cost_table):
+            self._cost_table = np.append(
+                self._cost_table, self.cost_per_1k_tokens.get(model_name, 0.0)
+            )
+            self._model_calls.append(0)
+            self._model_tokens.append(0)
+            self._model_duration_ms.append(0)
+            self._model_errors.append(0)
+        self._model_calls[model_id] += 1
+        self._model_tokens[model_id] += tokens.total_tokens
+        self._model_duration_ms[model_id] += llm_call.duration_ms or 0
+        self._model_errors[model_id] += llm_call.error is not None
+        self._window_cost += self._cost_table[model_id] * tokens.total_tokens / 1000.0
+        self._col_model_id[i] = model_id
+        wf_id = self._workflows.intern(llm_call.workflow_id)
+        self._col_workflow_id[i] = wf_id
+        self._wf_call_count[wf_id] = self._wf_call_count.get(wf_id, 0) + 1
+        self._call_index[llm_call.call_id] = i
+        if i == len(self._row_call_ids):
+            self._row_call_ids.append(llm_call.call_id)
+        else:
+            self._row_call_ids[i] = llm_call.call_id
+        self._seq += 1
+        self._n = min(self._seq, self._capacity)
+
         logger.debug(f"Tracked LLM call: {llm_call.call_id} ({llm_call.tokens.total_tokens} tokens)")
     
     def track_reasoning(self, trace: ReasoningTrace):
-        """Track a reasoning trace"""
+        """Track a reasoning trace (FIFO-bounded like the call window)"""
         self.reasoning_traces[trace.trace_id] = trace
+        self._version += 1
+        if len(self.reasoning_traces) > self._capacity:
+            oldest_id = next(iter(self.reasoning_traces))
+            del self.reasoning_traces[oldest_id]
         logger.debug(f"Tracked reasoning trace: {trace.trace_id}")
     
     def get_call(self, call_id: str) -> Optional[LLMCall]:
@@ -178,81 +387,107 @@ class LLMInsightsTracker:
         return self.llm_calls.get(call_id)
     
     def get_calls_for_workflow(self, workflow_id: str) -> List[LLMCall]:
-        """Get all LLM calls for a workflow"""
-        return [
-            call for call in self.llm_calls.values()
-            if call.workflow_id == workflow_id
-        ]
+        """Get all LLM calls for a workflow (integer-compare column scan)"""
+        wf_id = self._workflows.get(workflow_id)
+        if wf_id is None:
+            return []
+        rows = np.nonzero(self._col_workflow_id[:self._n] == wf_id)[0]
+        return [self.llm_calls[self._row_call_ids[r]] for r in rows]
     
     def get_reasoning_trace(self, trace_id: str) -> Optional[ReasoningTrace]:
         """Get specific reasoning trace"""
         return self.reasoning_traces.get(trace_id)
     
+    _ANALYTICS_CACHE_SIZE = 256
+
     def get_workflow_analytics(self, workflow_id: str) -> Dict[str, Any]:
-        """Get analytics for a specific workflow"""
-        calls = self.get_calls_for_workflow(workflow_id)
-        
-        if not calls:
+        """Get analytics for a specific workflow (vectorized column scan)"""
+        wf_id = self._workflows.get(workflow_id)
+        if wf_id is None:
             return {"error": "No LLM calls found for workflow"}
-        
-        total_tokens = sum(call.tokens.total_tokens for call in calls)
-        avg_duration = sum(call.duration_ms or 0 for call in calls) / len(calls)
-        
-        # Token breakdown
-        input_tokens = sum(call.tokens.input_tokens for call in calls)
-        output_tokens = sum(call.tokens.output_tokens for call in calls)
-        
-        # Model distribution
-        models = {}
-        for call in calls:
-            models[call.model] = models.get(call.model, 0) + 1
-        
-        return {
+
+        # Cache hit: same insert count (and same window state once the
+        # ring has wrapped) means the result cannot have changed
+        version = (
+            self._wf_call_count.get(wf_id, 0),
+            self._seq if self._seq > self._capacity else 0,
+        )
+        cached = self._analytics_cache.get(workflow_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        n = self._n
+        rows = np.flatnonzero(self._col_workflow_id[:n] == wf_id)
+        count = len(rows)
+        if count == 0:
+            return {"error": "No LLM calls found for workflow"}
+
+        # Fused single-pass kernel: all sums plus the model histogram in
+        # one scan over the selected rows
+        tok, inp, out, dur, err, model_counts = workflow_agg(
+            rows,
+            self._col_total_tokens,
+            self._col_input_tokens,
+            self._col_output_tokens,
+            self._col_duration_ms.astype(np.float64),
+            self._col_model_id,
+            self._col_error,
+            len(self._models),
+        )
+        models = {
+            self._models.strings[i]: int(c)
+            for i, c in enumerate(model_counts) if c
+        }
+
+        result = {
             "workflow_id": workflow_id,
-            "total_calls": len(calls),
-            "total_tokens": total_tokens,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "avg_duration_ms": avg_duration,
+            "total_calls": count,
+            "total_tokens": int(tok),
+            "input_tokens": int(inp),
+            "output_tokens": int(out),
+            "avg_duration_ms": float(dur) / count,
             "models_used": models,
-            "errors": len([c for c in calls if c.error])
+            "errors": int(err)
         }
-    
+
+        if len(self._analytics_cache) >= self._ANALYTICS_CACHE_SIZE:
+            self._analytics_cache.pop(next(iter(self._analytics_cache)))
+        self._analytics_cache[workflow_id] = (version, result)
+        return result
+
     def get_global_analytics(self) -> Dict[str, Any]:
-        """Get global LLM analytics"""
+        """
+        Get global LLM analytics (vectorized per-model aggregation).
+
+        Memoized against the write version: repeated polls with no new
+        calls return the same dict, so treat it as read-only.
+        """
         if not self.llm_calls:
             return {"total_calls": 0, "total_tokens": 0}
-        
-        # Model performance
-        model_stats = {}
-        for call in self.llm_calls.values():
-            if call.model not in model_stats:
-                model_stats[call.model] = {
-                    "calls": 0,
-                    "tokens": 0,
-                    "avg_duration_ms": 0,
-                    "errors": 0
-                }
-            
-            stats = model_stats[call.model]
-            stats["calls"] += 1
-            stats["tokens"] += call.tokens.total_tokens
-            stats["avg_duration_ms"] += call.duration_ms or 0
-            if call.error:
-                stats["errors"] += 1
-        
-        # Calculate averages
-        for model, stats in model_stats.items():
-            if stats["calls"] > 0:
-                stats["avg_duration_ms"] /= stats["calls"]
-        
-        return {
+        if self._analytics is not None and self._analytics_version == self._version:
+            return self._analytics
+
+        # Per-model stats come straight from the running accumulators
+        # maintained by track_call: O(#models), no column scan
+        model_stats = {
+            self._models.strings[i]: {
+                "calls": calls,
+                "tokens": self._model_tokens[i],
+                "avg_duration_ms": self._model_duration_ms[i] / calls,
+                "errors": self._model_errors[i]
+            }
+            for i, calls in enumerate(self._model_calls) if calls
+        }
+
+        self._analytics_version = self._version
+        self._analytics = {
             "total_calls": self.total_calls,
             "total_tokens": self.total_tokens,
             "estimated_cost_usd": round(self.total_cost_usd, 4),
             "model_stats": model_stats,
             "total_reasoning_traces": len(self.reasoning_traces)
         }
+        return self._analytics
     
     def export_traces(self, workflow_id: Optional[str] = None) -> List[Dict]:
         """Export reasoning traces"""
@@ -269,17 +504,42 @@ class LLMInsightsTracker:
         
         if workflow_id:
             calls = [c for c in calls if c.workflow_id == workflow_id]
-        
+
         return [call.to_dict() for call in calls]
-    
+
+    def export_calls_json(self, workflow_id: Optional[str] = None) -> bytes:
+        """Export LLM calls as one orjson-encoded JSON array (bytes)"""
+        return orjson.dumps(
+            self.export_calls(workflow_id), option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    def export_traces_json(self, workflow_id: Optional[str] = None) -> bytes:
+        """Export reasoning traces as one orjson-encoded JSON array (bytes)"""
+        return orjson.dumps(
+            self.export_traces(workflow_id), option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    def iter_export_calls(self, workflow_id: Optional[str] = None):
+        """
+        Stream LLM calls as serialized JSON lines (bytes).
+
+        Yields one orjson-encoded row per call without materializing the
+        full export list — preferred over export_calls for large dumps.
+        """
+        for call in self.llm_calls.values():
+            if workflow_id and call.workflow_id != workflow_id:
+                continue
+            yield orjson.dumps(call.to_dict())
+
     def reset(self):
         """Reset all tracking data"""
         self.llm_calls.clear()
         self.reasoning_traces.clear()
         self.total_calls = 0
         self.total_tokens = 0
-        self.total_cost_usd = 0.0
-        
+        self._init_columns()
+        self._version += 1
+
         logger.info("LLM insights tracker reset")
 
 
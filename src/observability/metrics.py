@@ -7,9 +7,10 @@ Provides Prometheus-compatible metrics for workflows, tasks, and LLM calls.
 from typing import Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime
-from collections import defaultdict
+import array
 import threading
+import time
+import numpy as np
 from loguru import logger
 
 
@@ -21,7 +22,7 @@ class MetricType(str, Enum):
     SUMMARY = "summary"
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """Base metric class"""
     name: str
@@ -29,7 +30,9 @@ class Metric:
     description: str
     labels: Dict[str, str] = field(default_factory=dict)
     value: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Epoch nanoseconds: ~10x cheaper to capture than datetime.utcnow()
+    # and allocation-free on the inc_counter/set_gauge hot path
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
 
 class MetricsCollector:
@@ -39,13 +42,57 @@ class MetricsCollector:
     Thread-safe metrics collection for workflows, tasks, and LLM operations.
     """
     
+    # Fixed ring-buffer capacity per histogram: bounded memory, no list
+    # reallocs, and contiguous float64 storage for percentile math
+    _HISTOGRAM_CAPACITY = 4096
+
     def __init__(self):
         self._metrics: Dict[str, Metric] = {}
-        self._counters: Dict[str, float] = defaultdict(float)
+        # Counter plane: values live in one contiguous array.array buffer
+        # and each key resolves to a fixed slot, so a bump is a C-level
+        # add instead of a dict-of-floats update. 'd' keeps the float
+        # value semantics of inc_counter.
+        self._counter_idx: Dict[str, int] = {}
+        self._counter_buf = array.array('d')
+        self._slot_keys: list = []
+        self._slot_metrics: list = []
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, list] = defaultdict(list)
+        # name -> [buffer, total observation count]; the buffer wraps, the
+        # count keeps growing so callers can tell how much is valid
+        self._histograms: Dict[str, list] = {}
         self._lock = threading.Lock()
-        
+
+        # Per-thread counter shards: bumps accumulate into the calling
+        # thread's own {slot: delta} dict (its lock is uncontended except
+        # during a scrape) and are summed into the counter plane lazily
+        # when metrics are read
+        self._local = threading.local()
+        self._shards: list = []
+
+        # Per-key Prometheus render cache: headers and value-line prefixes
+        # are prebuilt at registration; only metrics touched since the last
+        # scrape are re-rendered (O(dirty) scrape instead of O(all))
+        self._prom_header: Dict[str, str] = {}
+        self._prom_prefix: Dict[str, str] = {}
+        self._rendered: Dict[str, str] = {}
+        self._dirty: set = set()
+
+        # Memoized (name, labels) -> key strings; label combinations are
+        # almost always reused, so the sort+join runs once per combination
+        self._key_cache: Dict[tuple, str] = {}
+
+        # Per-metric generated label formatters (see labels_schema): each
+        # formats a value tuple straight into the key string with no dict,
+        # no sorting, no iteration
+        self._format_fn: Dict[str, Any] = {}
+
+        # Change counter bumped on every write; get_summary memoizes its
+        # result against it so idle pollers (monitor watch loops) pay
+        # nothing when no metric has moved
+        self._version = 0
+        self._summary_version = -1
+        self._summary: Optional[Dict[str, Any]] = None
+
         logger.info("MetricsCollector initialized")
         
         # Initialize standard metrics
@@ -74,114 +121,304 @@ class MetricsCollector:
         
         logger.debug("Standard metrics initialized")
     
-    def register_counter(self, name: str, description: str, labels: Optional[Dict] = None):
-        """Register a counter metric"""
+    def _register(self, name: str, metric_type: MetricType, description: str,
+                  labels: Optional[Dict]):
+        """Register a metric and prebuild its Prometheus render fragments"""
+        labels = labels or {}
         with self._lock:
-            key = self._get_metric_key(name, labels or {})
+            key = self._get_metric_key(name, labels)
             self._metrics[key] = Metric(
                 name=name,
-                metric_type=MetricType.COUNTER,
+                metric_type=metric_type,
                 description=description,
-                labels=labels or {}
+                labels=labels
             )
-    
+            self._prom_header[key] = (
+                f"# HELP {name} {description}\n# TYPE {name} {metric_type.value}"
+            )
+            if labels:
+                label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                self._prom_prefix[key] = f"{name}{{{label_str}}} "
+            else:
+                self._prom_prefix[key] = f"{name} "
+            self._dirty.add(key)
+            self._version += 1
+            if metric_type is MetricType.COUNTER:
+                self._counter_slot(key)
+
+    def _counter_slot(self, key: str) -> int:
+        """Resolve a counter key to its buffer slot, allocating on miss"""
+        idx = self._counter_idx.get(key)
+        if idx is None:
+            idx = self._counter_idx[key] = len(self._counter_buf)
+            self._counter_buf.append(0.0)
+            self._slot_keys.append(key)
+            self._slot_metrics.append(self._metrics.get(key))
+        else:
+            self._slot_metrics[idx] = self._metrics.get(key)
+        return idx
+
+    def _compile_label_formatter(self, name: str, labels_schema) -> None:
+        """
+        Generate a specialized key formatter for a known label schema.
+
+        The generated function takes a value tuple in schema order and
+        assembles the key with label keys pre-sorted at compile time, so
+        the per-call cost is a single f-string evaluation.
+        """
+        order = sorted(range(len(labels_schema)), key=labels_schema.__getitem__)
+        parts = ",".join(f"{labels_schema[i]}={{v[{i}]}}" for i in order)
+        src = f"def _fmt(v):\n    return f'{name}{{{{{parts}}}}}'\n"
+        namespace: Dict[str, Any] = {}
+        exec(src, namespace)
+        self._format_fn[name] = namespace["_fmt"]
+
+    def register_counter(self, name: str, description: str, labels: Optional[Dict] = None,
+                         labels_schema: Optional[list] = None):
+        """
+        Register a counter metric.
+
+        When labels_schema names the label keys this counter will be
+        bumped with, a specialized formatter is generated so callers can
+        use inc_counter_fast with a plain value tuple.
+        """
+        self._register(name, MetricType.COUNTER, description, labels)
+        if labels_schema:
+            self._compile_label_formatter(name, list(labels_schema))
+
+    def inc_counter_fast(self, name: str, label_values: tuple, value: float = 1.0):
+        """Increment a counter using a pre-registered label schema"""
+        key = self._format_fn[name](label_values)
+        idx = self._counter_idx.get(key)
+        if idx is None:
+            with self._lock:
+                idx = self._counter_slot(key)
+        self.inc_counter_by_handle(idx, value)
+
     def register_gauge(self, name: str, description: str, labels: Optional[Dict] = None):
         """Register a gauge metric"""
-        with self._lock:
-            key = self._get_metric_key(name, labels or {})
-            self._metrics[key] = Metric(
-                name=name,
-                metric_type=MetricType.GAUGE,
-                description=description,
-                labels=labels or {}
-            )
-    
+        self._register(name, MetricType.GAUGE, description, labels)
+
     def register_histogram(self, name: str, description: str, labels: Optional[Dict] = None):
         """Register a histogram metric"""
-        with self._lock:
-            key = self._get_metric_key(name, labels or {})
-            self._metrics[key] = Metric(
-                name=name,
-                metric_type=MetricType.HISTOGRAM,
-                description=description,
-                labels=labels or {}
-            )
+        self._register(name, MetricType.HISTOGRAM, description, labels)
     
     def _get_metric_key(self, name: str, labels: Dict[str, str]) -> str:
-        """Get unique key for metric with labels"""
+        """Get unique key for metric with labels (memoized per combination)"""
         if not labels:
             return name
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        cache_key = (name, frozenset(labels.items()))
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+            key = self._key_cache[cache_key] = f"{name}{{{label_str}}}"
+        return key
     
+    def counter_handle(self, name: str, labels: Optional[Dict] = None) -> int:
+        """
+        Resolve a (name, labels) pair to its opaque counter handle.
+
+        Callers on hot paths can resolve once and bump via
+        inc_counter_by_handle, skipping key construction per increment.
+        """
+        key = self._get_metric_key(name, labels or {})
+        with self._lock:
+            return self._counter_slot(key)
+
     def inc_counter(self, name: str, value: float = 1.0, labels: Optional[Dict] = None):
-        """Increment a counter"""
+        """Increment a counter (striped lock keyed on the metric name)"""
+        key = self._get_metric_key(name, labels or {})
+        idx = self._counter_idx.get(key)
+        if idx is None:
+            with self._lock:
+                idx = self._counter_slot(key)
+        self.inc_counter_by_handle(idx, value)
+
+    def _install_local_shard(self):
+        """Create and register this thread's counter shard"""
+        shard = ({}, threading.Lock())
+        self._local.shard = shard
         with self._lock:
-            key = self._get_metric_key(name, labels or {})
-            self._counters[key] += value
-            
-            if key in self._metrics:
-                self._metrics[key].value = self._counters[key]
-                self._metrics[key].timestamp = datetime.utcnow()
+            self._shards.append(shard)
+        return shard
+
+    def inc_counter_by_handle(self, idx: int, value: float = 1.0):
+        """Increment a counter by a handle from counter_handle"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._install_local_shard()
+        deltas, lock = shard
+        with lock:
+            deltas[idx] = deltas.get(idx, 0.0) + value
+
+    def _merge_shards(self):
+        """
+        Sum pending per-thread deltas into the counter plane.
+
+        Called under self._lock by the read-side methods; O(unique
+        metrics x threads) at scrape time instead of a lock per bump.
+        """
+        buf = self._counter_buf
+        now = time.time_ns()
+        for deltas, lock in self._shards:
+            if not deltas:
+                continue
+            with lock:
+                items = list(deltas.items())
+                deltas.clear()
+            if items:
+                self._version += 1
+            for idx, delta in items:
+                buf[idx] += delta
+                metric = self._slot_metrics[idx]
+                if metric is not None:
+                    metric.value = buf[idx]
+                    metric.timestamp_ns = now
+                    self._dirty.add(self._slot_keys[idx])
     
     def set_gauge(self, name: str, value: float, labels: Optional[Dict] = None):
         """Set a gauge value"""
         with self._lock:
             key = self._get_metric_key(name, labels or {})
             self._gauges[key] = value
+            self._version += 1
             
             if key in self._metrics:
                 self._metrics[key].value = value
-                self._metrics[key].timestamp = datetime.utcnow()
+                self._metrics[key].timestamp_ns = time.time_ns()
+                self._dirty.add(key)
     
     def observe_histogram(self, name: str, value: float, labels: Optional[Dict] = None):
-        """Observe a value in a histogram"""
+        """Observe a value in a histogram (O(1) write into a ring buffer)"""
+        with self._lock:
+            key = self._get_metric_key(name, labels or {})
+            entry = self._histograms.get(key)
+            if entry is None:
+                entry = self._histograms[key] = [
+                    np.empty(self._HISTOGRAM_CAPACITY, dtype=np.float64), 0
+                ]
+            buf, count = entry
+            buf[count % self._HISTOGRAM_CAPACITY] = value
+            entry[1] = count + 1
+            self._version += 1
+
+    def observe_histogram_batch(self, name: str, values, labels: Optional[Dict] = None):
+        """
+        Observe a batch of values in one call.
+
+        The whole batch lands in the ring buffer as at most two
+        vectorized slice writes, instead of a locked Python call per
+        sample — worthwhile for bursty recorders flushing N samples.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = values.size
+        if n == 0:
+            return
+        cap = self._HISTOGRAM_CAPACITY
         with self._lock:
             key = self._get_metric_key(name, labels or {})
-            self._histograms[key].append(value)
+            entry = self._histograms.get(key)
+            if entry is None:
+                entry = self._histograms[key] = [
+                    np.empty(cap, dtype=np.float64), 0
+                ]
+            buf, count = entry
+            if n >= cap:
+                # Only the newest window's worth survives anyway
+                buf[:] = values[-cap:]
+            else:
+                start = count % cap
+                end = start + n
+                if end <= cap:
+                    buf[start:end] = values
+                else:
+                    split = cap - start
+                    buf[start:] = values[:split]
+                    buf[:end - cap] = values[split:]
+            entry[1] = count + n
+            self._version += 1
+
+    def get_histogram_stats(self, name: str, labels: Optional[Dict] = None) -> Optional[Dict[str, float]]:
+        """Get count and p50/p95/p99 for a histogram's retained window"""
+        key = self._get_metric_key(name, labels or {})
+        with self._lock:
+            entry = self._histograms.get(key)
+            if entry is None or entry[1] == 0:
+                return None
+            buf, count = entry
+            window = buf[:min(count, self._HISTOGRAM_CAPACITY)].copy()
+
+        p50, p95, p99 = np.percentile(window, [50, 95, 99])
+        return {"count": count, "p50": float(p50), "p95": float(p95), "p99": float(p99)}
     
     def get_metric(self, name: str, labels: Optional[Dict] = None) -> Optional[Metric]:
         """Get a specific metric"""
         key = self._get_metric_key(name, labels or {})
-        return self._metrics.get(key)
-    
+        with self._lock:
+            self._merge_shards()
+            return self._metrics.get(key)
+
     def get_all_metrics(self) -> Dict[str, Metric]:
         """Get all collected metrics"""
         with self._lock:
+            self._merge_shards()
             return dict(self._metrics)
     
+    def _render_blocks(self) -> list:
+        """Snapshot the per-metric text blocks, re-rendering only dirty ones"""
+        with self._lock:
+            self._merge_shards()
+            rendered = self._rendered
+            # Re-render only metrics touched since the last scrape
+            dirty, self._dirty = self._dirty, set()
+            for key in dirty:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    rendered.pop(key, None)
+                    continue
+                rendered[key] = (
+                    f"{self._prom_header[key]}\n{self._prom_prefix[key]}{metric.value}\n"
+                )
+
+            return [rendered[key] for key in self._metrics]
+
+    def iter_prometheus(self):
+        """
+        Yield the Prometheus exposition one metric block at a time.
+
+        Scrape handlers can stream this (e.g. via StreamingResponse)
+        instead of buffering the whole payload; blocks are snapshotted
+        under the lock, so iteration itself never holds it.
+        """
+        first = True
+        for block in self._render_blocks():
+            yield block if first else "\n" + block
+            first = False
+
     def export_prometheus(self) -> str:
         """
         Export metrics in Prometheus text format.
-        
+
         Returns:
             Prometheus-formatted metrics string
         """
-        lines = []
-        
-        with self._lock:
-            for key, metric in self._metrics.items():
-                # Help text
-                lines.append(f"# HELP {metric.name} {metric.description}")
-                lines.append(f"# TYPE {metric.name} {metric.metric_type.value}")
-                
-                # Metric value
-                if metric.labels:
-                    label_str = ",".join(f'{k}="{v}"' for k, v in metric.labels.items())
-                    lines.append(f"{metric.name}{{{label_str}}} {metric.value}")
-                else:
-                    lines.append(f"{metric.name} {metric.value}")
-                
-                lines.append("")  # Blank line between metrics
-        
-        return "\n".join(lines)
+        return "\n".join(self._render_blocks())
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get metrics summary"""
+        """
+        Get metrics summary.
+
+        Memoized against the write version: repeated polls while nothing
+        changes return the same dict, so treat it as read-only.
+        """
         with self._lock:
-            return {
+            self._merge_shards()
+            if self._summary is not None and self._summary_version == self._version:
+                return self._summary
+            self._summary_version = self._version
+            self._summary = {
                 "total_metrics": len(self._metrics),
-                "counters": len(self._counters),
+                "counters": len(self._counter_idx),
                 "gauges": len(self._gauges),
                 "histograms": len(self._histograms),
                 "metrics": {
@@ -193,15 +430,26 @@ class MetricsCollector:
                     for name, metric in self._metrics.items()
                 }
             }
+            return self._summary
     
     def reset(self):
         """Reset all metrics (useful for testing)"""
         with self._lock:
-            self._counters.clear()
+            # Discard pending shard deltas and zero the counter plane in
+            # place; slot assignments stay stable so previously resolved
+            # handles remain valid
+            for deltas, lock in self._shards:
+                with lock:
+                    deltas.clear()
+            for i in range(len(self._counter_buf)):
+                self._counter_buf[i] = 0.0
             self._gauges.clear()
             self._histograms.clear()
-            self._init_standard_metrics()
-        
+            self._version += 1
+
+        # Re-register outside the lock: register_* acquires it themselves
+        self._init_standard_metrics()
+
         logger.info("Metrics reset")
 
 
@@ -225,19 +473,26 @@ class WorkflowMetrics:
     def __init__(self, workflow_id: str):
         self.workflow_id = workflow_id
         self.collector = get_metrics_collector()
-        self.start_time: Optional[datetime] = None
-    
+        self.start_ns: Optional[int] = None
+
+        # Handles for the fixed-label counters, resolved once per workflow.
+        # task_executed/llm_call labels vary per call (task_id, model), so
+        # those go through the memoized key cache instead.
+        wf_labels = {"workflow_id": workflow_id}
+        self._h_started = self.collector.counter_handle("workflows_started_total", wf_labels)
+        self._h_completed = self.collector.counter_handle("workflows_completed_total", wf_labels)
+
     def workflow_started(self):
         """Record workflow start"""
-        self.start_time = datetime.utcnow()
-        self.collector.inc_counter("workflows_started_total", labels={"workflow_id": self.workflow_id})
-    
+        self.start_ns = time.time_ns()
+        self.collector.inc_counter_by_handle(self._h_started)
+
     def workflow_completed(self):
         """Record workflow completion"""
-        self.collector.inc_counter("workflows_completed_total", labels={"workflow_id": self.workflow_id})
-        
-        if self.start_time:
-            duration = (datetime.utcnow() - self.start_time).total_seconds()
+        self.collector.inc_counter_by_handle(self._h_completed)
+
+        if self.start_ns:
+            duration = (time.time_ns() - self.start_ns) / 1e9
             self.collector.observe_histogram("workflow_duration_seconds", duration)
     
     def workflow_failed(self, error: str):
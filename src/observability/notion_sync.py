@@ -7,19 +7,158 @@ Automatically syncs workflows, executions, and results to Notion databases.
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncio
+import orjson
 from loguru import logger
 
-try:
-    from notion_client import AsyncClient
-    NOTION_AVAILABLE = True
-except ImportError:
-    NOTION_AVAILABLE = False
-    logger.warning("notion-client not installed. Notion sync will be disabled.")
-
 from src.core.config import get_settings
 from src.core.task import WorkflowDefinition, TaskResult, TaskStatus
 
 
+# notion_client (and the httpx/pydantic stack it pulls in) is imported
+# lazily on first enabled use: the common Notion-disabled case should
+# not pay its import cost on every process start.
+NOTION_AVAILABLE: Optional[bool] = None
+HTTPX_AVAILABLE = False
+AsyncClient = None
+httpx = None
+_OrjsonAsyncClient = None
+
+
+def _ensure_notion_import() -> bool:
+    """Import notion_client on first use, caching the verdict"""
+    global NOTION_AVAILABLE, HTTPX_AVAILABLE, AsyncClient, httpx, _OrjsonAsyncClient
+
+    if NOTION_AVAILABLE is not None:
+        return NOTION_AVAILABLE
+
+    try:
+        from notion_client import AsyncClient as _AsyncClient
+    except ImportError:
+        NOTION_AVAILABLE = False
+        logger.warning("notion-client not installed. Notion sync will be disabled.")
+        return False
+
+    AsyncClient = _AsyncClient
+    NOTION_AVAILABLE = True
+
+    try:
+        import httpx as _httpx
+    except ImportError:
+        return True
+    httpx = _httpx
+    HTTPX_AVAILABLE = True
+
+    class _OrjsonClient(_AsyncClient):
+        """
+        AsyncClient that serializes request bodies with orjson.
+
+        stdlib json dominates the cost of large pages.create /
+        children.append payloads; orjson is several times faster and
+        httpx takes the resulting bytes directly.
+        """
+
+        def _build_request(self, method, path, query=None, body=None, auth=None):
+            if body is None:
+                return super()._build_request(method, path, query, body, auth)
+            headers = _httpx.Headers()
+            if auth:
+                headers["Authorization"] = f"Bearer {auth}"
+            headers["Content-Type"] = "application/json"
+            return self.client.build_request(
+                method,
+                path,
+                params=query,
+                content=orjson.dumps(body),
+                headers=headers
+            )
+
+    _OrjsonAsyncClient = _OrjsonClient
+    return True
+
+
+# Status -> emoji, shared by the result formatters. str-mixin enum keys
+# also match the raw strings pydantic stores with use_enum_values.
+_STATUS_EMOJI = {
+    TaskStatus.SUCCESS: "✅",
+    TaskStatus.FAILED: "❌",
+    TaskStatus.PENDING: "⏳",
+    TaskStatus.RUNNING: "🔄",
+    TaskStatus.WAITING_HUMAN: "⏱️",
+    TaskStatus.CANCELLED: "⏭️"
+}
+
+
+# Block/property builders: the five sync methods all assemble the same
+# deeply nested Notion shapes, so build them in one place instead of
+# repeating the literals (and their allocations) inline.
+
+def _paragraph(text: str) -> Dict[str, Any]:
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    }
+
+
+def _heading2(text: str) -> Dict[str, Any]:
+    return {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    }
+
+
+def _title(text: str) -> Dict[str, Any]:
+    return {"title": [{"text": {"content": text}}]}
+
+
+def _rich(text: str) -> Dict[str, Any]:
+    return {"rich_text": [{"text": {"content": text}}]}
+
+
+def _select(name: str) -> Dict[str, Any]:
+    return {"select": {"name": name}}
+
+
+def _date(iso: str) -> Dict[str, Any]:
+    return {"date": {"start": iso}}
+
+
+def _number(n) -> Dict[str, Any]:
+    return {"number": n}
+
+
+class _TokenBucket:
+    """
+    Async token bucket used to self-pace Notion API calls.
+
+    Notion sustains ~3 req/s; bursting past that triggers 429s whose
+    Retry-After backoff costs far more than pacing up front.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping until one is available"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self.last:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1.0:
+                wait = (1.0 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+                self.last = loop.time()
+                self.tokens = 1.0
+            self.tokens -= 1.0
+
+
 class NotionSync:
     """
     Syncs workflow documentation to Notion.
@@ -31,39 +170,163 @@ class NotionSync:
     - Create audit trail in Notion
     """
     
+    # Notion allows at most 100 blocks per children.append request
+    _MAX_BLOCKS_PER_APPEND = 100
+    # Stay under Notion's 2000-char rich_text limit with headroom
+    _MAX_TEXT_PER_BLOCK = 1900
+    _FLUSH_INTERVAL = 0.5
+    _QUEUE_MAXSIZE = 1000
+
     def __init__(self):
         """Initialize Notion client"""
         self.settings = get_settings()
         self.notion_config = self.settings.notion
-        self.client: Optional[AsyncClient] = None
-        
-        if not NOTION_AVAILABLE:
-            logger.warning("Notion client not available - sync disabled")
-            return
-            
+        self.client: Optional[Any] = None
+
+        # Pending task-result blocks per page, flushed in batches so N
+        # task completions cost ~1 rate-limited request instead of N
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+
+        # workflow_id -> Notion page id, so retried/re-submitted
+        # workflows update their existing page instead of creating
+        # duplicates
+        self._page_cache: Dict[str, str] = {}
+
+        # Bounded work queue so sync calls never block the workflow
+        # executor on Notion round-trips; a single worker preserves the
+        # order updates were issued in. Created lazily like _flusher
+        # because __init__ may run outside an event loop.
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Shared limiter for every Notion request (3 req/s, burst 10)
+        self._limiter = _TokenBucket(rate=3.0, capacity=10)
+
+        # Single flag checked on the hot path instead of re-walking the
+        # pydantic settings chain on every sync call
+        self._enabled = False
+
+        # Config checks come first so the notion_client import is only
+        # paid when sync is actually enabled
         if not self.notion_config.enabled:
             logger.info("Notion sync disabled in configuration")
+            self._bind_noops()
             return
-            
+
         if not self.notion_config.api_key:
             logger.warning("Notion API key not configured")
+            self._bind_noops()
             return
-            
-        # Initialize Notion client
+
+        if not _ensure_notion_import():
+            logger.warning("Notion client not available - sync disabled")
+            self._bind_noops()
+            return
+
+        # Initialize Notion client. A single shared httpx session keeps
+        # the TCP+TLS connection pool alive across every sync call.
         try:
-            self.client = AsyncClient(auth=self.notion_config.api_key)
+            if HTTPX_AVAILABLE:
+                self.client = _OrjsonAsyncClient(
+                    auth=self.notion_config.api_key,
+                    client=httpx.AsyncClient(
+                        limits=httpx.Limits(
+                            max_keepalive_connections=20,
+                            max_connections=100
+                        )
+                    )
+                )
+            else:
+                self.client = AsyncClient(auth=self.notion_config.api_key)
             logger.info("Notion sync initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Notion client: {e}")
             self.client = None
-    
+
+        self._enabled = self.client is not None
+        if not self._enabled:
+            self._bind_noops()
+
+    def _bind_noops(self):
+        """Replace the sync methods with no-ops so disabled instances pay
+        nothing per call beyond an awaited stub."""
+        async def _noop(*args, **kwargs):
+            return None
+
+        self.sync_workflow_definition = _noop
+        self.sync_execution_start = _noop
+        self.update_execution_progress = _noop
+        self.sync_execution_complete = _noop
+        self.add_task_result = _noop
+        self.flush = _noop
+
+    def _ensure_worker(self):
+        """Start the background sync worker on first use"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._QUEUE_MAXSIZE)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._worker_loop())
+
+    async def _worker_loop(self):
+        """Drain the sync queue, resolving futures for calls that return"""
+        while True:
+            fn, args, future = await self._queue.get()
+            try:
+                result = await fn(*args)
+                if future is not None and not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                else:
+                    logger.error(f"Notion sync worker error: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, fn, *args, future: Optional[asyncio.Future] = None):
+        """Queue a sync operation, dropping the oldest entry on overflow"""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((fn, args, future))
+        except asyncio.QueueFull:
+            # Observability writes are best-effort: shed the oldest
+            try:
+                _, _, dropped = self._queue.get_nowait()
+                self._queue.task_done()
+                if dropped is not None and not dropped.done():
+                    dropped.set_result(None)
+            except asyncio.QueueEmpty:
+                pass
+            self._queue.put_nowait((fn, args, future))
+
+    async def aclose(self):
+        """Flush pending blocks and close the underlying HTTP session"""
+        if self._worker is not None and not self._worker.done():
+            if self._queue is not None:
+                await self._queue.join()
+            self._worker.cancel()
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+        if self._pending and self.client is not None:
+            await self.flush()
+        if self.client is not None and hasattr(self.client, 'aclose'):
+            await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _call(self, api_fn, **kwargs):
+        """Invoke a Notion client method through the rate limiter"""
+        await self._limiter.acquire()
+        return await api_fn(**kwargs)
+
     def is_enabled(self) -> bool:
         """Check if Notion sync is enabled and configured"""
-        return (
-            NOTION_AVAILABLE and 
-            self.notion_config.enabled and 
-            self.client is not None
-        )
+        return self._enabled
     
     async def sync_workflow_definition(
         self,
@@ -78,67 +341,94 @@ class NotionSync:
         Returns:
             Notion page ID if successful, None otherwise
         """
-        if not self.is_enabled():
+        if not self._enabled:
             return None
-            
+
+        # Goes through the worker queue so this stays ordered with the
+        # fire-and-forget updates; the caller still awaits the page_id
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(self._do_sync_workflow_definition, workflow, future=future)
+        return await future
+
+    async def _do_sync_workflow_definition(
+        self,
+        workflow: WorkflowDefinition
+    ) -> Optional[str]:
         try:
             # Prepare workflow documentation
             properties = {
-                "Name": {"title": [{"text": {"content": workflow.name}}]},
-                "Workflow ID": {"rich_text": [{"text": {"content": workflow.workflow_id}}]},
-                "Total Tasks": {"number": len(workflow.tasks)},
-                "Created": {"date": {"start": datetime.now().isoformat()}},
-                "Status": {"select": {"name": "Pending"}}
+                "Name": _title(workflow.name),
+                "Workflow ID": _rich(workflow.workflow_id),
+                "Total Tasks": _number(len(workflow.tasks)),
+                "Created": _date(datetime.now().isoformat()),
+                "Status": _select("Pending")
             }
-            
-            # Create task list for description
-            task_list = "\n".join([
-                f"- **{task.task_id}** ({task.task_type.value}): {task.description or 'No description'}"
-                for task in workflow.tasks.values()
-            ])
-            
+
+            # Idempotency: a retried/re-submitted workflow updates its
+            # existing page instead of creating a duplicate
+            cached_page_id = self._page_cache.get(workflow.workflow_id)
+            if cached_page_id:
+                await self._call(
+                    self.client.pages.update,
+                    page_id=cached_page_id,
+                    properties=properties
+                )
+                logger.debug(
+                    f"Updated existing Notion page for workflow "
+                    f"{workflow.workflow_id}: {cached_page_id}"
+                )
+                return cached_page_id
+
+            # Create task list for description, chunked to stay under
+            # Notion's 2000-char rich_text limit per block.
+            # WorkflowDefinition.tasks is a list; task_type is already a
+            # raw string because TaskDefinition uses use_enum_values
+            lines_iter = (
+                f"- **{task.task_id}** ({task.task_type}): {getattr(task, 'description', None) or 'No description'}"
+                for task in workflow.tasks
+            )
+
             children = [
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": "Workflow Overview"}}]
-                    }
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": workflow.description or "No description provided"}}]
-                    }
-                },
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": "Tasks"}}]
-                    }
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": task_list}}]
-                    }
-                }
+                _heading2("Workflow Overview"),
+                _paragraph(workflow.description or "No description provided"),
+                _heading2("Tasks")
             ]
-            
+            chunk: List[str] = []
+            chunk_len = 0
+            for line in lines_iter:
+                if chunk and chunk_len + len(line) + 1 > self._MAX_TEXT_PER_BLOCK:
+                    children.append(_paragraph("\n".join(chunk)))
+                    chunk, chunk_len = [], 0
+                chunk.append(line)
+                chunk_len += len(line) + 1
+            if chunk:
+                children.append(_paragraph("\n".join(chunk)))
+
+            # pages.create accepts at most 100 blocks; append the rest
+            # in follow-up requests
+            overflow = children[self._MAX_BLOCKS_PER_APPEND:]
+            children = children[:self._MAX_BLOCKS_PER_APPEND]
+
             # Create page in workflow database
-            response = await self.client.pages.create(
+            response = await self._call(
+                self.client.pages.create,
                 parent={"database_id": self.notion_config.workflow_database_id},
                 properties=properties,
                 children=children
             )
+
+            for start in range(0, len(overflow), self._MAX_BLOCKS_PER_APPEND):
+                await self._call(
+                    self.client.blocks.children.append,
+                    block_id=response["id"],
+                    children=overflow[start:start + self._MAX_BLOCKS_PER_APPEND]
+                )
             
             page_id = response["id"]
+            self._page_cache[workflow.workflow_id] = page_id
             logger.info(f"Created Notion page for workflow {workflow.workflow_id}: {page_id}")
             return page_id
-            
+
         except Exception as e:
             logger.error(f"Failed to sync workflow to Notion: {e}")
             return None
@@ -160,19 +450,33 @@ class NotionSync:
         Returns:
             Notion page ID if successful
         """
-        if not self.is_enabled():
+        if not self._enabled:
             return None
-            
+
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(
+            self._do_sync_execution_start, workflow_id, workflow_name,
+            started_at, future=future
+        )
+        return await future
+
+    async def _do_sync_execution_start(
+        self,
+        workflow_id: str,
+        workflow_name: str,
+        started_at: datetime
+    ) -> Optional[str]:
         try:
             properties = {
-                "Name": {"title": [{"text": {"content": f"{workflow_name} - Execution"}}]},
-                "Workflow ID": {"rich_text": [{"text": {"content": workflow_id}}]},
-                "Started": {"date": {"start": started_at.isoformat()}},
-                "Status": {"select": {"name": "Running"}},
-                "Progress": {"number": 0}
+                "Name": _title(f"{workflow_name} - Execution"),
+                "Workflow ID": _rich(workflow_id),
+                "Started": _date(started_at.isoformat()),
+                "Status": _select("Running"),
+                "Progress": _number(0)
             }
             
-            response = await self.client.pages.create(
+            response = await self._call(
+                self.client.pages.create,
                 parent={"database_id": self.notion_config.execution_database_id},
                 properties=properties
             )
@@ -201,18 +505,32 @@ class NotionSync:
             total_tasks: Total number of tasks
             status: Execution status
         """
-        if not self.is_enabled() or not page_id:
+        if not self._enabled or not page_id:
             return
-            
+
+        # Fire-and-forget: progress updates never block the executor
+        self._enqueue(
+            self._do_update_execution_progress, page_id, completed_tasks,
+            total_tasks, status
+        )
+
+    async def _do_update_execution_progress(
+        self,
+        page_id: str,
+        completed_tasks: int,
+        total_tasks: int,
+        status: str
+    ):
         try:
             progress = int((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
             
-            await self.client.pages.update(
+            await self._call(
+                self.client.pages.update,
                 page_id=page_id,
                 properties={
-                    "Progress": {"number": progress},
-                    "Status": {"select": {"name": status}},
-                    "Completed Tasks": {"number": completed_tasks}
+                    "Progress": _number(progress),
+                    "Status": _select(status),
+                    "Completed Tasks": _number(completed_tasks)
                 }
             )
             
@@ -241,54 +559,67 @@ class NotionSync:
             task_results: Map of task results
             error_message: Error message if failed
         """
-        if not self.is_enabled() or not page_id:
+        if not self._enabled or not page_id:
             return
-            
+
+        # Fire-and-forget: the final sync runs off the critical path
+        self._enqueue(
+            self._do_sync_execution_complete, page_id, workflow_id, status,
+            completed_at, task_results, error_message
+        )
+
+    async def _do_sync_execution_complete(
+        self,
+        page_id: str,
+        workflow_id: str,
+        status: str,
+        completed_at: datetime,
+        task_results: Dict[str, TaskResult],
+        error_message: Optional[str]
+    ):
         try:
+            # Drain any buffered task results first so blocks appear in
+            # execution order ahead of the final summary
+            await self.flush()
+
             # Update properties
             properties = {
-                "Status": {"select": {"name": status.capitalize()}},
-                "Completed": {"date": {"start": completed_at.isoformat()}},
-                "Progress": {"number": 100 if status == "completed" else 0}
+                "Status": _select(status.capitalize()),
+                "Completed": _date(completed_at.isoformat()),
+                "Progress": _number(100 if status == "completed" else 0)
             }
-            
+
             if error_message:
-                properties["Error"] = {"rich_text": [{"text": {"content": error_message[:2000]}}]}
-            
-            await self.client.pages.update(
-                page_id=page_id,
-                properties=properties
-            )
-            
-            # Append task results as blocks
-            result_blocks = [
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": "Execution Results"}}]
-                    }
-                }
-            ]
-            
+                properties["Error"] = _rich(error_message[:2000])
+
+            # Build the result blocks before any network round-trip
+            result_blocks = [_heading2("Execution Results")]
+
             for task_id, result in task_results.items():
-                status_emoji = "✅" if result.status == TaskStatus.SUCCESS else "❌"
-                result_blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {"content": f"{status_emoji} {task_id}: {result.status.value}"}
-                        }]
-                    }
-                })
-            
-            await self.client.blocks.children.append(
-                block_id=page_id,
-                children=result_blocks
+                status_emoji = _STATUS_EMOJI.get(result.status, "❓")
+                result_blocks.append(
+                    _paragraph(f"{status_emoji} {task_id}: {result.status}")
+                )
+
+            # The property update and block append are independent — run
+            # both round-trips concurrently
+            results = await asyncio.gather(
+                self._call(
+                    self.client.pages.update,
+                    page_id=page_id,
+                    properties=properties
+                ),
+                self._call(
+                    self.client.blocks.children.append,
+                    block_id=page_id,
+                    children=result_blocks
+                ),
+                return_exceptions=True
             )
-            
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to sync execution completion: {result}")
+
             logger.info(f"Execution {workflow_id} marked as {status} in Notion")
             
         except Exception as e:
@@ -308,37 +639,48 @@ class NotionSync:
             task_id: Task ID
             task_result: Task execution result
         """
-        if not self.is_enabled() or not page_id:
+        if not self._enabled or not page_id:
             return
             
         try:
-            status_emoji = {
-                TaskStatus.SUCCESS: "✅",
-                TaskStatus.FAILED: "❌",
-                TaskStatus.PENDING: "⏳",
-                TaskStatus.RUNNING: "🔄",
-                TaskStatus.TIMEOUT: "⏱️",
-                TaskStatus.SKIPPED: "⏭️"
-            }.get(task_result.status, "❓")
-            
-            duration = f" ({task_result.metadata.get('duration_ms', 0)}ms)" if task_result.metadata else ""
-            
-            content = f"{status_emoji} **{task_id}**: {task_result.status.value}{duration}"
+            status_emoji = _STATUS_EMOJI.get(task_result.status, "❓")
             
-            await self.client.blocks.children.append(
-                block_id=page_id,
-                children=[{
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": content}}]
-                    }
-                }]
-            )
+            duration = f" ({task_result.duration_ms}ms)" if task_result.duration_ms else ""
             
+            # TaskResult uses use_enum_values, so status is already the raw string
+            content = f"{status_emoji} **{task_id}**: {task_result.status}{duration}"
+
+            # Buffer the block; the flusher coalesces everything queued
+            # for a page into a single children.append call
+            self._pending.setdefault(page_id, []).append(_paragraph(content))
+
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush_loop())
+
         except Exception as e:
             logger.error(f"Failed to add task result to Notion: {e}")
 
+    async def _flush_loop(self):
+        """Flush pending blocks periodically until the buffer drains"""
+        while self._pending:
+            await asyncio.sleep(self._FLUSH_INTERVAL)
+            await self.flush()
+
+    async def flush(self):
+        """Send all pending task-result blocks, batched per page"""
+        for page_id in list(self._pending):
+            blocks = self._pending.pop(page_id, [])
+            for start in range(0, len(blocks), self._MAX_BLOCKS_PER_APPEND):
+                batch = blocks[start:start + self._MAX_BLOCKS_PER_APPEND]
+                try:
+                    await self._call(
+                        self.client.blocks.children.append,
+                        block_id=page_id,
+                        children=batch
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to flush task results to Notion: {e}")
+
 
 # Singleton instance
 _notion_sync: Optional[NotionSync] = None
@@ -350,3 +692,11 @@ def get_notion_sync() -> NotionSync:
     if _notion_sync is None:
         _notion_sync = NotionSync()
     return _notion_sync
+
+
+async def close_notion_sync():
+    """Close the global NotionSync instance (call on app shutdown)"""
+    global _notion_sync
+    if _notion_sync is not None:
+        await _notion_sync.aclose()
+        _notion_sync = None
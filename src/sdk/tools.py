@@ -2,22 +2,36 @@
 SDK for defining and registering tools.
 """
 
-from typing import Callable, Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
 import functools
 from loguru import logger
 
+
+@dataclass(slots=True, frozen=True)
+class _ToolEntry:
+    """Registry record for one tool (slotted: smaller and faster than a dict)"""
+    name: str
+    description: str
+    function: Callable
+    parameters: Dict[str, Any]
+
+
 # Global tool registry
-_TOOL_REGISTRY: Dict[str, Dict[str, Any]] = {}
+_TOOL_REGISTRY: Dict[str, _ToolEntry] = {}
+
+# Cached list_tools() payload, invalidated whenever a tool is registered
+_LIST_CACHE: Optional[Tuple[Dict[str, str], ...]] = None
 
 
 def tool(name: Optional[str] = None, description: Optional[str] = None):
     """
     Decorator to register a function as a tool.
-    
+
     Args:
         name: Tool name (defaults to function name)
         description: Tool description (defaults to docstring)
-        
+
     Example:
         @tool(name="calculator")
         def add(a: int, b: int) -> int:
@@ -25,40 +39,41 @@ def tool(name: Optional[str] = None, description: Optional[str] = None):
             return a + b
     """
     def decorator(func: Callable):
+        global _LIST_CACHE
         tool_name = name or func.__name__
         tool_desc = description or func.__doc__ or "No description provided"
-        
+
         # Register tool
-        _TOOL_REGISTRY[tool_name] = {
-            "name": tool_name,
-            "description": tool_desc.strip(),
-            "function": func,
-            "parameters": func.__annotations__
-        }
-        
+        _TOOL_REGISTRY[tool_name] = _ToolEntry(
+            name=tool_name,
+            description=tool_desc.strip(),
+            function=func,
+            parameters=func.__annotations__
+        )
+        _LIST_CACHE = None
+
         logger.debug(f"Registered tool: {tool_name}")
-        
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
-        
+
         return wrapper
     return decorator
 
 
 def get_tool(name: str) -> Optional[Callable]:
     """Get a registered tool function"""
-    if name not in _TOOL_REGISTRY:
-        return None
-    return _TOOL_REGISTRY[name]["function"]
+    entry = _TOOL_REGISTRY.get(name)
+    return entry.function if entry is not None else None
 
 
 def list_tools() -> List[Dict[str, Any]]:
     """List all registered tools"""
-    return [
-        {
-            "name": t["name"],
-            "description": t["description"]
-        }
-        for t in _TOOL_REGISTRY.values()
-    ]
+    global _LIST_CACHE
+    if _LIST_CACHE is None:
+        _LIST_CACHE = tuple(
+            {"name": t.name, "description": t.description}
+            for t in _TOOL_REGISTRY.values()
+        )
+    return list(_LIST_CACHE)
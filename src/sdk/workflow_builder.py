@@ -2,13 +2,23 @@
 SDK for building workflows with a fluent API.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime
+import hashlib
+import json
 import uuid
 
 from src.core.task import TaskDefinition, TaskType, WorkflowDefinition
 from loguru import logger
 
+# Compiled definitions keyed by structural digest: repeated compiles of
+# an identical workflow shape (reference builders, per-test fixtures,
+# hot reload) skip validation and topo-sorting. Entries are deep-copied
+# on the way in and out, so cached state never aliases live task objects.
+_COMPILE_CACHE: "OrderedDict[str, WorkflowDefinition]" = OrderedDict()
+_COMPILE_CACHE_MAX = 128
+
 
 class WorkflowBuilder:
     """
@@ -25,7 +35,7 @@ class WorkflowBuilder:
         self.name = name
         self.workflow_id = workflow_id or f"wf-{uuid.uuid4().hex[:8]}"
         self.description: Optional[str] = None
-        self.tasks: List[TaskDefinition] = []
+        self.tasks: Dict[str, TaskDefinition] = {}
         self.metadata: Dict[str, Any] = {}
         self.timeout_seconds: Optional[int] = None
         
@@ -74,6 +84,9 @@ class WorkflowBuilder:
         Returns:
             Self for method chaining
         """
+        if task_id in self.tasks:
+            raise ValueError(f"Duplicate task_id: {task_id}")
+
         task = TaskDefinition(
             task_id=task_id,
             name=name or task_id,
@@ -86,11 +99,51 @@ class WorkflowBuilder:
             hitl_config=hitl_config
         )
         
-        self.tasks.append(task)
+        self.tasks[task_id] = task
         logger.debug(f"Added task: {task_id} ({task_type})")
-        
+
         return self
-    
+
+    def add_tasks(self, specs: List[Dict[str, Any]]) -> 'WorkflowBuilder':
+        """
+        Add several tasks in one call with a single validation pass.
+
+        Duplicate-ID checking runs once over the whole batch instead of
+        per add_task call, which matters when building wide or deep
+        workflows in loops.
+
+        Args:
+            specs: List of keyword dicts accepted by add_task
+                   (task_id and task_type required)
+
+        Returns:
+            Self for method chaining
+        """
+        seen = set(self.tasks)
+        for spec in specs:
+            task_id = spec["task_id"]
+            if task_id in seen:
+                raise ValueError(f"Duplicate task_id: {task_id}")
+            seen.add(task_id)
+
+        for spec in specs:
+            task = TaskDefinition(
+                task_id=spec["task_id"],
+                name=spec.get("name") or spec["task_id"],
+                task_type=spec["task_type"],
+                depends_on=spec.get("depends_on") or [],
+                inputs=spec.get("inputs") or {},
+                executor_config=spec.get("executor_config") or {},
+                max_retries=spec.get("max_retries", 3),
+                timeout_seconds=spec.get("timeout_seconds"),
+                hitl_config=spec.get("hitl_config")
+            )
+            self.tasks[task.task_id] = task
+
+        logger.debug(f"Added {len(specs)} tasks in batch")
+
+        return self
+
     def add_llm_task(
         self,
         task_id: str,
@@ -212,23 +265,98 @@ class WorkflowBuilder:
         """
         if not self.tasks:
             raise ValueError("Workflow must have at least one task")
-        
+
+        digest = self._structural_digest()
+        cached = _COMPILE_CACHE.get(digest)
+        if cached is not None:
+            _COMPILE_CACHE.move_to_end(digest)
+            workflow_def = cached.model_copy(deep=True)
+            workflow_def.workflow_id = self.workflow_id
+            workflow_def.created_at = datetime.utcnow()
+            logger.debug(f"Compile cache hit for workflow {self.workflow_id}")
+            return workflow_def
+
+        topo_order, successors, in_degree = self._compute_schedule()
+
         workflow_def = WorkflowDefinition(
             workflow_id=self.workflow_id,
             name=self.name,
             description=self.description,
-            tasks=self.tasks,
+            tasks=list(self.tasks.values()),
             timeout_seconds=self.timeout_seconds,
-            metadata=self.metadata
+            metadata=self.metadata,
+            topo_order=topo_order,
+            successors=successors,
+            in_degree=in_degree
         )
         
         logger.info(
             f"Compiled workflow: {self.workflow_id} "
             f"({len(self.tasks)} tasks)"
         )
-        
+
+        _COMPILE_CACHE[digest] = workflow_def.model_copy(deep=True)
+        if len(_COMPILE_CACHE) > _COMPILE_CACHE_MAX:
+            _COMPILE_CACHE.popitem(last=False)
+
         return workflow_def
-    
+
+    def _structural_digest(self) -> str:
+        """Digest of the builder's structure, excluding the random workflow_id"""
+        state = {
+            "name": self.name,
+            "description": self.description,
+            "timeout_seconds": self.timeout_seconds,
+            "metadata": self.metadata,
+            "tasks": [task.model_dump(mode="json") for task in self.tasks.values()],
+        }
+        payload = json.dumps(state, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _compute_schedule(self) -> Tuple[List[str], Dict[str, List[str]], Dict[str, int]]:
+        """
+        Precompute the scheduling structures the orchestrator needs.
+
+        One Kahn's-algorithm pass produces the topological order,
+        successor adjacency and in-degrees; a reverse walk over that
+        order then sets each task's critical_path_length (longest path
+        to a sink, sinks = 1). Computing these once at compile time
+        keeps per-execution readiness checks at O(1) per edge.
+
+        Returns:
+            (topo_order, successors, in_degree)
+        """
+        successors: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+        in_degree: Dict[str, int] = {task_id: 0 for task_id in self.tasks}
+        for task in self.tasks.values():
+            for dep in task.depends_on:
+                if dep in successors:  # missing deps caught by DAG validation
+                    successors[dep].append(task.task_id)
+                    in_degree[task.task_id] += 1
+
+        # Kahn's algorithm
+        queue = deque(
+            task_id for task_id, degree in in_degree.items() if degree == 0
+        )
+        remaining = dict(in_degree)
+        topo_order: List[str] = []
+        while queue:
+            task_id = queue.popleft()
+            topo_order.append(task_id)
+            for successor_id in successors[task_id]:
+                remaining[successor_id] -= 1
+                if remaining[successor_id] == 0:
+                    queue.append(successor_id)
+
+        # Reverse-topological pass for critical-path lengths
+        cpl: Dict[str, int] = {task_id: 1 for task_id in self.tasks}
+        for task_id in reversed(topo_order):
+            for successor_id in successors[task_id]:
+                cpl[task_id] = max(cpl[task_id], cpl[successor_id] + 1)
+            self.tasks[task_id].critical_path_length = cpl[task_id]
+
+        return topo_order, successors, in_degree
+
     def visualize(self) -> str:
         """
         Generate ASCII visualization of the workflow.
@@ -240,7 +368,7 @@ class WorkflowBuilder:
         lines.append(f"Tasks: {len(self.tasks)}")
         lines.append("")
         
-        for task in self.tasks:
+        for task in self.tasks.values():
             deps = ", ".join(task.depends_on) if task.depends_on else "none"
             lines.append(f"  [{task.task_type}] {task.task_id}")
             lines.append(f"    Depends on: {deps}")
@@ -0,0 +1,199 @@
+"""
+Test all Nexus Ray API endpoints.
+
+Manual script (not a pytest module): run against a live server with
+`python tests/api_endpoint_probe.py`. Independent endpoint probes are
+dispatched concurrently with asyncio.gather, so wall time is the max of
+each group's latencies instead of their sum.
+"""
+
+import asyncio
+import json
+import os
+
+import httpx
+
+BASE_URL = "http://localhost:8000"
+
+# Request bodies are static, so encode them once at import instead of
+# re-serializing per call via json=
+HEADERS = {"Content-Type": "application/json"}
+
+WORKFLOW_BODY = json.dumps({
+    "name": "test_workflow",
+    "description": "Test workflow",
+    "tasks": [
+        {"id": "task1", "type": "llm", "prompt": "Hello"},
+        {"id": "task2", "type": "tool", "tool_name": "processor"}
+    ]
+}).encode()
+EXECUTE_BODY = json.dumps({"inputs": {"test": "data"}}).encode()
+AGENT_BODY = json.dumps({
+    "agent_id": "test_agent_1",
+    "name": "Test Agent",
+    "capabilities": ["llm_analysis", "data_processing"],
+    "metadata": {"version": "1.0"}
+}).encode()
+LLM_BODY = json.dumps({
+    "prompt": "Say hello in one word",
+    "max_tokens": 10,
+    "temperature": 0.7
+}).encode()
+FILTER_BODY = json.dumps({
+    "text": "This is a test message",
+    "strict_mode": False
+}).encode()
+SCORE_BODY = json.dumps({
+    "text": "Hello world",
+    "strict_mode": False
+}).encode()
+CONSENSUS_BODY = json.dumps({
+    "question": "Is this test working?",
+    "options": ["yes", "no", "maybe"],
+    "strategy": "majority_vote",
+    "from_agent": "test_agent_1"
+}).encode()
+
+
+async def probe(client, method, path, data=None, desc=""):
+    """Probe an API endpoint (data: pre-encoded JSON bytes)"""
+    print(f"\n{'='*60}")
+    print(f"Testing: {desc}")
+    print(f"{method} {path}")
+
+    try:
+        response = await client.request(
+            method, path,
+            content=data,
+            headers=HEADERS if data is not None else None
+        )
+
+        print(f"Status: {response.status_code}")
+
+        if response.status_code < 400:
+            print(f"✅ SUCCESS")
+            try:
+                result = response.json()
+                print(f"Response: {json.dumps(result, indent=2)[:300]}...")
+                return result
+            except:
+                print(f"Response: {response.text[:200]}")
+                return response.text
+        else:
+            print(f"❌ FAILED")
+            print(f"Error: {response.text[:200]}")
+            return None
+
+    except httpx.ConnectError:
+        print(f"❌ CONNECTION FAILED - Is server running?")
+        return None
+    except Exception as e:
+        print(f"❌ ERROR: {str(e)}")
+        return None
+
+
+async def main():
+    print("\n🚀 Nexus Ray API Endpoint Tests")
+    print("="*60)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30) as client:
+        # Warm-up: prime the connection pool before any timed probes
+        try:
+            await client.get("/health")
+        except httpx.HTTPError:
+            pass
+
+        # Independent read-only probes go out together
+        await asyncio.gather(
+            probe(client, "GET", "/", desc="Root endpoint"),
+            probe(client, "GET", "/health", desc="Health check"),
+        )
+
+        # Test Workflows
+        print("\n\n📊 WORKFLOW ENDPOINTS")
+        print("="*60)
+
+        # Create workflow (its id feeds the follow-up requests)
+        workflow, _ = await asyncio.gather(
+            probe(client, "POST", "/api/workflows", WORKFLOW_BODY, "Create workflow"),
+            probe(client, "GET", "/api/workflows", desc="List workflows"),
+        )
+
+        # Sequential only where outputs feed subsequent requests
+        if workflow:
+            workflow_id = workflow.get("id")
+            await probe(client, "GET", f"/api/workflows/{workflow_id}", desc="Get workflow by ID")
+
+            # Execute workflow
+            execution = await probe(client, "POST", f"/api/workflows/{workflow_id}/execute",
+                                    EXECUTE_BODY, "Execute workflow")
+
+            # Get execution status
+            if execution:
+                execution_id = execution.get("execution_id")
+                await probe(client, "GET", f"/api/workflows/{workflow_id}/executions/{execution_id}",
+                            desc="Get execution status")
+
+        # Test Agents
+        print("\n\n🤖 AGENT ENDPOINTS")
+        print("="*60)
+
+        # Register agent
+        agent, _ = await asyncio.gather(
+            probe(client, "POST", "/api/agents/register", AGENT_BODY, "Register agent"),
+            probe(client, "GET", "/api/agents", desc="List all agents"),
+        )
+
+        # Get specific agent
+        if agent:
+            agent_id = agent.get("agent_id")
+            await probe(client, "GET", f"/api/agents/{agent_id}", desc="Get agent by ID")
+
+        # Test LLM + metrics + collaboration reads + guardrails: all
+        # independent, so any slow call overlaps the cheap ones
+        print("\n\n🧠 LLM / 📈 METRICS / 🛡️ GUARDRAILS ENDPOINTS")
+        print("="*60)
+
+        probes = [
+            probe(client, "GET", "/api/llm/models", desc="List available models"),
+            probe(client, "GET", "/api/llm/metrics", desc="Get LLM metrics"),
+            probe(client, "GET", "/api/metrics", desc="Get system metrics"),
+            probe(client, "GET", "/api/metrics/activity", desc="Get activity feed"),
+            probe(client, "GET", "/api/metrics/llm", desc="Get LLM insights"),
+            probe(client, "GET", "/api/collaboration/agents", desc="List collaboration agents"),
+            probe(client, "POST", "/api/collaboration/consensus", CONSENSUS_BODY, "Start consensus"),
+            probe(client, "POST", "/api/guardrails/filter", FILTER_BODY, "Filter content"),
+            probe(client, "POST", "/api/guardrails/score", SCORE_BODY, "Get safety score"),
+        ]
+
+        # Real inference dominates the whole script's runtime (10-30s on
+        # CPU), so it's opt-in; /api/llm/models above still checks the
+        # LLM route schema without triggering generation
+        if os.environ.get("NEXUS_TEST_LLM"):
+            print("\n⚠️  Note: LLM generation may take 10-30 seconds on CPU...")
+            probes.append(
+                probe(client, "POST", "/api/llm/generate", LLM_BODY, "Generate text with LLM")
+            )
+        else:
+            print("\n⏭️  Skipping /api/llm/generate (set NEXUS_TEST_LLM=1 to include)")
+
+        results = await asyncio.gather(*probes)
+
+        # Get consensus result (depends on the consensus POST above)
+        consensus = results[6]
+        if consensus:
+            correlation_id = consensus.get("correlation_id")
+            await probe(client, "GET", f"/api/collaboration/consensus/{correlation_id}",
+                        desc="Get consensus result")
+
+    # Summary
+    print("\n\n" + "="*60)
+    print("✅ API ENDPOINT TESTING COMPLETE")
+    print("="*60)
+    print("\nSwagger Docs available at: http://localhost:8000/docs")
+    print("ReDoc available at: http://localhost:8000/redoc")
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from src.core.executor import BaseExecutor
+from src.core.orchestrator import WorkflowOrchestrator
+from src.core.task import TaskDefinition, TaskResult, TaskStatus
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# uvloop's C-level scheduling cuts per-await overhead across the whole
+# session-scoped loop; the default selector loop remains the fallback
+if UVLOOP_AVAILABLE and sys.platform != "win32":
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# Uniform per-task latency for the timing tests: with a known task cost
+# the critical-path (work-span) bound becomes assertable instead of a
+# padded wall-clock constant.
+T_TASK = 0.05
+
+
+class _SleepExecutor(BaseExecutor):
+    """Executor that sleeps T_TASK and succeeds, for timing assertions"""
+
+    async def execute(self, task: TaskDefinition) -> TaskResult:
+        await asyncio.sleep(T_TASK)
+        return TaskResult(task_id=task.task_id, status=TaskStatus.SUCCESS)
+
+
+@pytest.fixture
+def fast_orchestrator() -> WorkflowOrchestrator:
+    """Orchestrator whose executors all take exactly T_TASK"""
+    orch = WorkflowOrchestrator()
+    sleeper = _SleepExecutor("sleep-executor")
+    orch.executors = {task_type: sleeper for task_type in orch.executors}
+    return orch
+
+
+@pytest.fixture(scope="session")
+def orchestrator() -> WorkflowOrchestrator:
+    """
+    Session-scoped orchestrator shared across tests.
+
+    Workflow state is keyed by workflow_id, so independent tests can
+    share one instance instead of paying executor initialization per
+    test.
+    """
+    return WorkflowOrchestrator()
@@ -0,0 +1,27 @@
+"""
+E2E-test fixtures.
+"""
+
+import pytest
+
+from src.core.task import TaskResult, TaskStatus
+
+
+@pytest.fixture(autouse=True)
+def _fast_llm(monkeypatch):
+    """
+    Stub LLMExecutor.execute for every test in this package.
+
+    The e2e suite exercises workflow orchestration, not model
+    inference; without a real model each LLM task otherwise burns its
+    full retry/backoff cycle. Tests needing failure behaviour re-patch
+    execute themselves, which wins over this fixture.
+    """
+    async def _stub_execute(self, task):
+        return TaskResult(
+            task_id=task.task_id,
+            status=TaskStatus.SUCCESS,
+            outputs={"response": "stub"}
+        )
+
+    monkeypatch.setattr("src.core.executor.LLMExecutor.execute", _stub_execute)
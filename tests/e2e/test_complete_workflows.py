@@ -9,7 +9,6 @@ import asyncio
 from datetime import datetime
 
 from src.sdk import WorkflowBuilder
-from src.core.orchestrator import WorkflowOrchestrator
 from src.core.task import TaskType, TaskStatus
 
 
@@ -17,91 +16,77 @@ class TestE2EWorkflows:
     """End-to-end workflow tests"""
     
     @pytest.mark.asyncio
-    async def test_simple_sequential_workflow(self):
-        """Test simple 3-task sequential workflow"""
-        # Build workflow
-        workflow = (
-            WorkflowBuilder("e2e_sequential")
-            .add_task(task_id="step1", task_type=TaskType.LLM, name="Step 1")
-            .add_task(task_id="step2", task_type=TaskType.TOOL, name="Step 2", depends_on=["step1"])
-            .add_task(task_id="step3", task_type=TaskType.LLM, name="Step 3", depends_on=["step2"])
-            .compile()
-        )
-        
-        # Execute
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
-        
-        # Verify execution
-        assert state.status == "completed"
-        assert len(state.completed_tasks) == 3
-        assert "step1" in state.completed_tasks
-        assert "step2" in state.completed_tasks
-        assert "step3" in state.completed_tasks
-    
-    @pytest.mark.asyncio
-    async def test_parallel_execution_workflow(self):
-        """Test workflow with parallel branches"""
-        workflow = (
-            WorkflowBuilder("e2e_parallel")
-            .add_task(task_id="init", task_type=TaskType.LLM, name="Initialize")
-            .add_task(task_id="branch_a", task_type=TaskType.LLM, name="Branch A", depends_on=["init"])
-            .add_task(task_id="branch_b", task_type=TaskType.TOOL, name="Branch B", depends_on=["init"])
-            .add_task(task_id="merge", task_type=TaskType.LLM, name="Merge", depends_on=["branch_a", "branch_b"])
-            .compile()
-        )
-        
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
-        
-        # All tasks should be attempted
-        assert state.status in ["completed", "failed"]
-        assert len(state.task_results) == 4
-    
-    @pytest.mark.asyncio
-    async def test_llm_workflow_with_prompts(self):
-        """Test workflow with actual LLM tasks"""
-        workflow = (
-            WorkflowBuilder("e2e_llm")
-            .add_llm_task(
-                task_id="analyze",
-                prompt="Analyze the following data: {data}",
-                name="Analysis",
-                inputs={"data": "sample data"}
+    async def test_independent_workflow_scenarios(self, orchestrator):
+        """Run the independent workflow scenarios concurrently.
+
+        The parallel, LLM and HITL cases share no state, so gathering
+        them overlaps the orchestrator's internal awaits instead of
+        paying each workflow's wall time back-to-back. (The sequential
+        case lives in the parametrized integration test.)
+        """
+        async def run_parallel_branches():
+            """Workflow with parallel branches"""
+            workflow = (
+                WorkflowBuilder("e2e_parallel")
+                .add_task(task_id="init", task_type=TaskType.LLM, name="Initialize")
+                .add_task(task_id="branch_a", task_type=TaskType.LLM, name="Branch A", depends_on=["init"])
+                .add_task(task_id="branch_b", task_type=TaskType.TOOL, name="Branch B", depends_on=["init"])
+                .add_task(task_id="merge", task_type=TaskType.LLM, name="Merge", depends_on=["branch_a", "branch_b"])
+                .compile()
             )
-            .add_llm_task(
-                task_id="summarize",
-                prompt="Summarize: {analysis}",
-                name="Summary",
-                depends_on=["analyze"]
+
+            state = await orchestrator.execute_workflow(workflow)
+
+            # All tasks should be attempted
+            assert state.status in ["completed", "failed"]
+            assert len(state.task_results) == 4
+
+        async def run_llm_prompts():
+            """Workflow with actual LLM tasks"""
+            workflow = (
+                WorkflowBuilder("e2e_llm")
+                .add_llm_task(
+                    task_id="analyze",
+                    prompt="Analyze the following data: {data}",
+                    name="Analysis",
+                    inputs={"data": "sample data"}
+                )
+                .add_llm_task(
+                    task_id="summarize",
+                    prompt="Summarize: {analysis}",
+                    name="Summary",
+                    depends_on=["analyze"]
+                )
+                .compile()
             )
-            .compile()
-        )
-        
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
-        
-        # Should complete or fail gracefully (no real LLM)
-        assert state.status in ["completed", "failed"]
-        assert "analyze" in state.task_results
-    
-    @pytest.mark.asyncio
-    async def test_hitl_workflow_gates(self):
-        """Test workflow with HITL approval gates"""
-        workflow = (
-            WorkflowBuilder("e2e_hitl")
-            .add_task(task_id="prepare", task_type=TaskType.LLM, name="Prepare")
-            .add_hitl_gate(task_id="approval", after="prepare")
-            .add_task(task_id="execute", task_type=TaskType.TOOL, name="Execute", depends_on=["approval"])
-            .compile()
+
+            state = await orchestrator.execute_workflow(workflow)
+
+            # Should complete or fail gracefully (no real LLM)
+            assert state.status in ["completed", "failed"]
+            assert "analyze" in state.task_results
+
+        async def run_hitl_gate():
+            """Workflow with HITL approval gates"""
+            workflow = (
+                WorkflowBuilder("e2e_hitl")
+                .add_task(task_id="prepare", task_type=TaskType.LLM, name="Prepare")
+                .add_hitl_gate(task_id="approval", after="prepare")
+                .add_task(task_id="execute", task_type=TaskType.TOOL, name="Execute", depends_on=["approval"])
+                .compile()
+            )
+
+            state = await orchestrator.execute_workflow(workflow)
+
+            # Should stop at HITL gate
+            assert "approval" in state.task_results
+            assert state.task_results["approval"].status == TaskStatus.WAITING_HUMAN
+
+        await asyncio.gather(
+            run_parallel_branches(),
+            run_llm_prompts(),
+            run_hitl_gate()
         )
-        
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
-        
-        # Should stop at HITL gate
-        assert "approval" in state.task_results
-        assert state.task_results["approval"].status == TaskStatus.WAITING_HUMAN
     
     @pytest.mark.asyncio
     async def test_reference_protein_workflow(self):
@@ -138,7 +123,7 @@ class TestE2EWorkflows:
         assert process_task is not None
     
     @pytest.mark.asyncio
-    async def  test_error_handling_recovery(self):
+    async def  test_error_handling_recovery(self, orchestrator):
         """Test workflow error handling and retries"""
         workflow = (
             WorkflowBuilder("e2e_error")
@@ -147,7 +132,6 @@ class TestE2EWorkflows:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         # Check that workflow attempted execution
@@ -158,119 +142,132 @@ class TestE2EWithStateManagement:
     """E2E tests with state persistence"""
     
     @pytest.mark.asyncio
-    async def test_workflow_with_state_persistence(self):
+    async def test_workflow_with_state_persistence(self, orchestrator):
         """Test workflow execution with state saving"""
-        import tempfile
-        import os
         from src.core.state_manager import StateManager
-        
-        # Create temp DB
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db_url = "sqlite:///" + path
-        
-        try:
-            # Initialize state manager
-            state_manager = StateManager(database_url=db_url)
-            
-            # Build and execute workflow
-            workflow = (
-                WorkflowBuilder("e2e_stateful")
-                .add_task(task_id="task1", task_type=TaskType.LLM, name="Task 1")
-               .add_task(task_id="task2", task_type=TaskType.LLM, name="Task 2", depends_on=["task1"])
-                .compile()
-            )
-            
-            # Execute
-            orchestrator = WorkflowOrchestrator()
-            state = await orchestrator.execute_workflow(workflow)
-            
-            # Manually save state (normally done by enhanced orchestrator)
-            state_manager.save_workflow_state(
-                workflow_id=workflow.workflow_id,
-                name=workflow.name,
-                status=state.status,
-                workflow_definition=workflow,
-                task_results={},
-                completed_tasks=state.completed_tasks,
-                failed_tasks=state.failed_tasks
-            )
-            
-            # Verify state was saved
-            loaded_state = state_manager.load_workflow_state(workflow.workflow_id)
-            assert loaded_state is not None
-            assert loaded_state["status"] == state.status
-            
-        finally:
-            if os.path.exists(path):
-                os.unlink(path)
+
+        # In-memory DB: SQLAlchemy keeps one connection per thread for
+        # :memory:, so save+load see the same database without any disk IO
+        db_url = "sqlite:///:memory:"
+
+        # Initialize state manager
+        state_manager = StateManager(database_url=db_url)
+
+        # Build and execute workflow
+        workflow = (
+            WorkflowBuilder("e2e_stateful")
+            .add_task(task_id="task1", task_type=TaskType.LLM, name="Task 1")
+            .add_task(task_id="task2", task_type=TaskType.LLM, name="Task 2", depends_on=["task1"])
+            .compile()
+        )
+
+        # Execute
+        state = await orchestrator.execute_workflow(workflow)
+
+        # Manually save state (normally done by enhanced orchestrator)
+        state_manager.save_workflow_state(
+            workflow_id=workflow.workflow_id,
+            name=workflow.name,
+            status=state.status,
+            workflow_definition=workflow,
+            task_results={},
+            completed_tasks=state.completed_tasks,
+            failed_tasks=state.failed_tasks
+        )
+
+        # Verify state was saved
+        loaded_state = state_manager.load_workflow_state(workflow.workflow_id)
+        assert loaded_state is not None
+        assert loaded_state["status"] == state.status
+
+
+# Compiled once per module: the orchestrator never mutates a
+# WorkflowDefinition, so tests can share the compiled template instead
+# of re-running builder + compile each time.
+
+@pytest.fixture(scope="module")
+def parallel_10_workflow():
+    """Fan-out/fan-in workflow: init -> 10 parallel tasks -> merge"""
+    parallel_ids = [f"parallel_{i}" for i in range(10)]
+
+    return (
+        WorkflowBuilder("e2e_large_parallel")
+        .add_tasks(
+            [{"task_id": "init", "task_type": TaskType.LLM, "name": "Init"}]
+            + [
+                {
+                    "task_id": task_id,
+                    "task_type": TaskType.LLM,
+                    "name": f"Parallel {i}",
+                    "depends_on": ["init"]
+                }
+                for i, task_id in enumerate(parallel_ids)
+            ]
+            + [{"task_id": "merge", "task_type": TaskType.LLM, "name": "Merge",
+                "depends_on": parallel_ids}]
+        )
+        .compile()
+    )
+
+
+@pytest.fixture(scope="module")
+def deep_20_workflow():
+    """20-task sequential chain"""
+    return (
+        WorkflowBuilder("e2e_deep")
+        .add_tasks([
+            {
+                "task_id": f"task_{i}",
+                "task_type": TaskType.LLM,
+                "name": f"Task {i}",
+                "depends_on": [f"task_{i-1}"] if i > 0 else []
+            }
+            for i in range(20)
+        ])
+        .compile()
+    )
 
 
 class TestE2EPerformance:
     """Performance tests for workflows"""
-    
+
     @pytest.mark.asyncio
-    async def test_large_parallel_workflow(self):
-        """Test workflow with many parallel tasks"""
+    async def test_large_parallel_workflow(self, fast_orchestrator, parallel_10_workflow):
+        """Parallel branches must run concurrently, not serially"""
         import time
-        
-        # Build workflow with 10 parallel tasks
-        builder = WorkflowBuilder("e2e_large_parallel")
-        builder.add_task(task_id="init", task_type=TaskType.LLM, name="Init")
-        
-        # Add 10 parallel tasks
-        for i in range(10):
-            builder.add_task(
-                task_id=f"parallel_{i}",
-                task_type=TaskType.LLM,
-                name=f"Parallel {i}",
-                depends_on=["init"]
-            )
-        
-        # Add merge task
-        parallel_ids = [f"parallel_{i}" for i in range(10)]
-        builder.add_task(task_id="merge", task_type=TaskType.LLM, name="Merge", depends_on=parallel_ids)
-        
-        workflow = builder.compile()
-        
+        from tests.conftest import T_TASK
+
         # Execute and measure time
         start = time.time()
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
+        state = await fast_orchestrator.execute_workflow(parallel_10_workflow)
         duration = time.time() - start
-        
+
         # Should complete all tasks
         assert state.status == "completed"
         assert len(state.completed_tasks) == 12  # init + 10 parallel + merge
-        
-        # Should be reasonably fast (parallel execution)
-        assert duration < 15.0  # seconds
-    
+
+        # Critical path is 3 tasks deep (init -> parallel -> merge): a
+        # parallel dispatch finishes in ~3*T_TASK, a serial one in ~12
+        assert duration < 3 * T_TASK * 1.5
+
     @pytest.mark.asyncio
-    async def test_deep_sequential_workflow(self):
+    async def test_deep_sequential_workflow(self, fast_orchestrator, deep_20_workflow):
         """Test workflow with deep task chain"""
-        # Build 20-task sequential chain
-        builder = WorkflowBuilder("e2e_deep")
-        
-        for i in range(20):
-            depends = [f"task_{i-1}"] if i > 0 else []
-            builder.add_task(
-                task_id=f"task_{i}",
-                task_type=TaskType.LLM,
-                name=f"Task {i}",
-                depends_on=depends
-            )
-        
-        workflow = builder.compile()
-        
-        # Execute
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
-        
+        import time
+        from tests.conftest import T_TASK
+
+        start = time.time()
+        state = await fast_orchestrator.execute_workflow(deep_20_workflow)
+        duration = time.time() - start
+
         # All tasks should complete in order
         assert state.status == "completed"
         assert len(state.completed_tasks) == 20
 
+        # The chain is the critical path: 20 tasks back-to-back with
+        # bounded scheduling overhead
+        assert duration < 20 * T_TASK * 1.5
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--asyncio-mode=auto'])
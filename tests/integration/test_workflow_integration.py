@@ -10,33 +10,40 @@ from unittest.mock import Mock, patch
 import numpy as np
 
 from src.sdk import WorkflowBuilder
-from src.core.orchestrator import WorkflowOrchestrator
 from src.core.task import TaskStatus, TaskType
 
 
 class TestWorkflowIntegration:
     """Integration tests for workflow execution"""
-    
+
     @pytest.mark.asyncio
-    async def test_simple_workflow_execution(self):
-        """Test simple 2-task workflow"""
+    @pytest.mark.parametrize("n_tasks", [2, 3])
+    async def test_sequential_workflow_execution(self, orchestrator, n_tasks):
+        """Test N-task sequential workflows (covers the former 2- and
+        3-task duplicates in one parametrized run)"""
         workflow = (
-            WorkflowBuilder("test_workflow")
-            .add_task(task_id="task1", task_type=TaskType.LLM, name="Task 1", inputs={"query": "test"})
-            .add_task(task_id="task2", task_type=TaskType.TOOL, name="Task 2", depends_on=["task1"])
+            WorkflowBuilder(f"seq_{n_tasks}")
+            .add_tasks([
+                {
+                    "task_id": f"task{i}",
+                    "task_type": TaskType.LLM if i % 2 else TaskType.TOOL,
+                    "name": f"Task {i}",
+                    "depends_on": [f"task{i-1}"] if i > 1 else []
+                }
+                for i in range(1, n_tasks + 1)
+            ])
             .compile()
         )
-        
-        orchestrator = WorkflowOrchestrator()
+
         state = await orchestrator.execute_workflow(workflow)
-        
+
         assert state.status == "completed"
-        assert len(state.completed_tasks) == 2
-        assert "task1" in state.task_results
-        assert "task2" in state.task_results
+        assert len(state.completed_tasks) == n_tasks
+        for i in range(1, n_tasks + 1):
+            assert f"task{i}" in state.task_results
     
     @pytest.mark.asyncio
-    async def test_parallel_execution(self):
+    async def test_parallel_execution(self, orchestrator):
         """Test parallel task execution"""
         workflow = (
             WorkflowBuilder("parallel_workflow")
@@ -46,14 +53,13 @@ class TestWorkflowIntegration:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         assert state.status == "completed"
         assert len(state.completed_tasks) == 3
     
     @pytest.mark.asyncio
-    async def test_hitl_workflow(self):
+    async def test_hitl_workflow(self, orchestrator):
         """Test workflow with human-in-the-loop"""
         workflow = (
             WorkflowBuilder("hitl_workflow")
@@ -62,7 +68,6 @@ class TestWorkflowIntegration:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         # HITL task should be waiting
@@ -107,7 +112,7 @@ class TestLLMIntegration:
     """Integration tests for LLM + workflow"""
     
     @pytest.mark.asyncio
-    async def test_workflow_with_llm_task(self):
+    async def test_workflow_with_llm_task(self, orchestrator):
         """Test workflow with actual LLM execution"""
         workflow = (
             WorkflowBuilder("llm_workflow")
@@ -121,14 +126,13 @@ class TestLLMIntegration:
         )
         
         # Should complete or fail gracefully
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         assert state.status in ["completed", "failed"]
         assert "generate" in state.task_results
     
     @pytest.mark.asyncio  
-    async def test_workflow_with_json_output(self):
+    async def test_workflow_with_json_output(self, orchestrator):
         """Test workflow with JSON mode LLM task"""
         workflow = (
             WorkflowBuilder("json_workflow")
@@ -141,7 +145,6 @@ class TestLLMIntegration:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         assert state.status in ["completed", "failed"]
@@ -152,7 +155,7 @@ class TestFullStackIntegration:
     """Full stack integration tests"""
     
     @pytest.mark.asyncio
-    async def test_rag_workflow(self):
+    async def test_rag_workflow(self, orchestrator):
         """Test RAG (Retrieval-Augmented Generation) workflow"""
         workflow = (
             WorkflowBuilder("rag_workflow")
@@ -171,14 +174,13 @@ class TestFullStackIntegration:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         # Should have executed both tasks
         assert len(state.task_results) == 2
     
     @pytest.mark.asyncio
-    async def test_multi_agent_workflow(self):
+    async def test_multi_agent_workflow(self, orchestrator):
         """Test multi-agent collaboration workflow"""
         workflow = (
             WorkflowBuilder("multi_agent")
@@ -193,7 +195,6 @@ class TestFullStackIntegration:
             .compile()
         )
         
-        orchestrator = WorkflowOrchestrator()
         state = await orchestrator.execute_workflow(workflow)
         
         # May complete or fail (placeholder LLM)
@@ -204,7 +205,7 @@ class TestErrorHandling:
     """Test error handling in workflows"""
     
     @pytest.mark.asyncio
-    async def test_task_failure_handling(self):
+    async def test_task_failure_handling(self, orchestrator):
         """Test workflow handles task failures"""
         workflow = (
             WorkflowBuilder("failure_test")
@@ -214,7 +215,6 @@ class TestErrorHandling:
         
         # Force failure
         with patch('src.core.executor.LLMExecutor.execute', side_effect=Exception("Test error")):
-            orchestrator = WorkflowOrchestrator()
             state = await orchestrator.execute_workflow(workflow)
             
             assert "fail_task" in state.failed_tasks
@@ -224,24 +224,25 @@ class TestPerformance:
     """Basic performance tests"""
     
     @pytest.mark.asyncio
-    async def test_workflow_execution_time(self):
-        """Test workflow completes in reasonable time"""
+    async def test_workflow_execution_time(self, fast_orchestrator):
+        """Independent tasks must execute concurrently"""
         import time
-        
+        from tests.conftest import T_TASK
+
         workflow = (
             WorkflowBuilder("perf_test")
             .add_task(task_id="task1", task_type=TaskType.LLM, name="Task 1")
             .add_task(task_id="task2", task_type=TaskType.LLM, name="Task 2")
             .compile()
         )
-        
+
         start = time.time()
-        orchestrator = WorkflowOrchestrator()
-        state = await orchestrator.execute_workflow(workflow)
+        state = await fast_orchestrator.execute_workflow(workflow)
         duration = time.time() - start
-        
-        # Should complete quickly (placeholder tasks)
-        assert duration < 5.0  # seconds
+
+        # Two independent tasks: concurrent dispatch finishes in
+        # ~T_TASK, serial in ~2*T_TASK
+        assert duration < T_TASK * 1.5
         assert state.status == "completed"
 
 
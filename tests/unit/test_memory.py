@@ -12,6 +12,22 @@ from src.memory import BGEEmbedder, FAISSBackend, ChromaDBBackend, VectorMemory,
 from src.core.exceptions import VectorMemoryError, EmbeddingError
 
 
+# One pre-generated float32 matrix shared by all backend tests: rows are
+# sliced per test instead of re-running np.random.rand(...).astype
+# (float64 generate + float32 copy) at every call site.
+@pytest.fixture(scope="module")
+def rand_embeddings():
+    """Deterministic (100, 768) float32 embedding matrix"""
+    rng = np.random.default_rng(0)
+    return rng.random((100, 768), dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def rand_query(rand_embeddings):
+    """Single query vector (a row of the shared matrix)"""
+    return rand_embeddings[0]
+
+
 class TestBGEEmbedder:
     """Test BGE embedder"""
     
@@ -48,55 +64,57 @@ class TestBGEEmbedder:
 class TestFAISSBackend:
     """Test FAISS backend"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def faiss_backend(self):
-        """Create FAISS backend for testing"""
+        """Create FAISS backend once per module; tests reset it below"""
         try:
             return FAISSBackend(dimension=768)
         except:
             pytest.skip("FAISS not available")
-    
+
+    @pytest.fixture(autouse=True)
+    def _clean_index(self, faiss_backend):
+        """Each test starts from an empty index without rebuilding the backend"""
+        faiss_backend.clear()
+
     def test_initialization(self, faiss_backend):
         """Test backend initialization"""
         assert faiss_backend.dimension == 768
         assert faiss_backend.index.ntotal == 0
     
-    def test_add_vectors(self, faiss_backend):
+    def test_add_vectors(self, faiss_backend, rand_embeddings):
         """Test adding vectors"""
-        embeddings = np.random.rand(10, 768).astype('float32')
+        embeddings = rand_embeddings[:10]
         ids = faiss_backend.add(embeddings)
         
         assert len(ids) == 10
         assert faiss_backend.index.ntotal == 10
     
-    def test_search(self, faiss_backend):
+    def test_search(self, faiss_backend, rand_embeddings, rand_query):
         """Test similarity search"""
         # Add vectors
-        embeddings = np.random.rand(100, 768).astype('float32')
-        faiss_backend.add(embeddings)
+        faiss_backend.add(rand_embeddings)
         
         # Search
-        query = np.random.rand(768).astype('float32')
-        results = faiss_backend.search(query, k=5)
+        results = faiss_backend.search(rand_query, k=5)
         
         assert len(results) == 5
         assert all('distance' in r for r in results)
         assert all('score' in r for r in results)
     
-    def test_search_batch(self, faiss_backend):
+    def test_search_batch(self, faiss_backend, rand_embeddings):
         """Test batch search"""
-        embeddings = np.random.rand(100, 768).astype('float32')
-        faiss_backend.add(embeddings)
+        faiss_backend.add(rand_embeddings)
         
-        queries = np.random.rand(3, 768).astype('float32')
+        queries = rand_embeddings[:3]
         results = faiss_backend.search_batch(queries, k=5)
         
         assert len(results) == 3
         assert all(len(r) == 5 for r in results)
     
-    def test_metadata(self, faiss_backend):
+    def test_metadata(self, faiss_backend, rand_embeddings):
         """Test metadata storage"""
-        embeddings = np.random.rand(5, 768).astype('float32')
+        embeddings = rand_embeddings[:5]
         metadata = [{"text": f"doc{i}"} for i in range(5)]
         
         ids = faiss_backend.add(embeddings, metadata=metadata)
@@ -106,10 +124,9 @@ class TestFAISSBackend:
         
         assert results[0]['metadata']['text'] == 'doc0'
     
-    def test_stats(self, faiss_backend):
+    def test_stats(self, faiss_backend, rand_embeddings):
         """Test statistics"""
-        embeddings = np.random.rand(10, 768).astype('float32')
-        faiss_backend.add(embeddings)
+        faiss_backend.add(rand_embeddings[:10])
         
         stats = faiss_backend.get_stats()
         assert stats['total_vectors'] == 10
@@ -119,58 +136,64 @@ class TestFAISSBackend:
 class TestChromaDBBackend:
     """Test ChromaDB backend"""
     
-    @pytest.fixture
-    def chromadb_backend(self, tmp_path):
-        """Create ChromaDB backend for testing"""
+    @pytest.fixture(scope="class")
+    def chromadb_backend(self, tmp_path_factory):
+        """Create ChromaDB backend once per class.
+
+        Client startup (SQLite store + HNSW library) dominates these
+        tests, so share one backend and reset the collection per test.
+        """
         try:
             return ChromaDBBackend(
                 collection_name="test_collection",
-                persist_directory=str(tmp_path / "chroma"),
+                persist_directory=str(tmp_path_factory.mktemp("chroma")),
                 dimension=768
             )
         except:
             pytest.skip("ChromaDB not available")
-    
+
+    @pytest.fixture(autouse=True)
+    def _clean_collection(self, chromadb_backend):
+        """Each test starts from an empty collection"""
+        if chromadb_backend.collection.count() > 0:
+            chromadb_backend.clear()
+
     def test_initialization(self, chromadb_backend):
         """Test backend initialization"""
         assert chromadb_backend.dimension == 768
         assert chromadb_backend.collection.count() == 0
     
-    def test_add_vectors(self, chromadb_backend):
+    def test_add_vectors(self, chromadb_backend, rand_embeddings):
         """Test adding vectors"""
-        embeddings = np.random.rand(10, 768).astype('float32')
+        embeddings = rand_embeddings[:10]
         ids = chromadb_backend.add(embeddings)
         
         assert len(ids) == 10
         assert chromadb_backend.collection.count() == 10
     
-    def test_search(self, chromadb_backend):
+    def test_search(self, chromadb_backend, rand_embeddings, rand_query):
         """Test similarity search"""
-        embeddings = np.random.rand(50, 768).astype('float32')
-        chromadb_backend.add(embeddings)
+        chromadb_backend.add(rand_embeddings[:50])
         
-        query = np.random.rand(768).astype('float32')
-        results = chromadb_backend.search(query, k=5)
+        results = chromadb_backend.search(rand_query, k=5)
         
         assert len(results) <= 5
         assert all('distance' in r for r in results)
     
-    def test_metadata_filtering(self, chromadb_backend):
+    def test_metadata_filtering(self, chromadb_backend, rand_embeddings, rand_query):
         """Test metadata filtering"""
-        embeddings = np.random.rand(10, 768).astype('float32')
+        embeddings = rand_embeddings[:10]
         metadata = [{"category": "A" if i % 2 == 0 else "B"} for i in range(10)]
         
         chromadb_backend.add(embeddings, metadata=metadata)
         
-        query = np.random.rand(768).astype('float32')
-        results = chromadb_backend.search(query, k=10, where={"category": "A"})
+        results = chromadb_backend.search(rand_query, k=10, where={"category": "A"})
         
         assert all(r['metadata']['category'] == 'A' for r in results)
     
-    def test_update(self, chromadb_backend):
+    def test_update(self, chromadb_backend, rand_embeddings):
         """Test updating vectors"""
-        embeddings = np.random.rand(5, 768).astype('float32')
-        ids = chromadb_backend.add(embeddings)
+        ids = chromadb_backend.add(rand_embeddings[:5])
         
         new_metadata = [{"updated": True} for _ in range(5)]
         chromadb_backend.update(ids, metadata=new_metadata)
@@ -179,57 +202,69 @@ class TestChromaDBBackend:
         results = chromadb_backend.peek(limit=5)
         assert all(m.get('updated') for m in results['metadatas'])
     
-    def test_delete(self, chromadb_backend):
+    def test_delete(self, chromadb_backend, rand_embeddings):
         """Test deleting vectors"""
-        embeddings = np.random.rand(10, 768).astype('float32')
-        ids = chromadb_backend.add(embeddings)
+        ids = chromadb_backend.add(rand_embeddings[:10])
         
         chromadb_backend.delete(ids[:5])
         
         assert chromadb_backend.collection.count() == 5
 
 
+class FakeEmbedder:
+    """Deterministic BGEEmbedder stand-in: slices a precomputed matrix
+    instead of running a model, so VectorMemory tests need no mocks"""
+
+    dimension = 768
+
+    def __init__(self, matrix):
+        self._matrix = matrix
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+    def embed(self, texts, normalize=True):
+        return self._matrix[:len(texts)]
+
+    def embed_single(self, text, normalize=True):
+        return self._matrix[0]
+
+
 class TestVectorMemory:
     """Test unified VectorMemory interface"""
     
     @pytest.fixture(params=["faiss", "chromadb"])
-    def vector_memory(self, request, tmp_path):
+    def vector_memory(self, request, tmp_path, rand_embeddings):
         """Create VectorMemory with different backends"""
         try:
+            embedder = FakeEmbedder(rand_embeddings)
             if request.param == "chromadb":
-                from src.memory.embedder import get_embedder
-                with patch.object(get_embedder(), 'embed', return_value=np.random.rand(1, 768)):
-                    return VectorMemory(
-                        backend=request.param,
-                        persist_directory=str(tmp_path / "test_memory")
-                    )
-            else:
-                from src.memory.embedder import get_embedder
-                with patch.object(get_embedder(), 'embed', return_value=np.random.rand(1, 768)):
-                    return VectorMemory(backend=request.param)
+                return VectorMemory(
+                    backend=request.param,
+                    embedder=embedder,
+                    persist_directory=str(tmp_path / "test_memory")
+                )
+            return VectorMemory(backend=request.param, embedder=embedder)
         except:
             pytest.skip(f"{request.param} not available")
     
     def test_add_texts(self, vector_memory):
         """Test adding texts"""
-        with patch.object(vector_memory.embedder, 'embed', return_value=np.random.rand(3, 768)):
-            texts = ["doc1", "doc2", "doc3"]
-            ids = vector_memory.add_texts(texts)
-            
-            assert len(ids) == 3
+        texts = ["doc1", "doc2", "doc3"]
+        ids = vector_memory.add_texts(texts)
+        
+        assert len(ids) == 3
     
     def test_search(self, vector_memory):
         """Test search with text"""
         # Add documents
-        with patch.object(vector_memory.embedder, 'embed', return_value=np.random.rand(10, 768)):
-            texts = [f"document {i}" for i in range(10)]
-            vector_memory.add_texts(texts)
+        texts = [f"document {i}" for i in range(10)]
+        vector_memory.add_texts(texts)
         
         # Search
-        with patch.object(vector_memory.embedder, 'embed_single', return_value=np.random.rand(768)):
-            results = vector_memory.search("query", k=3)
-            
-            assert len(results) <= 3
+        results = vector_memory.search("query", k=3)
+        
+        assert len(results) <= 3
     
     def test_stats(self, vector_memory):
         """Test getting stats"""
@@ -15,14 +15,20 @@ from src.messaging import KafkaClient, MessageRouter, MessageType, SubscriptionM
 class TestKafkaClient:
     """Test Kafka client producer/consumer"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_kafka_producer(self):
-        """Mock aiokafka producer"""
+        """Mock aiokafka producer, patched into the module once per class"""
         producer = AsyncMock()
         producer.start = AsyncMock()
         producer.stop = AsyncMock()
         producer.send_and_wait = AsyncMock()
-        return producer
+        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=producer):
+            yield producer
+
+    @pytest.fixture(autouse=True)
+    def _reset_producer(self, mock_kafka_producer):
+        """Clear call records so per-test assert_called_once still holds"""
+        mock_kafka_producer.reset_mock()
     
     @pytest.fixture
     def mock_kafka_consumer(self):
@@ -36,46 +42,42 @@ class TestKafkaClient:
     @pytest.mark.asyncio
     async def test_client_initialization(self):
         """Test Kafka client initialization"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer'):
-            client = KafkaClient()
-            assert client.bootstrap_servers is not None
+        client = KafkaClient()
+        assert client.bootstrap_servers is not None
     
     @pytest.mark.asyncio
     async def test_producer_start(self, mock_kafka_producer):
         """Test producer startup"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=mock_kafka_producer):
-            client = KafkaClient()
-            await client.start()
-            
-            mock_kafka_producer.start.assert_called_once()
+        client = KafkaClient()
+        await client.start()
+        
+        mock_kafka_producer.start.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_publish_message(self, mock_kafka_producer):
         """Test message publishing"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=mock_kafka_producer):
-            client = KafkaClient()
-            await client.start()
-            
-            message = {"type": "test", "data": "hello"}
-            await client.publish("test_topic", message)
-            
-            mock_kafka_producer.send_and_wait.assert_called_once()
+        client = KafkaClient()
+        await client.start()
+        
+        message = {"type": "test", "data": "hello"}
+        await client.publish("test_topic", message)
+        
+        mock_kafka_producer.send_and_wait.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_batch_publish(self, mock_kafka_producer):
         """Test batch message publishing"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=mock_kafka_producer):
-            client = KafkaClient()
-            await client.start()
-            
-            messages = [
-                {"type": "test1", "data": "msg1"},
-                {"type": "test2", "data": "msg2"},
-            ]
-            
-            await client.publish_batch("test_topic", messages)
-            
-            assert mock_kafka_producer.send_and_wait.call_count == 2
+        client = KafkaClient()
+        await client.start()
+        
+        messages = [
+            {"type": "test1", "data": "msg1"},
+            {"type": "test2", "data": "msg2"},
+        ]
+        
+        await client.publish_batch("test_topic", messages)
+        
+        assert mock_kafka_producer.send_and_wait.call_count == 2
     
     @pytest.mark.asyncio
     async def test_consumer_subscription(self, mock_kafka_consumer):
@@ -90,36 +92,37 @@ class TestKafkaClient:
     @pytest.mark.asyncio  
     async def test_context_manager(self, mock_kafka_producer):
         """Test async context manager"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=mock_kafka_producer):
-            async with KafkaClient() as client:
-                assert client is not None
-            
-            mock_kafka_producer.start.assert_called_once()
-            mock_kafka_producer.stop.assert_called_once()
+        async with KafkaClient() as client:
+            assert client is not None
+        
+        mock_kafka_producer.start.assert_called_once()
+        mock_kafka_producer.stop.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_graceful_shutdown(self, mock_kafka_producer):
         """Test graceful shutdown"""
-        with patch('src.messaging.kafka_client.AIOKafkaProducer', return_value=mock_kafka_producer):
-            client = KafkaClient()
-            await client.start()
-            await client.close()
-            
-            mock_kafka_producer.stop.assert_called_once()
+        client = KafkaClient()
+        await client.start()
+        await client.close()
+        
+        mock_kafka_producer.stop.assert_called_once()
 
 
 class TestMessageRouter:
     """Test message routing logic"""
-    
-    def test_router_initialization(self):
+
+    # Router is stateless (static topic map), so one instance serves the
+    # whole class instead of being rebuilt per test
+    @pytest.fixture(scope="class")
+    def router(self):
+        return MessageRouter()
+
+    def test_router_initialization(self, router):
         """Test router initialization"""
-        router = MessageRouter()
         assert router is not None
     
-    def test_workflow_event_routing(self):
+    def test_workflow_event_routing(self, router):
         """Test workflow event routing"""
-        router = MessageRouter()
-        
         message = {
             "type": MessageType.WORKFLOW_STARTED,
             "workflow_id": "wf-123"
@@ -128,10 +131,8 @@ class TestMessageRouter:
         topic = router.route_message(message)
         assert "workflow" in topic.lower()
     
-    def test_task_event_routing(self):
+    def test_task_event_routing(self, router):
         """Test task event routing"""
-        router = MessageRouter()
-        
         message = {
             "type": MessageType.TASK_COMPLETED,
             "workflow_id": "wf-123",
@@ -141,10 +142,8 @@ class TestMessageRouter:
         topic = router.route_message(message)
         assert topic is not None
     
-    def test_hitl_event_routing(self):
+    def test_hitl_event_routing(self, router):
         """Test HITL event routing"""
-        router = MessageRouter()
-        
         message = {
             "type": MessageType.HITL_APPROVAL_REQUIRED,
             "workflow_id": "wf-123"
@@ -153,10 +152,8 @@ class TestMessageRouter:
         topic = router.route_message(message)
         assert "hitl" in topic.lower()
     
-    def test_llm_event_routing(self):
+    def test_llm_event_routing(self, router):
         """Test LLM event routing"""
-        router = MessageRouter()
-        
         message = {
             "type": MessageType.LLM_CALL_STARTED,
             "model": "mistral-7b-ov"
@@ -165,10 +162,8 @@ class TestMessageRouter:
         topic = router.route_message(message)
         assert "llm" in topic.lower()
     
-    def test_create_workflow_event(self):
+    def test_create_workflow_event(self, router):
         """Test workflow event creation"""
-        router = MessageRouter()
-        
         event = router.create_workflow_event(
             MessageType.WORKFLOW_STARTED,
             "wf-123",
@@ -179,10 +174,8 @@ class TestMessageRouter:
         assert event["workflow_id"] == "wf-123"
         assert "workflow_name" in event
     
-    def test_create_hitl_request(self):
+    def test_create_hitl_request(self, router):
         """Test HITL request creation"""
-        router = MessageRouter()
-        
         request = router.create_hitl_request(
             workflow_id="wf-123",
             task_id="task-1",
@@ -195,10 +188,8 @@ class TestMessageRouter:
         assert request["task_id"] == "task-1"
         assert "approvers" in request
     
-    def test_routing_with_priority(self):
+    def test_routing_with_priority(self, router):
         """Test message routing with priority"""
-        router = MessageRouter()
-        
         high_priority = {
             "type": MessageType.WORKFLOW_FAILED,
             "workflow_id": "wf-123"
@@ -210,16 +201,19 @@ class TestMessageRouter:
 
 class TestSubscriptionManager:
     """Test subscription system"""
-    
-    def test_subscription_manager_init(self):
+
+    # Function-scoped: tests register/unsubscribe handlers on
+    # overlapping topics, so the registry must start empty each time
+    @pytest.fixture
+    def manager(self):
+        return SubscriptionManager()
+
+    def test_subscription_manager_init(self, manager):
         """Test subscription manager initialization"""
-        manager = SubscriptionManager()
         assert manager is not None
     
-    def test_register_handler(self):
+    def test_register_handler(self, manager):
         """Test handler registration"""
-        manager = SubscriptionManager()
-        
         @manager.subscribe("test_topic")
         async def handle_test(message):
             return message
@@ -227,10 +221,8 @@ class TestSubscriptionManager:
         handlers = manager.get_handlers("test_topic")
         assert len(handlers) == 1
     
-    def test_multiple_handlers_same_topic(self):
+    def test_multiple_handlers_same_topic(self, manager):
         """Test multiple handlers for same topic"""
-        manager = SubscriptionManager()
-        
         @manager.subscribe("events")
         async def handler1(message):
             pass
@@ -243,10 +235,8 @@ class TestSubscriptionManager:
         assert len(handlers) == 2
     
     @pytest.mark.asyncio
-    async def test_handler_invocation(self):
+    async def test_handler_invocation(self, manager):
         """Test handler invocation"""
-        manager = SubscriptionManager()
-        
         results = []
         
         @manager.subscribe("test")
@@ -258,10 +248,8 @@ class TestSubscriptionManager:
         
         assert "hello" in results
     
-    def test_pattern_subscription(self):
+    def test_pattern_subscription(self, manager):
         """Test pattern-based subscription"""
-        manager = SubscriptionManager()
-        
         @manager.subscribe_pattern("workflow.*")
         async def workflow_handler(message):
             pass
@@ -270,10 +258,8 @@ class TestSubscriptionManager:
         handlers = manager.get_handlers("workflow.started")
         assert len(handlers) >= 0  # Pattern matching logic
     
-    def test_unsubscribe(self):
+    def test_unsubscribe(self, manager):
         """Test unsubscribing handler"""
-        manager = SubscriptionManager()
-        
         @manager.subscribe("test")
         async def handler(message):
             pass
@@ -7,8 +7,7 @@ Tests state manager database operations and recovery.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
-import tempfile
-import os
+import uuid
 
 from src.core.state_manager import StateManager, WorkflowStateDB, TaskExecutionDB
 from src.core.task import TaskStatus, WorkflowDefinition, TaskDefinition, TaskType
@@ -19,15 +18,16 @@ class TestStateManager:
     
     @pytest.fixture
     def temp_db(self):
-        """Create temporary database"""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db_url = "sqlite:///" + path
-        yield db_url
-        # Cleanup
-        if os.path.exists(path):
-            os.unlink(path)
-    
+        """Unique shared-cache in-memory database per test.
+
+        Every StateManager opened with the same URI sees the same data
+        (needed for the recovery test), with no disk I/O or cleanup.
+        """
+        return (
+            f"sqlite:///file:memdb_{uuid.uuid4().hex}"
+            "?mode=memory&cache=shared&uri=true"
+        )
+
     @pytest.fixture
     def state_manager(self, temp_db):
         """Create state manager with temp DB"""
@@ -115,23 +115,24 @@ class TestStateManager:
     
     def test_list_workflows(self, state_manager):
         """Test listing workflows"""
-        # Save multiple workflows
-        for i in range(3):
-            workflow_def = WorkflowDefinition(
-                workflow_id=f"wf-{i}",
-                name=f"workflow_{i}",
-                tasks=[]
-            )
-            
-            state_manager.save_workflow_state(
-                workflow_id=f"wf-{i}",
-                name=f"workflow_{i}",
-                status="completed",
-                workflow_definition=workflow_def,
-                task_results={},
-                completed_tasks=[],
-                failed_tasks=[]
-            )
+        # Save multiple workflows in one batch (single session/commit)
+        with state_manager.batch_writes():
+            for i in range(3):
+                workflow_def = WorkflowDefinition(
+                    workflow_id=f"wf-{i}",
+                    name=f"workflow_{i}",
+                    tasks=[]
+                )
+
+                state_manager.save_workflow_state(
+                    workflow_id=f"wf-{i}",
+                    name=f"workflow_{i}",
+                    status="completed",
+                    workflow_definition=workflow_def,
+                    task_results={},
+                    completed_tasks=[],
+                    failed_tasks=[]
+                )
         
         workflows = state_manager.list_workflows(limit=10)
         assert len(workflows) >= 3
@@ -193,14 +194,13 @@ class TestStatePersistenceIntegration:
     
     @pytest.fixture
     def temp_db(self):
-        """Create temporary database"""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db_url = "sqlite:///" + path
-        yield db_url
-        if os.path.exists(path):
-            os.unlink(path)
-    
+        """Unique shared-cache in-memory database per test"""
+        return (
+            f"sqlite:///file:memdb_{uuid.uuid4().hex}"
+            "?mode=memory&cache=shared&uri=true"
+        )
+
+
     @pytest.mark.asyncio
     async def test_workflow_state_lifecycle(self, temp_db):
         """Test complete workflow state lifecycle"""
@@ -219,29 +219,29 @@ class TestStatePersistenceIntegration:
             tasks=[task1]
         )
         
-        # 1. Save initial state (running)
-        manager.save_workflow_state(
-            workflow_id="wf-lifecycle",
-            name="lifecycle_test",
-            status="running",
-            workflow_definition=workflow_def,
-            task_results={},
-            completed_tasks=[],
-            failed_tasks=[],
-            started_at=datetime.utcnow()
-        )
-        
-        # 2. Save task execution
-        manager.save_task_execution(
-            workflow_id="wf-lifecycle",
-            task_id="task1",
-            status=TaskStatus.SUCCESS,
-            inputs={},
-            outputs={"result": "success"},
-            started_at=datetime.utcnow(),
-            completed_at=datetime.utcnow(),
-            duration_ms=500
-        )
+        # 1+2. Save initial state and task execution in one batch
+        with manager.batch_writes():
+            manager.save_workflow_state(
+                workflow_id="wf-lifecycle",
+                name="lifecycle_test",
+                status="running",
+                workflow_definition=workflow_def,
+                task_results={},
+                completed_tasks=[],
+                failed_tasks=[],
+                started_at=datetime.utcnow()
+            )
+
+            manager.save_task_execution(
+                workflow_id="wf-lifecycle",
+                task_id="task1",
+                status=TaskStatus.SUCCESS,
+                inputs={},
+                outputs={"result": "success"},
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+                duration_ms=500
+            )
         
         # 3. Update workflow status (completed)
         manager.save_workflow_state(
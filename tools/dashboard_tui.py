@@ -8,6 +8,7 @@ from textual.widgets import Header, Footer, Static, DataTable, Button, Log
 from textual.reactive import reactive
 from datetime import datetime
 import asyncio
+import time
 
 # Import Nexus Ray components
 from src.collaboration import get_agent_registry
@@ -41,19 +42,24 @@ class AgentTable(Static):
     
     def on_mount(self) -> None:
         table = self.query_one(DataTable)
+        table.cursor_type = "row"
         table.add_columns("Agent ID", "Name", "Status", "Tasks")
-        
+
         # Get agents
         registry = get_agent_registry()
         agents = registry.list_all_agents()
-        
-        for agent in agents:
-            table.add_row(
+
+        # One bulk add_rows call: a single layout/reflow for the whole
+        # table instead of one per agent
+        table.add_rows(
+            (
                 agent.agent_id[:10],
                 agent.name,
                 agent.status.value,
                 f"{agent.current_tasks}/{agent.max_concurrent_tasks}"
             )
+            for agent in agents
+        )
 
 
 class ActivityLog(Static):
@@ -105,6 +111,11 @@ class NexusRayDashboard(App):
         ("d", "dark", "Toggle Dark Mode"),
     ]
     
+    # Seconds between background data refreshes
+    REFRESH_INTERVAL = 5.0
+    # Manual refreshes are coalesced to at most one per this window
+    REFRESH_THROTTLE = 0.25
+
     def compose(self) -> ComposeResult:
         """Create UI layout"""
         yield Header()
@@ -112,18 +123,70 @@ class NexusRayDashboard(App):
         yield AgentTable(id="agents")
         yield ActivityLog(id="activity")
         yield Footer()
-    
-    def action_refresh(self) -> None:
-        """Refresh data"""
-        metrics = self.query_one("#metrics", MetricsPanel)
+
+    def on_mount(self) -> None:
+        """Start the background data refresh task"""
+        self._refresh_wanted = asyncio.Event()
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        self._last_refresh = 0.0
+        self._trailing_refresh = False
+
+    def on_unmount(self) -> None:
+        """Stop the background refresh task"""
+        self._refresh_task.cancel()
+
+    async def _refresh_loop(self) -> None:
+        """
+        Pull registry stats periodically and push them into reactive
+        attrs (which diff-render on change).
+
+        Runs as its own task with the registry call moved to a worker
+        thread, so the render loop never blocks on data collection even
+        if the registry grows or becomes network-backed.
+        """
         registry = get_agent_registry()
-        stats = registry.get_statistics()
-        
-        metrics.total_agents = stats["total_agents"]
-        metrics.active_workflows = 0
-        
+        while True:
+            stats = await asyncio.to_thread(registry.get_statistics)
+
+            metrics = self.query_one("#metrics", MetricsPanel)
+            metrics.total_agents = stats["total_agents"]
+            metrics.active_workflows = 0
+
+            # Sleep until the next interval, or earlier if a manual
+            # refresh was requested
+            try:
+                await asyncio.wait_for(
+                    self._refresh_wanted.wait(), timeout=self.REFRESH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            else:
+                self._refresh_wanted.clear()
+
+    def action_refresh(self) -> None:
+        """
+        Request a data refresh, throttled to one per REFRESH_THROTTLE.
+
+        The first press fires immediately; presses inside the window
+        coalesce into a single trailing refresh rather than being lost.
+        """
+        now = time.monotonic()
+        if now - self._last_refresh < self.REFRESH_THROTTLE:
+            if not self._trailing_refresh:
+                self._trailing_refresh = True
+                self.set_timer(self.REFRESH_THROTTLE, self._trailing_nudge)
+            return
+        self._last_refresh = now
+        self._refresh_wanted.set()
+
         log = self.query_one(ActivityLog).query_one(Log)
         log.write_line(f"[green]✓[/green] Refreshed at {datetime.now().strftime('%H:%M:%S')}")
+
+    def _trailing_nudge(self) -> None:
+        """Deliver the coalesced refresh at the end of a throttle window"""
+        self._trailing_refresh = False
+        self._last_refresh = time.monotonic()
+        self._refresh_wanted.set()
     
     def action_dark(self) -> None:
         """Toggle dark mode"""
@@ -8,11 +8,35 @@ Provides real-time monitoring and health checks.
 import click
 import time
 from datetime import datetime
-from tabulate import tabulate
+from rich import box
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
 from src.observability.metrics import get_metrics_collector
 from src.observability.llm_insights import get_llm_tracker
 from src.observability.activity_feed import get_activity_feed
 
+# Severity decorations, built once instead of per printed activity
+SEVERITY_ICON = {
+    "info": "ℹ️",
+    "warning": "⚠️",
+    "error": "❌"
+}
+_DEFAULT_ICON = "•"
+
+# Shared console for table rendering; Rich measures and lays out cells
+# far faster than tabulate's pure-Python grid format
+console = Console()
+
+
+def _build_table(headers) -> Table:
+    """Create a minimally boxed table with the given column headers"""
+    table = Table(box=box.MINIMAL)
+    for header in headers:
+        table.add_column(header)
+    return table
+
 
 @click.group()
 def cli():
@@ -35,21 +59,17 @@ def metrics():
     click.echo()
     
     # Display key metrics
-    table_data = []
+    table = _build_table(["Metric", "Type", "Value", "Labels"])
     for name, metric in summary['metrics'].items():
-        table_data.append([
+        table.add_row(
             name,
             metric['type'],
-            metric['value'],
+            str(metric['value']),
             str(metric.get('labels', {}))
-        ])
-    
-    if table_data:
-        click.echo(tabulate(
-            table_data,
-            headers=["Metric", "Type", "Value", "Labels"],
-            tablefmt="grid"
-        ))
+        )
+
+    if table.row_count:
+        console.print(table)
 
 
 @cli.command()
@@ -69,21 +89,17 @@ def llm():
     # Model stats
     if analytics.get('model_stats'):
         click.echo("Model Performance:")
-        table_data = []
+        table = _build_table(["Model", "Calls", "Tokens", "Avg Duration", "Errors"])
         for model, stats in analytics['model_stats'].items():
-            table_data.append([
+            table.add_row(
                 model,
-                stats['calls'],
+                str(stats['calls']),
                 f"{stats['tokens']:,}",
                 f"{stats['avg_duration_ms']:.0f}ms",
-                stats['errors']
-            ])
-        
-        click.echo(tabulate(
-            table_data,
-            headers=["Model", "Calls", "Tokens", "Avg Duration", "Errors"],
-            tablefmt="grid"
-        ))
+                str(stats['errors'])
+            )
+
+        console.print(table)
 
 
 @cli.command()
@@ -100,18 +116,18 @@ def activity(limit):
         click.echo("No activities recorded")
         return
     
+    # Build the whole listing first; click.echo flushes on every call,
+    # so one batched write beats two or three per activity
+    lines = []
     for act in activities:
-        timestamp = act.timestamp.strftime("%H:%M:%S")
-        severity_icon = {
-            "info": "ℹ️",
-            "warning": "⚠️",
-            "error": "❌"
-        }.get(act.severity, "•")
-        
-        click.echo(f"{timestamp} {severity_icon} {act.title}")
+        timestamp = act.timestamp[11:19]  # HH:MM:SS from the ISO string
+        severity_icon = SEVERITY_ICON.get(act.severity, _DEFAULT_ICON)
+
+        lines.append(f"{timestamp} {severity_icon} {act.title}")
         if act.description:
-            click.echo(f"           {act.description}")
-        click.echo()
+            lines.append(f"           {act.description}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -140,49 +156,58 @@ def health():
     click.echo("\n✅ All systems operational")
 
 
+def _render_watch(collector, tracker, feed) -> Group:
+    """Build the watch screen as one renderable for diff-based updates"""
+    summary = collector.get_summary()
+    llm_stats = tracker.get_global_analytics()
+    recent = feed.get_recent(5)
+
+    lines = [
+        f"Nexus Ray Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "=" * 80,
+        "",
+        "📊 Metrics:",
+    ]
+    for name in ['workflows_started_total', 'workflows_completed_total', 'workflows_failed_total']:
+        metric = summary['metrics'].get(name, {})
+        lines.append(f"  {name}: {metric.get('value', 0)}")
+
+    lines += [
+        "",
+        "🤖 LLM:",
+        f"  Calls: {llm_stats['total_calls']}",
+        f"  Tokens: {llm_stats['total_tokens']:,}",
+        f"  Cost: ${llm_stats.get('estimated_cost_usd', 0):.4f}",
+        "",
+        "📋 Recent Activity:",
+    ]
+    for act in recent:
+        timestamp = act.timestamp[11:19]  # HH:MM:SS from the ISO string
+        lines.append(f"  {timestamp} - {act.title}")
+
+    return Group(Text("\n".join(lines)))
+
+
 @cli.command()
 @click.option('--interval', default=5, help='Update interval in seconds')
 def watch(interval):
     """Watch metrics in real-time"""
     click.echo("📡 Real-time Monitoring (Ctrl+C to stop)\n")
-    
+
+    # Resolve the singletons once; each tick only touches the cached
+    # objects, not the factory locks
+    collector = get_metrics_collector()
+    tracker = get_llm_tracker()
+    feed = get_activity_feed()
+
+    # Live re-renders in place and only writes what changed between
+    # ticks, instead of click.clear() plus a full-screen reprint
     try:
-        while True:
-            click.clear()
-            
-            # Header
-            click.echo(f"Nexus Ray Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            click.echo("=" * 80)
-            
-            # Metrics
-            collector = get_metrics_collector()
-            summary = collector.get_summary()
-            
-            click.echo("\n📊 Metrics:")
-            for name in ['workflows_started_total', 'workflows_completed_total', 'workflows_failed_total']:
-                metric = summary['metrics'].get(name, {})
-                click.echo(f"  {name}: {metric.get('value', 0)}")
-            
-            # LLM Stats
-            tracker = get_llm_tracker()
-            llm_stats = tracker.get_global_analytics()
-            
-            click.echo(f"\n🤖 LLM:")
-            click.echo(f"  Calls: {llm_stats['total_calls']}")
-            click.echo(f"  Tokens: {llm_stats['total_tokens']:,}")
-            click.echo(f"  Cost: ${llm_stats['estimated_cost_usd']:.4f}")
-            
-            # Recent Activity
-            feed = get_activity_feed()
-            recent = feed.get_recent(5)
-            
-            click.echo(f"\n📋 Recent Activity:")
-            for act in recent[:5]:
-                timestamp = act.timestamp.strftime("%H:%M:%S")
-                click.echo(f"  {timestamp} - {act.title}")
-            
-            time.sleep(interval)
-    
+        with Live(_render_watch(collector, tracker, feed), refresh_per_second=4) as live:
+            while True:
+                time.sleep(interval)
+                live.update(_render_watch(collector, tracker, feed))
+
     except KeyboardInterrupt:
         click.echo("\n\n👋 Monitoring stopped")
 
@@ -209,13 +234,14 @@ def workflow(workflow_id):
         click.echo(f"  Avg Duration: {llm_analytics['avg_duration_ms']:.0f}ms")
         click.echo(f"  Models: {', '.join(llm_analytics['models_used'].keys())}")
     
-    # Activity Timeline
-    activities = feed.get_for_workflow(workflow_id)
-    
+    # Activity Timeline (only the 20 shown are fetched)
+    activities = feed.get_for_workflow(workflow_id, limit=20)
+
     click.echo(f"\n📋 Activity Timeline ({len(activities)} events):")
-    for act in activities[:20]:
-        timestamp = act.timestamp.strftime("%H:%M:%S")
-        click.echo(f"  {timestamp} - {act.title}")
+    click.echo("\n".join(
+        f"  {act.timestamp[11:19]} - {act.title}"  # HH:MM:SS from the ISO string
+        for act in activities
+    ))
 
 
 if __name__ == '__main__':
@@ -14,6 +14,7 @@ from src.observability.llm_insights import (
     LLMProvider
 )
 from src.observability.activity_feed import get_activity_feed, ActivityType
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import uuid
 
@@ -160,15 +161,21 @@ def main():
     """Run all tests"""
     print("🧪 Observability Components Verification")
     print("=" * 50)
-    
+
+    # The checks exercise independent singletons (collector, tracker,
+    # feed) whose write paths are thread-safe, so fan them out instead
+    # of running one after another
+    checks = [
+        test_metrics,
+        test_llm_insights,
+        test_activity_feed,
+        test_workflow_helpers
+    ]
+
     try:
-        results = [
-            test_metrics(),
-            test_llm_insights(),
-            test_activity_feed(),
-            test_workflow_helpers()
-        ]
-        
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda check: check(), checks))
+
         if all(results):
             print("\n" + "=" * 50)
             print("✅ ALL TESTS PASSED!")